@@ -4,17 +4,24 @@ Verwendet moderne LangChain (v0.3+) und OpenRouter für realistische AI-Personas
 
 Moderne Features:
 - init_chat_model für Model-Provider-agnostische Initialisierung  
-- Strukturierte Message-Types (HumanMessage, AIMessage, SystemMessage)
 - ChatPromptTemplate für robuste Prompt-Gestaltung
 - Automatische Fallbacks für Kompatibilität
+
+LangChain wird erst beim Bau der ersten Persona geladen - `--help`,
+Prüfungen und `--dry-run` starten so ohne die LangChain-Importkosten.
 """
 
 import os
+import time
 from dotenv import load_dotenv
 
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import StrOutputParser
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
+from llm_clients import get_client_pool, get_llm_provider, OPENROUTER_BASE_URL
+from memory import ConversationMemory
+from metrics import CallTimer, CACHE_OFF, CACHE_MISS, CACHE_HIT, CACHE_SEMANTIC
+from persona_registry import get_persona_registry
+from rate_limiter import (call_with_retry, acall_with_retry, RetryPolicy,
+                          is_rate_limit_error, get_retry_after)
+from tracing import get_trace_config, trace_span
 
 # Lade Umgebungsvariablen aus .env Datei
 load_dotenv()
@@ -26,7 +33,8 @@ class PersonaAgent:
     Jede Persona hat einen Namen, Alter, Eigenschaften und kann auf Fragen antworten
     """
     
-    def __init__(self, name, age, characteristics, background, detailed_personality=""):
+    def __init__(self, name, age, characteristics, background, detailed_personality="",
+                 response_cache=None, api_key=None, client_pool=None, provider=None, model_name=None):
         """
         Erstellt eine neue AI-Persona
         
@@ -36,6 +44,11 @@ class PersonaAgent:
             characteristics: Kurze Beschreibung (z.B. "umweltbewusst, sportlich")
             background: Detaillierter Hintergrund der Person
             detailed_personality: Zusätzliche Persönlichkeitsdetails
+            response_cache: Optionaler ResponseCache für wiederholte Anfragen
+            api_key: OpenRouter API-Schlüssel (Standard: OPENROUTER_API_KEY aus der .env)
+            client_pool: ClientPool für die HTTP-Verbindungen (Standard: prozessweiter Pool)
+            provider: "openrouter" oder "fake" (Standard: LLM_PROVIDER aus der .env)
+            model_name: Modell für diese Persona (Standard: DEFAULT_MODEL aus der .env)
         """
         # Grundlegende Persona-Informationen speichern
         self.name = name
@@ -43,7 +56,19 @@ class PersonaAgent:
         self.characteristics = characteristics
         self.background = background
         self.detailed_personality = detailed_personality
-        self.conversation_history = []
+        self.memory = ConversationMemory()
+        self.response_cache = response_cache
+        
+        # Zugangsdaten explizit pro Persona - mehrere Sessions teilen sich so
+        # keine Prozess-Umgebungsvariable
+        self.api_key = api_key or os.getenv('OPENROUTER_API_KEY')
+        self.client_pool = client_pool or get_client_pool()
+        self.provider = provider or get_llm_provider()
+        
+        # Modell-Konfiguration merken (Teil des Cache-Schlüssels)
+        self.model_name = model_name or get_ai_model_name()
+        self.temperature = get_creativity_level()
+        self.max_tokens = get_max_response_length()
         
         # AI-Sprachmodell einrichten (das "Gehirn" der Persona)
         self.llm = self._setup_ai_model()
@@ -51,52 +76,38 @@ class PersonaAgent:
         # Prompt-Vorlage erstellen (wie die Persona antworten soll)
         self.prompt = self._create_conversation_template()
         
-        # Alles zusammenfügen zu einer "Kette" für Antworten
-        self.chain = self.prompt | self.llm | StrOutputParser()
+        # Alles zusammenfügen zu einer "Kette" für Antworten - ohne StrOutputParser,
+        # damit die Token-Zählung (usage_metadata) des Modells erhalten bleibt
+        self.chain = self.prompt | self.llm
+        
+        # Messung der Aufrufe (MetricsCollector des laufenden Interviews, sonst aus)
+        self.metrics = None
     
     def _setup_ai_model(self):
         """
         Richtet das AI-Sprachmodell ein
-        Verwendet OpenRouter für kostenlosen Zugang zu verschiedenen AI-Modellen
+        Verwendet OpenRouter für kostenlosen Zugang zu verschiedenen AI-Modellen.
+        Das Modell (und seine HTTP-Verbindungen) kommt aus dem gemeinsamen
+        Client-Pool und wird mit allen Personas gleicher Konfiguration geteilt.
         """
-        # Verwende moderne LangChain init_chat_model Funktion
-        try:
-            from langchain.chat_models import init_chat_model
-            
-            return init_chat_model(
-                model=get_ai_model_name(),
-                model_provider="openai",
-                api_key=os.getenv('OPENROUTER_API_KEY'),
-                base_url="https://openrouter.ai/api/v1",
-                temperature=get_creativity_level(),
-                max_tokens=get_max_response_length(),
-                default_headers={
-                    "HTTP-Referer": os.getenv('YOUR_SITE_URL', 'https://localhost:3000'),
-                    "X-Title": os.getenv('YOUR_SITE_NAME', 'Synthetic Interview PoC'),
-                }
-            )
-        except ImportError:
-            # Fallback für ältere LangChain Versionen
-            from langchain_openai import ChatOpenAI
-            return ChatOpenAI(
-                model=get_ai_model_name(),
-                temperature=get_creativity_level(),
-                max_tokens=get_max_response_length(),
-                openai_api_key=os.getenv('OPENROUTER_API_KEY'),
-                openai_api_base="https://openrouter.ai/api/v1",
-                default_headers={
-                    "HTTP-Referer": os.getenv('YOUR_SITE_URL', 'https://localhost:3000'),
-                    "X-Title": os.getenv('YOUR_SITE_NAME', 'Synthetic Interview PoC'),
-                }
-            )
+        return self.client_pool.get_chat_model(
+            model=self.model_name,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            api_key=self.api_key,
+            base_url=OPENROUTER_BASE_URL,
+            provider=self.provider
+        )
     
     def _create_conversation_template(self):
         """
         Erstellt die Vorlage dafür, wie die Persona antworten soll
         Das ist wie eine "Anleitung" für die AI
         """
+        from langchain_core.prompts import ChatPromptTemplate
+
         # Erstelle die Persönlichkeits-Anweisungen
-        personality_instructions = create_personality_prompt(
+        self.personality_instructions = create_personality_prompt(
             self.name, 
             self.age, 
             self.characteristics, 
@@ -105,38 +116,212 @@ class PersonaAgent:
         )
         
         return ChatPromptTemplate.from_messages([
-            ("system", personality_instructions),
+            ("system", self.personality_instructions),
             ("human", "{input}")
         ])
     
-    def respond(self, question, previous_responses=None):
+    def respond(self, question, previous_responses=None, use_history=True):
         """
         Lässt die Persona auf eine Frage antworten
         
         Args:
             question: Die Frage als Text
             previous_responses: NICHT VERWENDET - Personas sind unabhängig
+            use_history: False für zustandslose Antworten ohne eigenen Verlauf
             
         Returns:
             Die Antwort der Persona als Text
         """
+        timer = CallTimer()
+        cache_status = CACHE_OFF
+        context = ""
         try:
             # Erstelle strukturierten Kontext (ohne andere Personas)
-            context = self._build_context(question)
+            context = self._build_context(question, use_history)
+            
+            # Bereits gestellte identische Anfrage? Dann Antwort aus dem Cache
+            cached_response, cache_status = self._get_cached_response(question, context)
+            if cached_response is not None:
+                self._save_turn(question, cached_response)
+                self._record_call(timer, question, cache_status)
+                return cached_response
             
-            # Lass die AI antworten - verwende moderne invoke Methode
-            response = self.chain.invoke({"input": context})
+            # Lass die AI antworten - gedrosselt über den gemeinsamen Rate-Limiter,
+            # vorübergehende Fehler (429, 5xx) werden mit Backoff wiederholt
+            response = call_with_retry(lambda: self._ask_model(context, timer),
+                                       self.client_pool.rate_limiter, on_retry=timer.count_retry)
+            self._store_cached_response(question, context, response)
             
             # Speichere die Unterhaltung für späteren Kontext
             self._save_turn(question, response)
+            self._record_call(timer, question, cache_status, context, response)
+            
+            return response
+            
+        except Exception as error:
+            error_message = self._handle_error(error)
+            self._save_turn(question, error_message, error=True)
+            self._record_call(timer, question, cache_status, context, error=True)
+            return error_message
+    
+    async def arespond(self, question, previous_responses=None, use_history=True):
+        """
+        Asynchrone Variante von respond() für den asyncio-Interview-Motor
+        
+        Args:
+            question: Die Frage als Text
+            previous_responses: NICHT VERWENDET - Personas sind unabhängig
+            use_history: False für zustandslose Antworten ohne eigenen Verlauf
+            
+        Returns:
+            Die Antwort der Persona als Text
+        """
+        timer = CallTimer()
+        cache_status = CACHE_OFF
+        context = ""
+        try:
+            context = self._build_context(question, use_history)
+            
+            cached_response, cache_status = self._get_cached_response(question, context)
+            if cached_response is not None:
+                self._save_turn(question, cached_response)
+                self._record_call(timer, question, cache_status)
+                return cached_response
+            
+            response = await acall_with_retry(lambda: self._aask_model(context, timer),
+                                              self.client_pool.rate_limiter, on_retry=timer.count_retry)
+            self._store_cached_response(question, context, response)
+            
+            self._save_turn(question, response)
+            self._record_call(timer, question, cache_status, context, response)
             
             return response
             
         except Exception as error:
             error_message = self._handle_error(error)
-            self._save_turn(question, error_message)
+            self._save_turn(question, error_message, error=True)
+            self._record_call(timer, question, cache_status, context, error=True)
             return error_message
     
+    def stream_respond(self, question, use_history=True):
+        """
+        Lässt die Persona antworten und liefert die Antwort Token für Token
+        
+        Der Verlauf wird erst gespeichert, wenn die Antwort vollständig ist.
+        
+        Args:
+            question: Die Frage als Text
+            use_history: False für zustandslose Antworten ohne eigenen Verlauf
+            
+        Yields:
+            Textstücke der Antwort, sobald das Modell sie liefert
+        """
+        timer = CallTimer()
+        cache_status = CACHE_OFF
+        context = ""
+        chunks = []
+        try:
+            context = self._build_context(question, use_history)
+            
+            cached_response, cache_status = self._get_cached_response(question, context)
+            if cached_response is not None:
+                self._save_turn(question, cached_response)
+                self._record_call(timer, question, cache_status)
+                yield cached_response
+                return
+            
+            for chunk in self._stream_with_retry(context, timer):
+                chunks.append(chunk)
+                yield chunk
+            
+            response = "".join(chunks)
+            self._store_cached_response(question, context, response)
+            self._save_turn(question, response)
+            self._record_call(timer, question, cache_status, context, response)
+            
+        except Exception as error:
+            error_message = self._handle_error(error)
+            self._save_turn(question, error_message, error=True)
+            self._record_call(timer, question, cache_status, context, error=True)
+            # Bereits gestreamten Teil durch die Fehlermeldung ergänzen
+            yield ("\n" if chunks else "") + error_message
+    
+    def _ask_model(self, context, timer):
+        """
+        Fragt das Modell und sammelt die Antwort ein
+        
+        Intern wird gestreamt, damit die Zeit bis zum ersten Token messbar ist;
+        die Token-Zählung (usage_metadata) kommt mit dem letzten Stück.
+        """
+        parts = []
+        for chunk in self.chain.stream({"input": context}, config=get_trace_config()):
+            self._take_chunk(chunk, timer)
+            parts.append(chunk.content)
+        return "".join(parts)
+    
+    async def _aask_model(self, context, timer):
+        """Async-Variante von _ask_model()"""
+        parts = []
+        async for chunk in self.chain.astream({"input": context}, config=get_trace_config()):
+            self._take_chunk(chunk, timer)
+            parts.append(chunk.content)
+        return "".join(parts)
+    
+    @staticmethod
+    def _take_chunk(chunk, timer):
+        """Übernimmt Messwerte eines Stream-Stücks (erstes Token, Token-Zählung)"""
+        if chunk.content:
+            timer.mark_first_token()
+        timer.add_usage(getattr(chunk, "usage_metadata", None))
+    
+    def _stream_with_retry(self, context, timer):
+        """
+        Streamt die Antwort gedrosselt über den Rate-Limiter
+        
+        Ein Fehler wird nur wiederholt, solange noch kein Token ausgeliefert
+        wurde - sonst würde die Antwort doppelt erscheinen.
+        """
+        rate_limiter = self.client_pool.rate_limiter
+        retry_policy = RetryPolicy()
+        attempt = 0
+        while True:
+            with trace_span("rate_limit_wait", "ratelimit"):
+                rate_limiter.acquire()
+            streamed_any = False
+            try:
+                for chunk in self.chain.stream({"input": context}, config=get_trace_config()):
+                    self._take_chunk(chunk, timer)
+                    if chunk.content:
+                        streamed_any = True
+                        yield chunk.content
+            except Exception as error:
+                rate_limiter.release(success=False, rate_limited=is_rate_limit_error(error),
+                                     retry_after=get_retry_after(error))
+                if streamed_any or not retry_policy.should_retry(error, attempt):
+                    raise
+                timer.count_retry()
+                with trace_span("retry_backoff", "ratelimit", attempt=attempt + 1, error=type(error).__name__):
+                    time.sleep(retry_policy.get_delay(error, attempt))
+                attempt += 1
+                continue
+            except BaseException:
+                rate_limiter.release(success=False)
+                raise
+            rate_limiter.release(success=True)
+            return
+    
+    def _record_call(self, timer, question, cache_status, context="", response="", error=False):
+        """Meldet den gemessenen Aufruf an den MetricsCollector des Laufs (falls gesetzt)"""
+        if self.metrics is not None:
+            self.metrics.record(timer.finish(self.name, question, cache_status, error,
+                                             prompt_text=f"{self.personality_instructions}\n{context}",
+                                             response=response))
+    
+    @property
+    def conversation_history(self):
+        """Die behaltenen Gesprächs-Turns (siehe ConversationMemory)"""
+        return self.memory.to_list()
+    
     def get_agent_info(self):
         """
         Gibt alle wichtigen Informationen über diese Persona zurück
@@ -154,26 +339,72 @@ class PersonaAgent:
         Löscht das Gedächtnis der Persona
         Nützlich um ein neues Interview zu starten
         """
-        self.conversation_history.clear()
+        self.memory.clear()
     
-    def _build_context(self, question):
-        """Erstellt einfachen Kontext für die AI - nur eigene Geschichte"""
-        context = f"Interview-Frage: {question}"
+    def restore_turn(self, question, response):
+        """
+        Stellt einen gespeicherten Gesprächs-Turn wieder her, ohne das Modell zu fragen
+        Nützlich um einen abgebrochenen Lauf fortzusetzen (--resume)
         
-        # Nur die eigene Gesprächshistorie verwenden - keine anderen Personas
-        if self.conversation_history:
-            context += f"\n\nDein bisheriger Verlauf:\n"
-            for item in self.conversation_history[-2:]:  # Nur die letzten 2
-                context += f"F: {item['question']}\nA: {item['response']}\n"
+        Args:
+            question: Die damals gestellte Frage
+            response: Die damals gespeicherte Antwort
+        """
+        self._save_turn(question, response)
+    
+    def _build_context(self, question, use_history=True):
+        """Erstellt den Kontext für die AI - nur eigene Geschichte, begrenzt durch das Gedächtnis"""
+        return self.memory.build_context(question, use_history)
+    
+    def _cache_model(self):
+        """Modellname für Cache-Schlüssel"""
+        # Offline-Antworten dürfen nie als echte OpenRouter-Antworten zurückkommen
+        return self.model_name if self.provider == "openrouter" else f"{self.provider}:{self.model_name}"
+    
+    def _cache_key(self, context):
+        """Cache-Schlüssel aus Modell-Konfiguration, System-Prompt und Kontext"""
+        return self.response_cache.make_key(
+            self._cache_model(), self.temperature, self.max_tokens,
+            self.personality_instructions, context
+        )
+    
+    def _cache_scope(self):
+        """Bereich im Fragen-Index des Caches: diese Persona mit dieser Modell-Konfiguration"""
+        return self.response_cache.make_scope(
+            self._cache_model(), self.temperature, self.max_tokens, self.personality_instructions
+        )
+    
+    def _get_cached_response(self, question, context):
+        """
+        Gibt eine zwischengespeicherte Antwort zurück
         
-        return context
+        Erst exakt nach Kontext, dann - falls im Cache eingeschaltet - die
+        Antwort dieser Persona auf eine ähnlich formulierte frühere Frage.
+        
+        Returns:
+            (Antwort oder None, Cache-Status für die Messung)
+        """
+        if self.response_cache is None:
+            return None, CACHE_OFF
+        with trace_span("cache_lookup", "cache", persona=self.name):
+            response = self.response_cache.get(self._cache_key(context))
+            if response is not None:
+                return response, CACHE_HIT
+            match = self.response_cache.get_similar(self._cache_scope(), question)
+            if match is not None:
+                return match[0], CACHE_SEMANTIC
+            return None, CACHE_MISS
     
-    def _save_turn(self, question, response):
-        """Speichert Gesprächs-Turn"""
-        self.conversation_history.append({
-            "question": question,
-            "response": response
-        })
+    def _store_cached_response(self, question, context, response):
+        """Speichert eine erfolgreiche Antwort im Cache (Fehler werden nie gespeichert)"""
+        if self.response_cache is not None:
+            with trace_span("cache_store", "cache", persona=self.name):
+                self.response_cache.set(self._cache_key(context), response)
+                self.response_cache.add_question(self._cache_scope(), question, response)
+    
+    def _save_turn(self, question, response, error=False):
+        """Speichert Gesprächs-Turn (Fehler werden markiert und nicht als Kontext genutzt)"""
+        self.memory.add_turn(question, response, error)
     
     def _handle_error(self, error):
         """Behandelt Fehler mit klaren Nachrichten"""
@@ -215,6 +446,15 @@ def get_max_response_length():
     return int(os.getenv('MAX_TOKENS', 150))
 
 
+def get_max_concurrency():
+    """
+    Gibt zurück, wie viele Personas gleichzeitig befragt werden dürfen
+    Standard ist 1 (nacheinander) - höhere Werte beschleunigen Interviews,
+    belasten aber das Rate-Limit des Anbieters stärker
+    """
+    return max(1, int(os.getenv('MAX_CONCURRENCY', 1)))
+
+
 def create_personality_prompt(name, age, characteristics, background, detailed_personality):
     """
     Erstellt die Persönlichkeits-Anweisungen für eine Persona
@@ -249,60 +489,89 @@ WICHTIGE ANWEISUNGEN:
 # PERSONA CREATION (Persona-Erstellung)
 # =====================================
 
-def create_personas():
+def create_personas(response_cache=None, names=None, api_key=None, client_pool=None, provider=None,
+                    model_name=None):
     """
-    Erstellt die Standard-Personas für Lifestyle-Marken-Forschung
+    Erstellt die Personas aus dem Persona-Katalog (siehe persona_registry.py)
+    
+    Args:
+        response_cache: Optionaler ResponseCache, den alle Personas teilen
+        names: Optionale Liste von Persona-Namen - nur diese werden gebaut
+               (Standard: alle Personas im Katalog)
+        api_key: OpenRouter API-Schlüssel (Standard: OPENROUTER_API_KEY aus der .env)
+        client_pool: ClientPool, z.B. ein eigener pro GUI-Session (Standard: prozessweiter Pool)
+        provider: "openrouter" oder "fake" (Standard: LLM_PROVIDER aus der .env)
+        model_name: Modell für alle Personas (Standard: DEFAULT_MODEL aus der .env)
     
     Returns:
         Liste von PersonaAgent-Objekten
     """
-    # Hier werden unsere drei Haupt-Personas definiert
-    personas = [
-        create_anna_persona(),
-        create_tom_persona(), 
-        create_julia_persona()
-    ]
+    registry = get_persona_registry()
+    
+    if names is None:
+        specs = list(registry)
+    else:
+        specs = []
+        for name in names:
+            spec = registry.get(name)
+            if spec is None:
+                raise ValueError(f"Unbekannte Persona: {name}")
+            specs.append(spec)
     
-    return personas
+    with trace_span("create_personas", count=len(specs)):
+        return [create_persona_from_spec(spec, response_cache, api_key, client_pool, provider, model_name)
+                for spec in specs]
 
 
-def create_anna_persona():
+def create_persona_from_spec(spec, response_cache=None, api_key=None, client_pool=None, provider=None,
+                             model_name=None):
     """
-    Erstellt Anna - die umweltbewusste Studentin
+    Baut einen PersonaAgent (inklusive Sprachmodell) aus einer PersonaSpec
+    
+    Args:
+        spec: PersonaSpec aus der Persona-Registry
+        response_cache: Optionaler ResponseCache
+        api_key: OpenRouter API-Schlüssel (Standard: OPENROUTER_API_KEY)
+        client_pool: Optionaler ClientPool
+        provider: Optionaler LLM-Anbieter ("openrouter" oder "fake")
+        model_name: Optionales Modell (Standard: DEFAULT_MODEL)
+    
+    Returns:
+        PersonaAgent-Objekt
     """
     return PersonaAgent(
-        name="Anna",
-        age=20,
-        characteristics="umweltbewusst, schätzt Nachhaltigkeit, aktiv in sozialen Medien, budgetbewusste Studentin",
-        background="Universitätsstudentin der Umweltwissenschaften. Kauft in Second-Hand-Läden und unterstützt umweltfreundliche Marken. Aktiv auf Instagram und TikTok, folgt Nachhaltigkeits-Influencern.",
-        detailed_personality="Du bist leidenschaftlich für den Klimawandel und erwartest von Marken Transparenz über ihre Umweltauswirkungen. Du bevorzugst Second-Hand-Shopping, investierst aber in nachhaltige neue Produkte. Du wirst von authentischen Social-Media-Inhalten beeinflusst und kannst Greenwashing leicht erkennen."
+        name=spec.name,
+        age=spec.age,
+        characteristics=spec.characteristics,
+        background=spec.background,
+        detailed_personality=spec.detailed_personality,
+        response_cache=response_cache,
+        api_key=api_key,
+        client_pool=client_pool,
+        provider=provider,
+        model_name=model_name
     )
 
 
+def create_anna_persona():
+    """
+    Erstellt Anna - die umweltbewusste Studentin
+    """
+    return create_persona_from_spec(get_persona_registry().get("anna"))
+
+
 def create_tom_persona():
     """
     Erstellt Tom - den sportlichen Berufstätigen
     """
-    return PersonaAgent(
-        name="Tom",
-        age=40,
-        characteristics="sportlich, gesundheitsbewusst, vielbeschäftigter Berufstätiger, schätzt Qualität und Leistung",
-        background="Marketing-Manager in einem Tech-Unternehmen. Läuft Marathon und geht regelmäßig ins Fitnessstudio. Schätzt Effizienz und Qualität über den Preis. Hat verfügbares Einkommen, aber recherchiert Käufe sorgfältig.",
-        detailed_personality="Du priorisierst Leistung und Langlebigkeit bei allem, was du kaufst. Zeit ist wertvoll für dich, daher bevorzugst du Marken, die konstante Qualität liefern. Du bist bereit, Premium-Preise für Produkte zu zahlen, die deinen aktiven Lebensstil und dein professionelles Image unterstützen."
-    )
+    return create_persona_from_spec(get_persona_registry().get("tom"))
 
 
 def create_julia_persona():
     """
     Erstellt Julia - die praktische Familienmutter
     """
-    return PersonaAgent(
-        name="Julia",
-        age=35,
-        characteristics="preisbewusst, praktisch, familienorientiert, schätzt Langlebigkeit und Funktionalität",
-        background="Berufstätige Mutter von zwei Kindern im Alter von 8 und 12 Jahren. Teilzeit-Buchhalterin. Sorgfältige Budgetplanerin, die bei Käufen auf Wert und Langlebigkeit achtet. Kauft im Ausverkauf und vergleicht Preise ausgiebig.",
-        detailed_personality="Du triffst durchdachte Kaufentscheidungen basierend auf Familienbedürfnissen und Budgetbeschränkungen. Du schätzt Marken, die guten Kundenservice bieten und zu ihren Produkten stehen. Mundpropaganda von anderen Eltern hat großen Einfluss auf deine Entscheidungen."
-    )
+    return create_persona_from_spec(get_persona_registry().get("julia"))
 
 
 # =====================================
@@ -310,14 +579,22 @@ def create_julia_persona():
 # =====================================
 
 
-def validate_api_key():
+def validate_api_key(api_key=None, provider=None):
     """
     Prüft, ob ein gültiger OpenRouter API-Schlüssel vorhanden ist
     
+    Args:
+        api_key: Zu prüfender Schlüssel (Standard: OPENROUTER_API_KEY aus der .env)
+        provider: LLM-Anbieter (Standard: LLM_PROVIDER) - "fake" braucht keinen Schlüssel
+    
     Returns:
         bool: True wenn gültiger API-Schlüssel vorhanden ist, False sonst
     """
-    api_key = os.getenv('OPENROUTER_API_KEY')
+    if (provider or get_llm_provider()) == "fake":
+        print("✅ Offline-Modus (LLM_PROVIDER=fake) - kein API-Schlüssel nötig")
+        return True
+    
+    api_key = api_key or os.getenv('OPENROUTER_API_KEY')
     
     if not api_key:
         print("❌ Kein OpenRouter API-Schlüssel gefunden!")
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Auswertung der Antworten über alle Personas hinweg
+
+Pro Frage werden alle Antworten in eine TF-IDF-Matrix aus gehashten Wort-
+n-Grammen (1- und 2-Gramme) übersetzt und mit Matrix-Operationen verglichen -
+ohne Schleifen über Persona-Paare, so dass auch Panels mit tausenden
+Personas (population.py) in Sekunden ausgewertet sind:
+
+- Ähnlichkeit der Antworten von Persona zu Persona (Kosinus)
+- Divergenz je Frage (1 - mittlere paarweise Ähnlichkeit)
+- Near-Duplicates: fast gleiche Antworten zweier Personas
+- Persona-Kollaps: Paare, die bei vielen Fragen fast gleich antworten
+- Ausreißer: die Antwort, die am wenigsten zum Rest passt
+
+Die Auswertung landet im JSON- ("analysis") und Markdown-Bericht
+("## Auswertung"); mit REPORT_ANALYTICS=0 wird sie abgeschaltet.
+
+Usage:
+    python analytics.py results.json
+    python analytics.py results.jsonl --threshold 0.8
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+import zlib
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+_WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# Zeilen pro Block beim Ähnlichkeits-Produkt (begrenzt den Speicher auf Block × Antworten)
+_BLOCK_SIZE = 1024
+
+
+def get_report_analytics():
+    """Ob JSON- und Markdown-Berichte eine Auswertung enthalten (Standard: ja)"""
+    return os.getenv('REPORT_ANALYTICS', '1').lower() not in ('0', 'false', 'no', 'off')
+
+
+def get_analytics_features():
+    """Anzahl der Hash-Spalten der n-Gramm-Matrix (Standard: 2048)"""
+    return max(64, int(os.getenv('ANALYTICS_FEATURES', 2048)))
+
+
+def get_duplicate_threshold():
+    """Kosinus-Ähnlichkeit, ab der zwei Antworten als Near-Duplicate gelten (Standard: 0.9)"""
+    return float(os.getenv('ANALYTICS_DUPLICATE_THRESHOLD', 0.9))
+
+
+def get_matrix_max_personas():
+    """Bis zu wie vielen Personas die volle Ähnlichkeitsmatrix im Bericht steht (Standard: 12)"""
+    return int(os.getenv('ANALYTICS_MATRIX_MAX_PERSONAS', 12))
+
+
+class ResponseAnalyzer:
+    """
+    Wertet die Antworten Frage für Frage aus
+
+    Fragen werden einzeln mit add_question() hinzugefügt - so passt die
+    Auswertung zu Berichten, die Frage für Frage aus dem Stream gebaut werden.
+    """
+
+    def __init__(self, n_features: Optional[int] = None, duplicate_threshold: Optional[float] = None,
+                 matrix_max_personas: Optional[int] = None, max_listed_pairs: int = 20):
+        """
+        Args:
+            n_features: Hash-Spalten der n-Gramm-Matrix (Standard: ANALYTICS_FEATURES)
+            duplicate_threshold: Near-Duplicate-Schwelle (Standard: ANALYTICS_DUPLICATE_THRESHOLD)
+            matrix_max_personas: Volle Matrix nur bis zu so vielen Personas (Standard: ANALYTICS_MATRIX_MAX_PERSONAS)
+            max_listed_pairs: Wie viele Paare pro Liste im Bericht stehen
+        """
+        self.n_features = n_features or get_analytics_features()
+        self.duplicate_threshold = duplicate_threshold if duplicate_threshold is not None \
+            else get_duplicate_threshold()
+        self.matrix_max_personas = matrix_max_personas if matrix_max_personas is not None \
+            else get_matrix_max_personas()
+        self.max_listed_pairs = max_listed_pairs
+        self.questions = []
+        self._feature_cache = {}
+        self._agent_index = {}
+        self._agent_names = []
+        self._duplicate_pairs = Counter()
+        self._analyzed_questions = 0
+
+    # =====================================
+    # MATRIX
+    # =====================================
+
+    def _hash_ngram(self, ngram: str) -> int:
+        """Hash-Spalte eines n-Gramms (crc32, stabil über Prozesse hinweg)"""
+        feature = self._feature_cache.get(ngram)
+        if feature is None:
+            feature = zlib.crc32(ngram.encode('utf-8')) % self.n_features
+            self._feature_cache[ngram] = feature
+        return feature
+
+    def vectorize(self, texts: List[str]) -> np.ndarray:
+        """
+        Übersetzt Antworten in eine zeilen-normierte TF-IDF-Matrix
+
+        Args:
+            texts: Antworten einer Frage
+
+        Returns:
+            float32-Matrix (Antworten × n_features), jede Zeile mit Länge 1 (oder 0 bei leerer Antwort)
+        """
+        rows = []
+        columns = []
+        for row, text in enumerate(texts):
+            words = _WORD_PATTERN.findall(text.lower())
+            ngrams = words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+            columns.extend(self._hash_ngram(ngram) for ngram in ngrams)
+            rows.extend([row] * len(ngrams))
+
+        matrix = np.zeros((len(texts), self.n_features), dtype=np.float32)
+        if not columns:
+            return matrix
+        # Termhäufigkeit je (Antwort, Spalte), dann sublinear gewichtet
+        cells, counts = np.unique(np.asarray(rows, dtype=np.int64) * self.n_features + np.asarray(columns),
+                                  return_counts=True)
+        cell_rows, cell_columns = np.divmod(cells, self.n_features)
+        document_frequency = np.bincount(cell_columns, minlength=self.n_features)
+        idf = np.log((1 + len(texts)) / (1 + document_frequency)) + 1
+        matrix[cell_rows, cell_columns] = (1 + np.log(counts)) * idf[cell_columns]
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+    # =====================================
+    # AUSWERTUNG JE FRAGE
+    # =====================================
+
+    def add_question(self, question_data: Dict) -> Optional[Dict]:
+        """
+        Wertet eine Frage aus (Antworten mit Fehler zählen nicht)
+
+        Args:
+            question_data: {question_id, question, responses} wie in interview_data
+
+        Returns:
+            Auswertung der Frage oder None, wenn weniger als zwei Antworten vorliegen
+        """
+        responses = [response for response in question_data['responses']
+                     if response.get('status', 'success') != 'error' and response['response'].strip()]
+        if len(responses) < 2:
+            return None
+
+        names = [response['agent_id'] for response in responses]
+        matrix = self.vectorize([response['response'] for response in responses])
+        count = len(responses)
+
+        # Mittlere paarweise Ähnlichkeit ohne n×n-Matrix: |Σx|² = Σ|x_i|² + Σ_{i≠j} x_i·x_j
+        # (|x_i|² ist 1, nur bei Antworten ohne Wörter 0)
+        total = matrix.sum(axis=0, dtype=np.float64)
+        self_similarity = np.einsum('ij,ij->i', matrix, matrix, dtype=np.float64)
+        mean_similarity = float((total @ total - self_similarity.sum()) / (count * (count - 1)))
+
+        # Nähe jeder Antwort zu allen anderen - die kleinste ist der Ausreißer
+        to_others = (matrix @ total - self_similarity) / (count - 1)
+        outlier = int(np.argmin(to_others))
+
+        duplicates, best_pair = self._find_similar_pairs(matrix)
+        agent_codes = np.asarray([self._get_agent_code(name) for name in names])
+        pair_rows = duplicates[:, :2].astype(np.int64)
+        self._duplicate_pairs.update(zip(agent_codes[pair_rows[:, 0]].tolist(),
+                                         agent_codes[pair_rows[:, 1]].tolist()))
+        self._analyzed_questions += 1
+
+        order = np.argsort(-duplicates[:, 2], kind='stable')[:self.max_listed_pairs]
+        analysis = {
+            "question_id": question_data['question_id'],
+            "responses": count,
+            "mean_similarity": round(mean_similarity, 4),
+            "divergence": round(1 - mean_similarity, 4),
+            "max_similarity": round(best_pair[2], 4),
+            "most_similar_pair": [names[best_pair[0]], names[best_pair[1]]],
+            "near_duplicate_count": len(duplicates),
+            "near_duplicates": [{"agents": [names[int(first)], names[int(second)]],
+                                 "similarity": round(float(similarity), 4)}
+                                for first, second, similarity in duplicates[order]],
+            "outlier": {"agent": names[outlier], "similarity_to_others": round(float(to_others[outlier]), 4)}
+        }
+        if count <= self.matrix_max_personas:
+            analysis["similarity_matrix"] = {
+                "agents": names,
+                "values": np.round((matrix @ matrix.T).astype(np.float64), 4).tolist()
+            }
+        self.questions.append(analysis)
+        return analysis
+
+    def _find_similar_pairs(self, matrix: np.ndarray):
+        """
+        Sucht Near-Duplicates und das ähnlichste Paar blockweise (Block × alle Antworten)
+
+        Returns:
+            (Array der Paare [i, j, Ähnlichkeit] mit i < j, (i, j, Ähnlichkeit) des ähnlichsten Paars)
+        """
+        count = len(matrix)
+        found = []
+        best_pair = (0, 1, -1.0)
+        for start in range(0, count - 1, _BLOCK_SIZE):
+            block = matrix[start:start + _BLOCK_SIZE] @ matrix[start:].T
+            # Nur Paare i < j: Diagonale und alles darunter ausblenden
+            block_rows = np.arange(len(block))[:, None]
+            block[np.arange(block.shape[1])[None, :] <= block_rows] = -np.inf
+            row, column = np.unravel_index(int(np.argmax(block)), block.shape)
+            if block[row, column] > best_pair[2]:
+                best_pair = (start + row, start + column, float(block[row, column]))
+            rows, columns = np.nonzero(block >= self.duplicate_threshold)
+            if len(rows):
+                found.append(np.column_stack([rows + start, columns + start, block[rows, columns]]))
+        pairs = np.concatenate(found) if found else np.empty((0, 3))
+        return pairs.astype(np.float64), best_pair
+
+    def _get_agent_code(self, name: str) -> int:
+        code = self._agent_index.get(name)
+        if code is None:
+            code = len(self._agent_names)
+            self._agent_index[name] = code
+            self._agent_names.append(name)
+        return code
+
+    # =====================================
+    # GESAMT-AUSWERTUNG
+    # =====================================
+
+    def get_persona_collapse(self) -> Dict:
+        """
+        Paare, die in mindestens der Hälfte der ausgewerteten Fragen fast gleich antworten
+
+        Returns:
+            {min_questions, pair_count, affected_personas, pairs: [{agents, questions}]}
+        """
+        min_questions = max(1, math.ceil(self._analyzed_questions / 2))
+        collapsed = [(pair, questions) for pair, questions in self._duplicate_pairs.items()
+                     if questions >= min_questions]
+        collapsed.sort(key=lambda item: -item[1])
+        affected = {code for pair, _ in collapsed for code in pair}
+        return {
+            "min_questions": min_questions,
+            "pair_count": len(collapsed),
+            "affected_personas": len(affected),
+            "pairs": [{"agents": [self._agent_names[first], self._agent_names[second]], "questions": questions}
+                      for (first, second), questions in collapsed[:self.max_listed_pairs]]
+        }
+
+    def get_report(self) -> Dict:
+        """
+        Gesamte Auswertung für den Bericht
+
+        Returns:
+            Dictionary mit Methode, Schwelle, Auswertung je Frage und Persona-Kollaps
+        """
+        divergences = [question["divergence"] for question in self.questions]
+        return {
+            "method": f"TF-IDF über gehashte Wort-1/2-Gramme ({self.n_features} Spalten), Kosinus-Ähnlichkeit",
+            "duplicate_threshold": self.duplicate_threshold,
+            "mean_divergence": round(float(np.mean(divergences)), 4) if divergences else None,
+            "questions": self.questions,
+            "persona_collapse": self.get_persona_collapse()
+        }
+
+
+def analyze_responses(questions: Iterable[Dict], **options) -> Dict:
+    """
+    Wertet alle Fragen eines Interviews aus
+
+    Args:
+        questions: Iterable über {question_id, question, responses} (z.B. interview_data)
+        **options: Einstellungen für ResponseAnalyzer
+
+    Returns:
+        Auswertung (siehe ResponseAnalyzer.get_report)
+    """
+    analyzer = ResponseAnalyzer(**options)
+    for question_data in questions:
+        analyzer.add_question(question_data)
+    return analyzer.get_report()
+
+
+def build_report_analysis(questions: Iterable[Dict]) -> Optional[Dict]:
+    """Auswertung für JSON-/Markdown-Berichte - None, wenn REPORT_ANALYTICS=0"""
+    if not get_report_analytics():
+        return None
+    return analyze_responses(questions)
+
+
+def write_markdown_analysis(file, analysis: Dict):
+    """
+    Schreibt den Abschnitt "Auswertung" eines Markdown-Berichts
+
+    Args:
+        file: Offene Text-Datei
+        analysis: Ergebnis von analyze_responses
+    """
+    file.write("## Auswertung\n\n")
+    file.write(f"_{analysis['method']}, Near-Duplicate ab {analysis['duplicate_threshold']}_\n\n")
+    if not analysis['questions']:
+        file.write("Zu wenige Antworten für eine Auswertung.\n\n")
+        return
+
+    file.write("| Frage | Antworten | Ø Ähnlichkeit | Divergenz | Ähnlichstes Paar | Near-Duplicates | Ausreißer |\n")
+    file.write("|---|---|---|---|---|---|---|\n")
+    for question in analysis['questions']:
+        pair = " & ".join(question['most_similar_pair'])
+        file.write(f"| {question['question_id']} | {question['responses']} | {question['mean_similarity']:.2f} "
+                   f"| {question['divergence']:.2f} | {pair} ({question['max_similarity']:.2f}) "
+                   f"| {question['near_duplicate_count']} | {question['outlier']['agent']} |\n")
+    file.write(f"\n**Ø Divergenz:** {analysis['mean_divergence']:.2f}\n\n")
+
+    collapse = analysis['persona_collapse']
+    if collapse['pairs']:
+        file.write(f"**Persona-Kollaps:** {collapse['pair_count']} Paare ({collapse['affected_personas']} Personas) "
+                   f"antworten bei mindestens {collapse['min_questions']} Fragen fast gleich\n\n")
+        for pair in collapse['pairs']:
+            file.write(f"- {' & '.join(pair['agents'])}: {pair['questions']} Fragen\n")
+        file.write("\n")
+
+
+def main():
+    """Kommandozeile: Auswertung einer Ergebnis-Datei (.json, .jsonl oder .npz) anzeigen"""
+    from results_model import load_result
+
+    parser = argparse.ArgumentParser(description="Antworten über alle Personas hinweg auswerten")
+    parser.add_argument("results", help="Ergebnis-Datei (.json, .jsonl oder .npz)")
+    parser.add_argument("--threshold", type=float, default=None,
+                        help="Near-Duplicate-Schwelle (Standard: ANALYTICS_DUPLICATE_THRESHOLD oder 0.9)")
+    parser.add_argument("--format", choices=["json", "md"], default="md", help="Ausgabeformat (Standard: md)")
+    args = parser.parse_args()
+
+    try:
+        result = load_result(args.results)
+    except (OSError, ValueError) as e:
+        print(f"❌ Ergebnis-Datei konnte nicht geladen werden: {e}")
+        sys.exit(1)
+
+    analysis = analyze_responses(result.iter_questions(), duplicate_threshold=args.threshold)
+    if args.format == "json":
+        print(json.dumps(analysis, indent=2, ensure_ascii=False))
+    else:
+        write_markdown_analysis(sys.stdout, analysis)
+
+
+if __name__ == "__main__":
+    main()
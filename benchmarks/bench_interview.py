@@ -0,0 +1,616 @@
+"""
+Benchmark für Interview-Durchsatz und Latenz
+
+Misst die Interview-Pfade gegen das Offline-Modell (LLM_PROVIDER=fake, siehe
+fake_llm.py) - ohne Netzwerk, ohne API-Schlüssel, reproduzierbar:
+
+    run_interview    interview.run_interview (CLI-Pfad inklusive Datei-Ausgabe)
+    manager          InterviewManager.run_full_interview
+    batch            BatchInterviewRunner.run_batch (Cron-Pfad)
+    reports          save_as_json_file / save_as_markdown_file
+
+Jedes Szenario (Ziel x Personas x Fragen) läuft in einem eigenen Prozess, damit
+Startzeit und Speicher-Spitze (peak RSS) pro Szenario gemessen werden.
+Ergebnisse landen als JSON in benchmarks/results/ und lassen sich mit
+--baseline gegen einen früheren Lauf vergleichen.
+
+Mit --startup wird zusätzlich der Kaltstart geprüft: Importzeit der
+Einstiegsmodule (python -X importtime) und Wanduhrzeit von --help und
+--dry-run, jeweils gegen ein Budget. Diese Pfade dürfen weder LangChain noch
+NumPy laden (schwere Abhängigkeiten kommen erst beim ersten Gebrauch).
+
+Beispiele:
+    python benchmarks/bench_interview.py
+    python benchmarks/bench_interview.py --scales 3x5,100x20 --targets manager --engine async
+    python benchmarks/bench_interview.py --scales 10000x50 --targets manager --max-concurrency 32
+    python benchmarks/bench_interview.py --baseline benchmarks/results/alt.json --max-regression 0.1
+    FAKE_LLM_LATENCY_MS=200 FAKE_LLM_LATENCY_DIST=lognormal python benchmarks/bench_interview.py
+    python benchmarks/bench_interview.py --startup-only --startup-budget-ms 300 --import-budget-ms 150
+"""
+
+import time
+
+_PROCESS_START = time.perf_counter()
+
+import argparse
+import contextlib
+import datetime
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+TARGETS = ("run_interview", "manager", "batch", "reports")
+DEFAULT_SCALES = "3x5,30x10,100x20"
+
+# Kaltstart-Pfade: Name -> Argumente (Platzhalter aus write_synthetic_inputs)
+STARTUP_COMMANDS = {
+    "interview --help": ["interview.py", "--help"],
+    "run_batch --help": ["run_batch.py", "--help"],
+    "interview --dry-run": ["interview.py", "--questions", "{questions_file}", "--dry-run"],
+    "run_batch --dry-run": ["run_batch.py", "{batch_file}", "--dry-run", "--output-dir", "{workdir}/batch"],
+}
+IMPORT_MODULES = ("interview", "run_batch")
+# Module, die beim Kaltstart nicht geladen werden dürfen
+HEAVY_MODULES = ("langchain_core", "langchain", "langchain_openai", "openai", "httpx", "numpy")
+DEFAULT_STARTUP_BUDGET_MS = 300
+DEFAULT_IMPORT_BUDGET_MS = 150
+
+# Beispiel-Personas, aus denen synthetische Kataloge beliebiger Größe entstehen
+BASE_PERSONAS_FILE = REPO_ROOT / "personas.json"
+BASE_QUESTIONS_FILE = REPO_ROOT / "interview_batch.json"
+
+
+def parse_scale(scale):
+    """
+    Zerlegt eine Größenangabe wie "100x20"
+
+    Returns:
+        Tupel (Anzahl Personas, Anzahl Fragen)
+    """
+    try:
+        personas, questions = scale.lower().split("x")
+        return int(personas), int(questions)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Ungültige Größe '{scale}' (erwartet z.B. 100x20)")
+
+
+def percentile(sorted_values, fraction):
+    """Perzentil (nearest rank) einer sortierten Liste, None wenn leer"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def summarize_latencies(values):
+    """Fasst Latenzen (Sekunden) zu Anzahl, Mittelwert und p50/p95/p99 zusammen"""
+    values = sorted(values)
+    return {
+        "count": len(values),
+        "mean": sum(values) / len(values) if values else None,
+        "p50": percentile(values, 0.50),
+        "p95": percentile(values, 0.95),
+        "p99": percentile(values, 0.99),
+        "max": values[-1] if values else None
+    }
+
+
+def get_peak_rss_mb():
+    """Speicher-Spitze dieses Prozesses in MB (None, wo resource fehlt, z.B. Windows)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux meldet KB, macOS Bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def write_synthetic_inputs(workdir, personas_count, questions_count):
+    """
+    Schreibt Persona-Katalog, Fragen-Datei und Batch-Konfiguration der gewünschten Größe
+
+    Returns:
+        Tupel (Katalog-Pfad, Fragen-Pfad, Batch-Konfig-Pfad, Fragenliste)
+    """
+    with open(BASE_PERSONAS_FILE, "r", encoding="utf-8") as file:
+        base_personas = json.load(file)["personas"]
+    with open(BASE_QUESTIONS_FILE, "r", encoding="utf-8") as file:
+        base_questions = json.load(file)["questions"]
+
+    personas = []
+    for index in range(personas_count):
+        base = base_personas[index % len(base_personas)]
+        persona = dict(base)
+        if index >= len(base_personas):
+            persona["id"] = f"{base['id']}_{index}"
+            persona["name"] = f"{base['name']} {index}"
+        personas.append(persona)
+
+    questions = [f"{base_questions[index % len(base_questions)]} (#{index + 1})"
+                 for index in range(questions_count)]
+
+    catalog_file = Path(workdir) / "personas.json"
+    questions_file = Path(workdir) / "questions.json"
+    batch_file = Path(workdir) / "batch.json"
+    with open(catalog_file, "w", encoding="utf-8") as file:
+        json.dump({"personas": personas}, file, ensure_ascii=False)
+    with open(questions_file, "w", encoding="utf-8") as file:
+        json.dump({"questions": questions}, file, ensure_ascii=False)
+    with open(batch_file, "w", encoding="utf-8") as file:
+        json.dump({"questions": questions}, file, ensure_ascii=False)
+    return str(catalog_file), str(questions_file), str(batch_file), questions
+
+
+# =====================================
+# WORKER (läuft im Kind-Prozess)
+# =====================================
+
+def install_call_timer(call_latencies):
+    """
+    Misst jeden PersonaAgent-Aufruf (respond/arespond) ohne den Code zu verändern
+
+    Args:
+        call_latencies: Liste, an die jede Aufrufdauer (Sekunden) angehängt wird
+    """
+    from agents import PersonaAgent
+
+    respond = PersonaAgent.respond
+    arespond = PersonaAgent.arespond
+
+    def timed_respond(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return respond(self, *args, **kwargs)
+        finally:
+            call_latencies.append(time.perf_counter() - start)
+
+    async def timed_arespond(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await arespond(self, *args, **kwargs)
+        finally:
+            call_latencies.append(time.perf_counter() - start)
+
+    PersonaAgent.respond = timed_respond
+    PersonaAgent.arespond = timed_arespond
+
+
+def check_model_latency(records):
+    """
+    Prüft, ob die simulierte Modell-Latenz (FAKE_LLM_LATENCY_MS, Verteilung fixed)
+    in den gemessenen Aufrufen (CallRecord.latency_seconds) ankommt
+
+    Schützt davor, dass ein Pfad - z.B. Streaming - die Latenz umgeht und der
+    Benchmark dann nichts mehr misst.
+
+    Args:
+        records: CallRecords aus MetricsCollector.get_records()
+
+    Returns:
+        Fehlermeldung oder None
+    """
+    from metrics import CACHE_OFF, CACHE_MISS
+
+    latency = float(os.getenv("FAKE_LLM_LATENCY_MS") or 0) / 1000
+    if latency <= 0 or os.getenv("FAKE_LLM_LATENCY_DIST", "fixed") != "fixed":
+        return None
+    # Cache-Treffer und Fehler rufen das Modell nicht (vollständig) auf
+    model_calls = [record for record in records if record.cache in (CACHE_OFF, CACHE_MISS) and not record.error]
+    too_fast = [record for record in model_calls if record.latency_seconds < latency * 0.95]
+    if too_fast:
+        fastest = min(record.latency_seconds for record in too_fast)
+        return (f"{len(too_fast)} von {len(model_calls)} Aufrufen schneller als die simulierte "
+                f"Latenz von {latency * 1000:.0f} ms (schnellster: {fastest * 1000:.1f} ms)")
+    return None
+
+
+def run_worker(spec):
+    """
+    Führt ein Szenario aus und gibt die Messwerte zurück
+
+    Args:
+        spec: Dictionary mit target, personas, questions, repeat, engine,
+              max_concurrency, stateless und workdir
+    """
+    sys.path.insert(0, str(REPO_ROOT))
+    workdir = spec["workdir"]
+    catalog_file, questions_file, batch_file, questions = write_synthetic_inputs(
+        workdir, spec["personas"], spec["questions"])
+    os.environ["PERSONA_CATALOG"] = catalog_file
+    os.environ["LLM_PROVIDER"] = "fake"
+
+    import_start = time.perf_counter()
+    import interview
+    import run_batch
+    startup_seconds = time.perf_counter() - _PROCESS_START
+    import_seconds = time.perf_counter() - import_start
+
+    call_latencies = []
+    install_call_timer(call_latencies)
+
+    target = spec["target"]
+    run_seconds = []
+    calls = 0
+    ok = True
+    os.chdir(workdir)
+
+    # Ein gemeinsames devnull für alle Ausgaben - das Batch-Logging behält
+    # den beim ersten Lauf aktiven stdout-Stream
+    devnull = open(os.devnull, "w", encoding="utf-8")
+
+    results = None
+    latency_error = None
+    if target == "reports":
+        # Ergebnisse einmal (ungemessen) erzeugen, dann nur die Writer messen
+        with contextlib.redirect_stdout(devnull):
+            manager = interview.InterviewManager(max_concurrency=spec["max_concurrency"],
+                                                 engine=spec["engine"], stateless=spec["stateless"])
+            manager.setup_personas()
+            results = manager.run_full_interview(questions)
+        call_latencies.clear()
+
+    for repetition in range(spec["repeat"]):
+        output_name = str(Path(workdir) / f"out_{repetition}")
+        with contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            if target == "run_interview":
+                ok = interview.run_interview(questions_file, format="json", output_file=output_name,
+                                             max_concurrency=spec["max_concurrency"],
+                                             engine=spec["engine"], stateless=spec["stateless"]) is not None and ok
+                calls += spec["personas"] * spec["questions"]
+            elif target == "manager":
+                manager = interview.InterviewManager(max_concurrency=spec["max_concurrency"],
+                                                     engine=spec["engine"], stateless=spec["stateless"])
+                ok = manager.setup_personas() and ok
+                manager.run_full_interview(questions)
+                calls += spec["personas"] * spec["questions"]
+                latency_error = latency_error or check_model_latency(manager.metrics.get_records())
+            elif target == "batch":
+                runner = run_batch.BatchInterviewRunner(output_dir=str(Path(workdir) / f"batch_{repetition}"))
+                ok = runner.run_batch(batch_file) and ok
+                calls += spec["personas"] * spec["questions"]
+            elif target == "reports":
+                interview.save_as_json_file(results, output_name)
+                interview.save_as_markdown_file(results, output_name)
+                calls += 2
+            run_seconds.append(time.perf_counter() - start)
+    # Log-Dateien des Batch-Runners liegen im temporären Verzeichnis
+    logging.shutdown()
+    devnull.close()
+
+    total_seconds = sum(run_seconds)
+    return {
+        "ok": bool(ok) and latency_error is None,
+        "error": latency_error,
+        "calls": calls,
+        "total_seconds": total_seconds,
+        "calls_per_second": calls / total_seconds if total_seconds else None,
+        "call_latency": summarize_latencies(call_latencies),
+        "end_to_end_latency": summarize_latencies(run_seconds),
+        "startup_seconds": startup_seconds,
+        "import_seconds": import_seconds,
+        "peak_rss_mb": get_peak_rss_mb()
+    }
+
+
+# =====================================
+# STEUERUNG (Eltern-Prozess)
+# =====================================
+
+def run_scenario(target, personas, questions, args):
+    """Startet ein Szenario in einem frischen Python-Prozess und liest dessen Messwerte"""
+    with tempfile.TemporaryDirectory(prefix="bench_interview_") as workdir:
+        spec = {
+            "target": target,
+            "personas": personas,
+            "questions": questions,
+            "repeat": args.repeat,
+            "engine": args.engine,
+            "max_concurrency": args.max_concurrency,
+            "stateless": args.stateless,
+            "workdir": workdir
+        }
+        result_file = Path(workdir) / "result.json"
+        env = dict(os.environ, LLM_PROVIDER="fake")
+        if args.latency_ms is not None:
+            env["FAKE_LLM_LATENCY_MS"] = str(args.latency_ms)
+
+        start = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, __file__, "--worker", json.dumps(spec), "--worker-output", str(result_file)],
+            env=env, capture_output=True, text=True
+        )
+        process_seconds = time.perf_counter() - start
+
+        scenario = {"target": target, "personas": personas, "questions": questions,
+                    "engine": args.engine, "max_concurrency": args.max_concurrency,
+                    "stateless": args.stateless, "repeat": args.repeat,
+                    "process_seconds": process_seconds}
+        if completed.returncode != 0 or not result_file.exists():
+            scenario.update(ok=False, error=completed.stderr.strip()[-2000:])
+        else:
+            with open(result_file, "r", encoding="utf-8") as file:
+                scenario.update(json.load(file))
+        return scenario
+
+
+def parse_importtime(stderr):
+    """
+    Liest die Ausgabe von python -X importtime
+
+    Returns:
+        Liste von (Modul, Tiefe, eigene µs, kumulative µs) in Ausgabe-Reihenfolge
+    """
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_part, cumulative_us, name = line.split("|", 2)
+        self_us = self_part.split(":", 1)[1]
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        modules.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return modules
+
+
+def measure_import(module, env):
+    """
+    Importzeit eines Moduls in einem frischen Prozess
+
+    Returns:
+        Dictionary mit import_ms, den teuersten direkten Importen und geladenen schweren Modulen
+    """
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                               cwd=REPO_ROOT, env=env, capture_output=True, text=True)
+    modules = parse_importtime(completed.stderr)
+    # importtime listet die Unter-Importe vor dem Modul selbst
+    total = None
+    children = []
+    pending = []
+    for name, depth, _, cumulative in modules:
+        if depth == 0:
+            if name == module:
+                total, children = cumulative, pending
+            pending = []
+        elif depth == 1:
+            pending.append((name, cumulative))
+    loaded = {name.split(".")[0] for name, _, _, _ in modules}
+    return {
+        "ok": completed.returncode == 0 and total is not None,
+        "import_ms": total / 1000 if total is not None else None,
+        "top_imports": [{"module": name, "ms": cumulative / 1000}
+                        for name, cumulative in sorted(children, key=lambda item: -item[1])[:5]],
+        "heavy_modules": sorted(loaded.intersection(HEAVY_MODULES)),
+        "error": completed.stderr.strip()[-2000:] if completed.returncode else None
+    }
+
+
+def measure_startup(args):
+    """
+    Kaltstart der Einstiegspunkte: Importzeit und Wanduhrzeit von --help/--dry-run
+
+    Returns:
+        Dictionary {"imports": {...}, "commands": {...}} mit ok-Flag pro Messung
+    """
+    with tempfile.TemporaryDirectory(prefix="bench_startup_") as workdir:
+        catalog_file, questions_file, batch_file, _ = write_synthetic_inputs(workdir, 3, 5)
+        env = dict(os.environ, LLM_PROVIDER="fake", PERSONA_CATALOG=catalog_file)
+        placeholders = {"questions_file": questions_file, "batch_file": batch_file, "workdir": workdir}
+
+        imports = {}
+        for module in IMPORT_MODULES:
+            result = measure_import(module, env)
+            result["ok"] = (result["ok"] and not result["heavy_modules"]
+                            and result["import_ms"] <= args.import_budget_ms)
+            imports[module] = result
+
+        commands = {}
+        for name, command in STARTUP_COMMANDS.items():
+            argv = [sys.executable, str(REPO_ROOT / command[0])] + [part.format(**placeholders)
+                                                                    for part in command[1:]]
+            durations = []
+            returncode = 0
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                completed = subprocess.run(argv, cwd=workdir, env=env, capture_output=True, text=True)
+                durations.append(time.perf_counter() - start)
+                returncode = returncode or completed.returncode
+            median_ms = sorted(durations)[len(durations) // 2] * 1000
+            commands[name] = {
+                "ok": returncode == 0 and median_ms <= args.startup_budget_ms,
+                "returncode": returncode,
+                "min_ms": min(durations) * 1000,
+                "median_ms": median_ms
+            }
+    return {"import_budget_ms": args.import_budget_ms, "startup_budget_ms": args.startup_budget_ms,
+            "imports": imports, "commands": commands}
+
+
+def print_startup(startup):
+    """Gibt eine Zeile pro Kaltstart-Messung aus"""
+    for module, result in startup["imports"].items():
+        icon = "✅" if result["ok"] else "❌"
+        if result["import_ms"] is None:
+            print(f"{icon} import {module:<22} fehlgeschlagen: {(result['error'] or '')[-300:]}")
+            continue
+        top = ", ".join(f"{entry['module']} {entry['ms']:.0f}" for entry in result["top_imports"][:3])
+        line = (f"{icon} import {module:<22} {result['import_ms']:>7.1f} ms "
+                f"(Budget {startup['import_budget_ms']:.0f} ms) | teuerste: {top}")
+        if result["heavy_modules"]:
+            line += f" | lädt {', '.join(result['heavy_modules'])}"
+        print(line)
+    for name, result in startup["commands"].items():
+        icon = "✅" if result["ok"] else "❌"
+        status = "" if result["returncode"] == 0 else f" | Exit-Code {result['returncode']}"
+        print(f"{icon} {name:<29} {result['median_ms']:>7.1f} ms Median, {result['min_ms']:.1f} ms min "
+              f"(Budget {startup['startup_budget_ms']:.0f} ms){status}")
+
+
+def get_git_commit():
+    """Aktueller Commit (kurz) oder None außerhalb eines Git-Repos"""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_with_baseline(report, baseline_file, max_regression):
+    """
+    Vergleicht calls/s mit einem früheren Lauf
+
+    Returns:
+        Liste der Szenarien, deren Durchsatz um mehr als max_regression gefallen ist
+    """
+    with open(baseline_file, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    def scenario_key(scenario):
+        return (scenario["target"], scenario["personas"], scenario["questions"],
+                scenario.get("engine"), scenario.get("stateless"))
+
+    baseline_by_key = {scenario_key(s): s for s in baseline.get("scenarios", [])}
+    regressions = []
+    for scenario in report["scenarios"]:
+        previous = baseline_by_key.get(scenario_key(scenario))
+        if not previous or not previous.get("calls_per_second") or not scenario.get("calls_per_second"):
+            continue
+        change = scenario["calls_per_second"] / previous["calls_per_second"] - 1
+        scenario["baseline_change"] = change
+        if change < -max_regression:
+            regressions.append(scenario)
+    return regressions
+
+
+def print_scenario(scenario):
+    """Gibt eine Ergebniszeile pro Szenario aus"""
+    label = f"{scenario['target']:<14} {scenario['personas']:>6}x{scenario['questions']:<4}"
+    if not scenario.get("ok"):
+        print(f"❌ {label} fehlgeschlagen: {(scenario.get('error') or 'siehe Ausgabe')[-300:]}")
+        return
+
+    call = scenario["call_latency"]
+    e2e = scenario["end_to_end_latency"]
+    rss = f"{scenario['peak_rss_mb']:.0f} MB" if scenario.get("peak_rss_mb") else "n/a"
+    line = f"✅ {label} {scenario['calls_per_second'] or 0:>10.1f} calls/s"
+    if call["count"]:
+        line += f" | call p50/p95/p99 {call['p50'] * 1000:.1f}/{call['p95'] * 1000:.1f}/{call['p99'] * 1000:.1f} ms"
+    line += (f" | e2e p50 {e2e['p50']:.2f} s | start {scenario['startup_seconds']:.2f} s"
+             f" | peak RSS {rss}")
+    if "baseline_change" in scenario:
+        line += f" | {scenario['baseline_change']:+.1%} vs. Baseline"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark für Interview-Durchsatz und Latenz mit dem Offline-Modell",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__.split("Beispiele:")[1] if "Beispiele:" in __doc__ else None
+    )
+    parser.add_argument("--scales", default=DEFAULT_SCALES,
+                        help=f"Personas x Fragen, kommagetrennt (Standard: {DEFAULT_SCALES})")
+    parser.add_argument("--targets", default=",".join(TARGETS),
+                        help=f"Zu messende Pfade, kommagetrennt ({', '.join(TARGETS)})")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Wiederholungen pro Szenario (Standard: 3)")
+    parser.add_argument("--engine", choices=["sync", "async"], default="sync",
+                        help="Interview-Motor für run_interview/manager/reports")
+    parser.add_argument("--max-concurrency", type=int, default=None,
+                        help="Gleichzeitig befragte Personas (Standard: MAX_CONCURRENCY)")
+    parser.add_argument("--stateless", action="store_true",
+                        help="Personas ohne eigenen Verlauf befragen")
+    parser.add_argument("--latency-ms", type=float, default=None,
+                        help="Simulierte Modell-Latenz (Standard: FAKE_LLM_LATENCY_MS oder 0)")
+    parser.add_argument("--output", default=None,
+                        help="Ergebnis-Datei (Standard: benchmarks/results/<Zeitstempel>_<Commit>.json)")
+    parser.add_argument("--baseline", default=None,
+                        help="Früheres Ergebnis zum Vergleich")
+    parser.add_argument("--max-regression", type=float, default=0.1,
+                        help="Erlaubter Durchsatz-Verlust gegenüber der Baseline (Standard: 0.1 = 10%%)")
+    parser.add_argument("--startup", action="store_true",
+                        help="Zusätzlich Kaltstart prüfen: Importzeit, --help und --dry-run gegen Budgets")
+    parser.add_argument("--startup-only", action="store_true",
+                        help="Nur den Kaltstart prüfen, keine Durchsatz-Szenarien")
+    parser.add_argument("--startup-budget-ms", type=float, default=DEFAULT_STARTUP_BUDGET_MS,
+                        help=f"Budget für --help/--dry-run, Median Wanduhrzeit "
+                             f"(Standard: {DEFAULT_STARTUP_BUDGET_MS} ms)")
+    parser.add_argument("--import-budget-ms", type=float, default=DEFAULT_IMPORT_BUDGET_MS,
+                        help=f"Budget für den Import von interview/run_batch "
+                             f"(Standard: {DEFAULT_IMPORT_BUDGET_MS} ms)")
+    parser.add_argument("--worker", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--worker-output", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        result = run_worker(json.loads(args.worker))
+        with open(args.worker_output, "w", encoding="utf-8") as file:
+            json.dump(result, file)
+        sys.exit(0)
+
+    scales = [parse_scale(scale) for scale in args.scales.split(",") if scale.strip()]
+    targets = [target.strip() for target in args.targets.split(",") if target.strip()]
+    unknown = [target for target in targets if target not in TARGETS]
+    if unknown:
+        parser.error(f"Unbekannte Ziele: {', '.join(unknown)} (erlaubt: {', '.join(TARGETS)})")
+
+    commit = get_git_commit()
+    report = {
+        "timestamp": datetime.datetime.now().isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "fake_llm": {name: value for name, value in os.environ.items() if name.startswith("FAKE_LLM_")},
+        "scenarios": []
+    }
+    if args.latency_ms is not None:
+        report["fake_llm"]["FAKE_LLM_LATENCY_MS"] = str(args.latency_ms)
+
+    if args.startup_only:
+        scales = []
+    else:
+        print(f"📊 Benchmark: {len(scales)} Größen x {len(targets)} Ziele, {args.repeat} Wiederholungen")
+    for personas, questions in scales:
+        for target in targets:
+            scenario = run_scenario(target, personas, questions, args)
+            report["scenarios"].append(scenario)
+            print_scenario(scenario)
+
+    startup_failed = []
+    if args.startup or args.startup_only:
+        print(f"\n🚀 Kaltstart ({args.repeat} Wiederholungen pro Befehl)")
+        report["startup"] = measure_startup(args)
+        print_startup(report["startup"])
+        startup_failed = [name for group in ("imports", "commands")
+                          for name, result in report["startup"][group].items() if not result["ok"]]
+
+    regressions = []
+    if args.baseline:
+        regressions = compare_with_baseline(report, args.baseline, args.max_regression)
+
+    output = Path(args.output) if args.output else RESULTS_DIR / (
+        f"{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}_{commit or 'nogit'}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2, ensure_ascii=False)
+    print(f"\n💾 Ergebnisse gespeichert in {output}")
+
+    failed = [s for s in report["scenarios"] if not s.get("ok")]
+    for scenario in regressions:
+        print(f"⚠️ Regression: {scenario['target']} {scenario['personas']}x{scenario['questions']} "
+              f"{scenario['baseline_change']:+.1%} calls/s")
+    for name in startup_failed:
+        print(f"⚠️ Kaltstart über Budget oder fehlgeschlagen: {name}")
+    sys.exit(1 if failed or regressions or startup_failed else 0)
+
+
+if __name__ == "__main__":
+    main()
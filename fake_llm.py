@@ -0,0 +1,238 @@
+"""
+Offline Fake-Chat-Modell für Tests und Lasttests ohne OpenRouter
+
+Aktivieren mit LLM_PROVIDER=fake (oder --provider fake auf der Kommandozeile).
+Das Modell antwortet deterministisch (gleiche Eingabe + gleicher Seed = gleiche
+Antwort) und simuliert, was für Durchsatz-Messungen zählt:
+
+- Latenz pro Aufruf aus einer Verteilung: fixed, lognormal oder heavy_tail (Pareto)
+- Zeit bis zum ersten Token und Streaming mit fester Chunk-Rate - gestreamte
+  Aufrufe dauern insgesamt genauso lange wie invoke
+- Token-Zählung (usage_metadata) wie bei echten Modellen
+- Eingestreute 429- und 5xx-Fehler inklusive Retry-After-Header
+
+Einstellungen (Umgebungsvariablen):
+    FAKE_LLM_LATENCY_MS       Median der Gesamtlatenz in ms (Standard: 0)
+    FAKE_LLM_LATENCY_DIST     fixed | lognormal | heavy_tail (Standard: fixed)
+    FAKE_LLM_LATENCY_SIGMA    Streuung für lognormal bzw. Pareto-Alpha für heavy_tail
+    FAKE_LLM_TTFT_MS          Zeit bis zum ersten Token in ms (Standard: 0 = gesamte Latenz)
+    FAKE_LLM_CHUNK_RATE       Gestreamte Chunks pro Sekunde (0 = ohne Verzögerung)
+    FAKE_LLM_RESPONSE_TOKENS  Länge einer Antwort in Tokens (Standard: 40)
+    FAKE_LLM_429_RATE         Anteil der Aufrufe mit 429 (0.0 - 1.0)
+    FAKE_LLM_5XX_RATE         Anteil der Aufrufe mit 503 (0.0 - 1.0)
+    FAKE_LLM_RETRY_AFTER      Retry-After in Sekunden für simulierte 429
+    FAKE_LLM_SEED             Seed für Antworten, Latenzen und Fehler
+"""
+
+import asyncio
+import hashlib
+import itertools
+import os
+import random
+import threading
+import time
+from typing import Any, AsyncIterator, Iterator, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+LATENCY_DISTRIBUTIONS = ("fixed", "lognormal", "heavy_tail")
+
+_WORDS = (
+    "ich finde marken wichtig wenn sie ehrlich nachhaltig und fair sind qualität preis "
+    "zählt für mich besonders aber auch der service und die werte dahinter social media "
+    "beeinflusst mich manchmal doch am ende entscheide ich nach gefühl und erfahrung"
+).split()
+
+
+class FakeLLMError(Exception):
+    """Simulierter API-Fehler mit Statuscode und Headern wie bei openai.APIStatusError"""
+
+    def __init__(self, status_code, message, headers=None):
+        super().__init__(f"Error code: {status_code} - {message}")
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class FakeChatModel(BaseChatModel):
+    """Deterministisches Offline-Chat-Modell mit simulierter Latenz und Fehlern"""
+
+    latency_ms: float = 0.0
+    latency_distribution: str = "fixed"
+    latency_sigma: float = 0.5
+    ttft_ms: float = 0.0
+    chunk_rate: float = 0.0
+    response_tokens: int = 40
+    error_rate_429: float = 0.0
+    error_rate_5xx: float = 0.0
+    retry_after: Optional[float] = None
+    seed: int = 0
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._call_counter = itertools.count()
+        self._counter_lock = threading.Lock()
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-persona-chat"
+
+    @property
+    def _identifying_params(self):
+        return {"seed": self.seed, "latency_ms": self.latency_ms,
+                "latency_distribution": self.latency_distribution}
+
+    def _generate(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs) -> ChatResult:
+        plan = self._plan_call(messages)
+        time.sleep(plan["latency"])
+        self._raise_planned_error(plan)
+        return self._build_result(plan)
+
+    async def _agenerate(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs) -> ChatResult:
+        plan = self._plan_call(messages)
+        await asyncio.sleep(plan["latency"])
+        self._raise_planned_error(plan)
+        return self._build_result(plan)
+
+    def _stream(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs) -> Iterator[ChatGenerationChunk]:
+        plan = self._plan_call(messages)
+        time.sleep(plan["ttft"])
+        self._raise_planned_error(plan)
+        for index, chunk_text in enumerate(plan["chunks"]):
+            if index:
+                time.sleep(plan["chunk_delay"])
+            chunk = self._build_chunk(plan, index, chunk_text)
+            if run_manager:
+                run_manager.on_llm_new_token(chunk_text, chunk=chunk)
+            yield chunk
+
+    async def _astream(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs) -> AsyncIterator[ChatGenerationChunk]:
+        plan = self._plan_call(messages)
+        await asyncio.sleep(plan["ttft"])
+        self._raise_planned_error(plan)
+        for index, chunk_text in enumerate(plan["chunks"]):
+            if index:
+                await asyncio.sleep(plan["chunk_delay"])
+            chunk = self._build_chunk(plan, index, chunk_text)
+            if run_manager:
+                await run_manager.on_llm_new_token(chunk_text, chunk=chunk)
+            yield chunk
+
+    def _plan_call(self, messages: List[BaseMessage]):
+        """Legt Antwort, Latenz und evtl. Fehler eines Aufrufs deterministisch fest"""
+        prompt = "\n".join(str(message.content) for message in messages)
+        prompt_digest = hashlib.sha256(prompt.encode('utf-8')).digest()
+        prompt_seed = int.from_bytes(prompt_digest[:8], 'big')
+
+        # Antworttext hängt nur von Eingabe und Seed ab...
+        text_rng = random.Random(prompt_seed ^ self.seed)
+        words = [text_rng.choice(_WORDS) for _ in range(self.response_tokens)]
+
+        # ...Latenz und Fehler zusätzlich vom Aufruf-Zähler, damit Wiederholungen
+        # nicht zwangsläufig wieder scheitern
+        with self._counter_lock:
+            call_index = next(self._call_counter)
+        call_rng = random.Random(prompt_seed ^ self.seed ^ (call_index * 0x9E3779B97F4A7C15))
+
+        chunks = [word + " " for word in words[:-1]] + [words[-1] + "."]
+
+        # Beim Streaming gilt dieselbe Gesamtlatenz wie bei invoke: ohne TTFT
+        # kommt alles vor dem ersten Token, sonst verteilt sich der Rest auf
+        # die Abstände zwischen den Chunks (plus Chunk-Rate)
+        total_latency = self._sample_latency(call_rng)
+        ttft = min(self.ttft_ms / 1000.0, total_latency) if self.ttft_ms else total_latency
+        if len(chunks) < 2:
+            ttft = total_latency
+        chunk_delay = (total_latency - ttft) / max(1, len(chunks) - 1)
+        if self.chunk_rate:
+            chunk_delay += 1.0 / self.chunk_rate
+
+        error = None
+        roll = call_rng.random()
+        if roll < self.error_rate_429:
+            error = (429, "Rate limit exceeded (simulated)")
+        elif roll < self.error_rate_429 + self.error_rate_5xx:
+            error = (503, "Service unavailable (simulated)")
+
+        return {
+            "text": "".join(chunks),
+            "chunks": chunks,
+            "latency": total_latency,
+            "ttft": ttft,
+            "chunk_delay": chunk_delay,
+            "input_tokens": max(1, len(prompt) // 4),
+            "output_tokens": len(words),
+            "error": error
+        }
+
+    def _sample_latency(self, rng: random.Random) -> float:
+        """Zieht eine Gesamtlatenz in Sekunden aus der konfigurierten Verteilung"""
+        median = self.latency_ms / 1000.0
+        if median <= 0:
+            return 0.0
+        if self.latency_distribution == "lognormal":
+            return rng.lognormvariate(0.0, self.latency_sigma) * median
+        if self.latency_distribution == "heavy_tail":
+            # Pareto: die meisten Aufrufe nahe am Median, wenige sehr langsame
+            alpha = self.latency_sigma if self.latency_sigma > 1 else 1.5
+            return rng.paretovariate(alpha) * median / (2 ** (1 / alpha))
+        return median
+
+    def _raise_planned_error(self, plan):
+        """Wirft den für diesen Aufruf geplanten Fehler"""
+        if plan["error"] is None:
+            return
+        status_code, message = plan["error"]
+        headers = {}
+        if status_code == 429 and self.retry_after is not None:
+            headers["retry-after"] = str(self.retry_after)
+        raise FakeLLMError(status_code, message, headers)
+
+    def _usage(self, plan):
+        return {
+            "input_tokens": plan["input_tokens"],
+            "output_tokens": plan["output_tokens"],
+            "total_tokens": plan["input_tokens"] + plan["output_tokens"]
+        }
+
+    def _build_result(self, plan) -> ChatResult:
+        message = AIMessage(content=plan["text"], usage_metadata=self._usage(plan))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _build_chunk(self, plan, index, chunk_text) -> ChatGenerationChunk:
+        # Token-Zählung wie bei OpenAI-Streams: nur im letzten Chunk
+        is_last = index == len(plan["chunks"]) - 1
+        message = AIMessageChunk(content=chunk_text,
+                                 usage_metadata=self._usage(plan) if is_last else None)
+        return ChatGenerationChunk(message=message)
+
+
+def create_fake_chat_model(**overrides) -> FakeChatModel:
+    """
+    Erstellt ein FakeChatModel mit Werten aus der .env (überschreibbar per Argument)
+
+    Args:
+        **overrides: Felder von FakeChatModel, z.B. latency_ms=200
+
+    Returns:
+        FakeChatModel-Instanz
+    """
+    retry_after = os.getenv('FAKE_LLM_RETRY_AFTER')
+    settings = {
+        "latency_ms": float(os.getenv('FAKE_LLM_LATENCY_MS', 0)),
+        "latency_distribution": os.getenv('FAKE_LLM_LATENCY_DIST', 'fixed'),
+        "latency_sigma": float(os.getenv('FAKE_LLM_LATENCY_SIGMA', 0.5)),
+        "ttft_ms": float(os.getenv('FAKE_LLM_TTFT_MS', 0)),
+        "chunk_rate": float(os.getenv('FAKE_LLM_CHUNK_RATE', 0)),
+        "response_tokens": int(os.getenv('FAKE_LLM_RESPONSE_TOKENS', 40)),
+        "error_rate_429": float(os.getenv('FAKE_LLM_429_RATE', 0)),
+        "error_rate_5xx": float(os.getenv('FAKE_LLM_5XX_RATE', 0)),
+        "retry_after": float(retry_after) if retry_after else None,
+        "seed": int(os.getenv('FAKE_LLM_SEED', 0)),
+    }
+    settings.update(overrides)
+    if settings["latency_distribution"] not in LATENCY_DISTRIBUTIONS:
+        raise ValueError(f"Unbekannte Latenz-Verteilung: {settings['latency_distribution']} "
+                         f"(erlaubt: {', '.join(LATENCY_DISTRIBUTIONS)})")
+    return FakeChatModel(**settings)
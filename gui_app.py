@@ -11,12 +11,19 @@ Usage:
 import streamlit as st
 import json
 import time
-import datetime
+import hashlib
+import io
 import os
+import secrets
 from typing import Dict, List, Optional
 
 # Import our core functionality
-from agents import create_personas, validate_api_key
+from persona_registry import get_persona_registry
+from llm_clients import ClientPool, ClientPoolRegistry, get_llm_provider
+from response_cache import open_response_cache
+from interview import InterviewSession
+from results_model import InterviewResult
+from interview_jobs import JobRegistry, JOB_QUEUED, JOB_DONE, JOB_FAILED, JOB_CANCELLED
 
 
 def init_streamlit_config():
@@ -89,15 +96,27 @@ def init_streamlit_config():
     """, unsafe_allow_html=True)
 
 
+@st.cache_resource
+def get_cached_persona_registry():
+    """Persona-Registry - wird einmal pro Server-Prozess geladen, nicht bei jedem Rerun"""
+    return get_persona_registry()
+
+
+@st.cache_resource
+def get_cached_response_cache():
+    """Antwort-Cache (nur wenn RESPONSE_CACHE gesetzt ist), einmal pro Server-Prozess geöffnet"""
+    return open_response_cache()
+
+
 def get_available_agents() -> List[str]:
     """
     Gibt eine Liste der verfügbaren Agenten-Namen zurück
+    Liest nur den Persona-Katalog - es werden keine Sprachmodelle erstellt
     """
     try:
-        personas = create_personas()
-        return [persona.name for persona in personas]
+        return get_cached_persona_registry().names()
     except Exception:
-        # Fallback zu Standard-Agenten wenn create_personas fehlschlägt
+        # Fallback zu Standard-Agenten wenn der Persona-Katalog nicht lesbar ist
         return ["Anna", "Tom", "Julia"]
 
 
@@ -125,11 +144,53 @@ def validate_api_key_gui(api_key: str) -> bool:
     return True
 
 
-def set_api_key_environment(api_key: str):
+def is_client_pool_in_use(pool: ClientPool) -> bool:
+    """True solange ein laufender Interview-Job den Pool benutzt"""
+    return any(not job.is_finished() and job.session.client_pool is pool
+               for job in get_job_registry().list_jobs())
+
+
+@st.cache_resource
+def get_client_pool_registry() -> ClientPoolRegistry:
+    """
+    Prozessweite Verwaltung der Client-Pools aller Browser-Sessions
+    
+    Pools verlassener Sessions (CLIENT_POOL_IDLE_SECONDS ohne Nutzung) werden
+    samt Verbindungen und Event-Loop-Thread geschlossen, sobald kein Job sie mehr braucht.
+    """
+    return ClientPoolRegistry(is_busy=is_client_pool_in_use)
+
+
+def get_session_client_pool() -> ClientPool:
+    """
+    Gibt den eigenen LLM-Client-Pool dieser Browser-Session zurück
+    
+    Jede Session bekommt ihre eigenen Verbindungen und ihren eigenen API-Schlüssel -
+    nichts wird über Prozess-Umgebungsvariablen geteilt, daher können viele
+    Sessions gleichzeitig Interviews auf einem Server-Prozess laufen lassen.
+    """
+    return get_client_pool_registry().get(get_session_owner_token())
+
+
+def get_session_interview_session(api_key: str) -> InterviewSession:
     """
-    Setzt den API-Schlüssel als Umgebungsvariable für die aktuelle Session
+    Gibt die InterviewSession dieser Browser-Session zurück
+    
+    Der API-Schlüssel wird nur beim ersten Interview (oder nach einem Wechsel)
+    geprüft, gebaute Personas werden von späteren Interviews wiederverwendet.
+    Nach einem Schlüsselwechsel wird der alte Pool geschlossen (nach laufenden Jobs).
     """
-    os.environ['OPENROUTER_API_KEY'] = api_key
+    session = st.session_state.get('interview_session')
+    if session is not None and session.api_key != api_key:
+        get_client_pool_registry().discard(get_session_owner_token())
+        session = None
+    client_pool = get_session_client_pool()
+    # Ein abgelaufener Pool wurde geschlossen - dann neu aufbauen
+    if session is None or session.client_pool is not client_pool:
+        session = InterviewSession(api_key=api_key, client_pool=client_pool,
+                                   response_cache=get_cached_response_cache())
+        st.session_state['interview_session'] = session
+    return session
 
 
 def show_persona_cards():
@@ -175,53 +236,70 @@ def show_persona_cards():
         """, unsafe_allow_html=True)
 
 
-def load_questions_from_file(uploaded_file) -> List[str]:
-    """Lädt Fragen aus einer hochgeladenen JSON-Datei"""
+@st.cache_data
+def parse_questions(content: bytes):
+    """
+    Parst den Inhalt einer Fragen-Datei
+    Zwischengespeichert nach Dateiinhalt - ein Rerun parst dieselbe Datei nicht erneut
+    
+    Returns:
+        Tuple (Liste der Fragen, Fehlermeldung oder None)
+    """
     try:
-        content = uploaded_file.read()
         data = json.loads(content)
-        
-        # Handle different JSON structures
-        if 'questions' in data:
-            return data['questions']
-        elif isinstance(data, list):
-            return data
-        else:
-            st.error("❌ Ungültiges JSON-Format. Datei muss 'questions' Array enthalten.")
-            return []
     except json.JSONDecodeError:
-        st.error("❌ Fehler beim Lesen der JSON-Datei. Bitte überprüfen Sie das Format.")
-        return []
+        return [], "❌ Fehler beim Lesen der JSON-Datei. Bitte überprüfen Sie das Format."
+    
+    # Handle different JSON structures
+    if isinstance(data, dict) and 'questions' in data:
+        return data['questions'], None
+    elif isinstance(data, list):
+        return data, None
+    else:
+        return [], "❌ Ungültiges JSON-Format. Datei muss 'questions' Array enthalten."
+
+
+def load_questions_from_file(uploaded_file) -> List[str]:
+    """Lädt Fragen aus einer hochgeladenen JSON-Datei"""
+    try:
+        questions, error_message = parse_questions(uploaded_file.getvalue())
+        if error_message:
+            st.error(error_message)
+        return questions
     except Exception as e:
         st.error(f"❌ Fehler beim Laden der Datei: {e}")
         return []
 
 
-def display_chat_message(agent_name: str, message: str, is_typing: bool = False):
-    """Zeigt eine Chat-Nachricht im WhatsApp-ähnlichen Stil"""
+def get_chat_style(agent_name: str):
+    """Gibt CSS-Klasse und Emoji für die Chat-Bubble eines Agenten zurück"""
     agent_lower = agent_name.lower()
     
-    if is_typing:
-        st.markdown(f'<div class="typing-indicator">💭 {agent_name} tippt...</div>', 
-                   unsafe_allow_html=True)
-        time.sleep(1)  # Simulate typing delay
-        return
-    
-    # Choose message style based on agent
     if agent_lower == "anna":
-        css_class = "anna-message"
-        emoji = "🌱"
+        return "anna-message", "🌱"
     elif agent_lower == "tom":
-        css_class = "tom-message"
-        emoji = "🏃‍♂️"
+        return "tom-message", "🏃‍♂️"
     elif agent_lower == "julia":
-        css_class = "julia-message"
-        emoji = "👨‍👩‍👧‍👦"
+        return "julia-message", "👨‍👩‍👧‍👦"
     else:
-        css_class = "chat-message"
-        emoji = "🤖"
+        return "chat-message", "🤖"
+
+
+def render_chat_message(target, agent_name: str, message: str, is_typing: bool = False):
+    """
+    Rendert eine Chat-Nachricht in ein Streamlit-Element (z.B. st oder st.empty())
     
-    st.markdown(f"""
+    Mit einem Platzhalter als target kann dieselbe Bubble beliebig oft
+    aktualisiert werden - so erscheinen gestreamte Tokens direkt im Chat.
+    """
+    if is_typing:
+        target.markdown(f'<div class="typing-indicator">💭 {agent_name} tippt...</div>', 
+                        unsafe_allow_html=True)
+        return
+    
+    css_class, emoji = get_chat_style(agent_name)
+    
+    target.markdown(f"""
     <div class="chat-message {css_class}">
         <strong>{emoji} {agent_name}:</strong><br>
         {message}
@@ -229,6 +307,11 @@ def display_chat_message(agent_name: str, message: str, is_typing: bool = False)
     """, unsafe_allow_html=True)
 
 
+def display_chat_message(agent_name: str, message: str, is_typing: bool = False):
+    """Zeigt eine Chat-Nachricht im WhatsApp-ähnlichen Stil"""
+    render_chat_message(st, agent_name, message, is_typing)
+
+
 def display_question(question: str, question_num: int):
     """Zeigt eine Frage als hervorgehobene Bubble"""
     st.markdown(f"""
@@ -238,253 +321,287 @@ def display_question(question: str, question_num: int):
     """, unsafe_allow_html=True)
 
 
-def run_chat_interview(questions: List[str], selected_agents: List[str]):
-    """Führt das Interview im Chat-Format durch"""
-    try:
-        if not questions:
-            st.warning("⚠️ Keine Fragen gefunden!")
-            return None
-        
-        if not selected_agents:
-            st.warning("⚠️ Keine Agenten ausgewählt!")
-            return None
-        
-        # Initialize personas with error handling
-        try:
-            all_personas = create_personas()
-        except Exception as e:
-            st.error(f"❌ Fehler beim Erstellen der Personas: {str(e)}")
-            st.info("💡 Bitte überprüfen Sie Ihren API-Schlüssel und die Internetverbindung.")
-            return None
-            
-        personas = [p for p in all_personas if p.name.lower() in [a.lower() for a in selected_agents]]
-        
-        if not personas:
-            st.error("❌ Keine gültigen Personas ausgewählt!")
-            st.info(f"Verfügbare Personas: {[p.name for p in all_personas]}")
-            return None
-        
-        # Container for chat messages
-        chat_container = st.container()
-        
-        # Initialize interview results
-        interview_results = {
-            "timestamp": datetime.datetime.now().isoformat(),
-            "agents": [],
-            "questions_and_answers": []
-        }
-        
-        # Safely get agent info
+@st.cache_resource
+def get_job_registry():
+    """Prozessweite Job-Registry - Interviews laufen im Hintergrund weiter, auch über Reruns"""
+    return JobRegistry()
+
+
+def get_job_poll_interval() -> float:
+    """Wie oft (in Sekunden) die Seite laufende Jobs abfragt"""
+    return float(os.getenv('GUI_JOB_POLL_INTERVAL', 0.5))
+
+
+def get_session_owner_token() -> str:
+    """
+    Gibt das geheime Token dieser Browser-Session zurück, mit dem sie ihre Jobs besitzt
+    
+    Nach einem Browser-Refresh (neue Streamlit-Session) kommt es aus der URL
+    (?owner=...) zurück - ohne passendes Token lässt sich kein Job anhängen.
+    """
+    owner = st.session_state.get('job_owner')
+    if owner is None:
         try:
-            interview_results["agents"] = [p.get_agent_info() for p in personas]
-        except Exception as e:
-            st.warning(f"⚠️ Warnung beim Laden der Agent-Informationen: {str(e)}")
-            interview_results["agents"] = [{"name": p.name, "error": "Info nicht verfügbar"} for p in personas]
-        
-        # Progress bar
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-    except Exception as e:
-        st.error(f"❌ Unerwarteter Fehler beim Initialisieren des Interviews: {str(e)}")
-        st.info("💡 Bitte versuchen Sie es erneut oder kontaktieren Sie den Support.")
+            owner = st.query_params.get("owner")
+        except Exception:
+            owner = None
+        owner = owner or secrets.token_urlsafe(24)
+        st.session_state['job_owner'] = owner
+    return owner
+
+
+def get_session_job_ids() -> List[str]:
+    """
+    Gibt die Job-IDs dieser Session zurück
+    Nach einem Browser-Refresh wird der Job aus der URL (?job=...) wieder angehängt -
+    aber nur, wenn er dieser Session gehört (Token aus ?owner=...)
+    """
+    job_ids = st.session_state.setdefault('job_ids', [])
+    try:
+        url_job_id = st.query_params.get("job")
+    except Exception:
+        url_job_id = None
+    if (url_job_id and url_job_id not in job_ids
+            and get_job_registry().get_owned(url_job_id, get_session_owner_token())):
+        job_ids.append(url_job_id)
+    return job_ids
+
+
+def start_chat_interview(questions: List[str], selected_agents: List[str], api_key: str) -> Optional[str]:
+    """
+    Startet das Interview als Hintergrund-Job mit den Zugangsdaten dieser Session
+    
+    Returns:
+        Die Job-ID oder None bei Fehler
+    """
+    if not questions:
+        st.warning("⚠️ Keine Fragen gefunden!")
+        return None
+    
+    if not selected_agents:
+        st.warning("⚠️ Keine Agenten ausgewählt!")
+        return None
+    
+    registry = get_cached_persona_registry()
+    unknown_agents = [a for a in selected_agents if a not in registry]
+    if unknown_agents:
+        st.error("❌ Keine gültigen Personas ausgewählt!")
+        st.info(f"Verfügbare Personas: {registry.names()}")
         return None
     
+    # Sitzung mit Zugangsdaten und Client-Pool dieser Browser-Session (Antwort-Cache nur mit RESPONSE_CACHE)
     try:
-        total_steps = len(questions) * len(personas)
-        current_step = 0
-        
-        with chat_container:
-            st.markdown("### 💬 Live Interview Chat")
-            
-            for q_idx, question in enumerate(questions, 1):
-                try:
-                    # Display question
-                    display_question(question, q_idx)
-                    
-                    # Collect responses for this question
-                    question_data = {
-                        "question": question,
-                        "responses": []
-                    }
-                    
-                    # Each persona responds independently - no cross-contamination
-                    for persona in personas:
-                        try:
-                            # Show typing indicator
-                            status_text.text(f"💭 {persona.name} überlegt...")
-                            display_chat_message(persona.name, "", is_typing=True)
-                            
-                            # Get response WITHOUT other personas' responses for independence
-                            response = persona.respond(question, previous_responses=None)
-                            
-                            # Validate response
-                            if not response or response.strip() == "":
-                                response = f"[{persona.name} konnte nicht antworten]"
-                            
-                            # Display response
-                            display_chat_message(persona.name, response)
-                            
-                            # Store response
-                            response_data = {
-                                "agent_id": persona.name,
-                                "response": response,
-                                "status": "success"
-                            }
-                            question_data["responses"].append(response_data)
-                            # Note: We don't add to previous_responses to maintain independence
-                            
-                        except Exception as e:
-                            error_msg = f"❌ Fehler bei {persona.name}: {str(e)}"
-                            st.error(f"Fehler bei Persona {persona.name}: {str(e)}")
-                            display_chat_message(persona.name, f"[Entschuldigung, ich kann momentan nicht antworten: {str(e)}]")
-                            
-                            question_data["responses"].append({
-                                "agent_id": persona.name,
-                                "response": error_msg,
-                                "status": "error",
-                                "error_details": str(e)
-                            })
-                        
-                        # Update progress
-                        current_step += 1
-                        try:
-                            progress_bar.progress(current_step / total_steps)
-                        except:
-                            pass  # Continue even if progress update fails
-                        
-                        # Small delay between responses
-                        time.sleep(0.5)
-                    
-                    interview_results["questions_and_answers"].append(question_data)
-                    
-                    # Add separator between questions
-                    if q_idx < len(questions):
-                        st.markdown("---")
-                        
-                except Exception as e:
-                    st.error(f"❌ Fehler bei Frage {q_idx}: {str(e)}")
-                    # Continue with next question
-                    continue
-                    
-    except Exception as e:
-        st.error(f"❌ Schwerwiegender Fehler während des Interviews: {str(e)}")
-        st.info("💡 Das Interview wurde unterbrochen. Versuchen Sie es bitte erneut.")
+        session = get_session_interview_session(api_key)
+    except ValueError as e:
+        st.error(f"❌ {e}")
         return None
+    owner = get_session_owner_token()
+    job = get_job_registry().submit(questions, selected_agents, session, owner=owner)
     
-    # Interview completed successfully
-    status_text.text("✅ Interview abgeschlossen!")
-    progress_bar.progress(1.0)
+    get_session_job_ids().append(job.id)
+    try:
+        st.query_params["job"] = job.id
+        st.query_params["owner"] = owner
+    except Exception:
+        pass  # Older Streamlit versions: job survives reruns, but not a browser refresh
     
-    return interview_results
+    return job.id
 
 
-def create_download_files(results: Dict):
-    """Erstellt Download-Dateien für die Ergebnisse"""
-    try:
-        if not results:
-            return None, None
-        
-        # JSON file
-        try:
-            json_content = json.dumps(results, indent=2, ensure_ascii=False)
-            json_bytes = json_content.encode('utf-8')
-        except Exception as e:
-            st.error(f"❌ Fehler beim Erstellen der JSON-Datei: {str(e)}")
-            json_bytes = None
+def render_chat_interview(snapshot: Dict):
+    """Zeigt den aktuellen Stand eines Interview-Jobs im Chat-Format"""
+    st.markdown("### 💬 Live Interview Chat")
+    
+    total_steps = max(snapshot["total_steps"], 1)
+    st.progress(min(snapshot["completed_steps"] / total_steps, 1.0))
+    
+    if snapshot["status"] == JOB_QUEUED:
+        st.info("⏳ Interview wartet auf einen freien Worker...")
+    elif snapshot["current_agent"]:
+        st.text(f"💭 {snapshot['current_agent']} überlegt...")
+    
+    qa_list = snapshot["results"]["interview_data"]
+    for q_idx, question_data in enumerate(qa_list, 1):
+        display_question(question_data["question"], q_idx)
         
-        # Markdown file
-        try:
-            md_content = create_markdown_report(results)
-            md_bytes = md_content.encode('utf-8')
-        except Exception as e:
-            st.error(f"❌ Fehler beim Erstellen der Markdown-Datei: {str(e)}")
-            md_bytes = None
+        for response in question_data["responses"]:
+            if response.get("status") == "error":
+                st.error(f"Fehler bei Persona {response['agent_id']}: {response['response']}")
+                display_chat_message(response["agent_id"],
+                                     "[Entschuldigung, ich kann momentan nicht antworten]")
+            else:
+                display_chat_message(response["agent_id"], response["response"])
         
-        return json_bytes, md_bytes
+        # Answer that is currently being streamed
+        if snapshot["current_agent"] and snapshot["current_question_index"] == q_idx - 1:
+            if snapshot["partial_response"]:
+                display_chat_message(snapshot["current_agent"], snapshot["partial_response"] + " ▌")
+            else:
+                display_chat_message(snapshot["current_agent"], "", is_typing=True)
         
-    except Exception as e:
-        st.error(f"❌ Unerwarteter Fehler beim Erstellen der Download-Dateien: {str(e)}")
-        return None, None
+        # Add separator between questions
+        if q_idx < len(snapshot["questions"]):
+            st.markdown("---")
+    
+    if snapshot["status"] == JOB_DONE:
+        st.success("🎉 Interview erfolgreich abgeschlossen!")
+    elif snapshot["status"] == JOB_CANCELLED:
+        st.warning("⚠️ Interview abgebrochen")
+    elif snapshot["status"] == JOB_FAILED:
+        st.error(f"❌ Interview fehlgeschlagen: {snapshot['error']}")
+        st.info("💡 Bitte überprüfen Sie Ihren API-Schlüssel und versuchen Sie es erneut.")
 
 
-def create_markdown_report(results: Dict) -> str:
-    """Erstellt einen Markdown-Bericht"""
-    try:
-        timestamp = results.get("timestamp", "Unknown")
+def show_interview_job(job_id: str):
+    """
+    Zeigt einen Interview-Job an und fragt ihn ab, solange er läuft
+    
+    Mit st.fragment wird nur dieser Bereich neu gezeichnet; ältere
+    Streamlit-Versionen fallen auf einen Rerun der ganzen Seite zurück.
+    """
+    job = get_job_registry().get_owned(job_id, get_session_owner_token())
+    if job is None:
+        st.warning("⚠️ Dieses Interview ist nicht mehr verfügbar.")
+        return
+    
+    def job_view():
+        snapshot = job.snapshot()
+        render_chat_interview(snapshot)
+        
+        if not job.is_finished():
+            if st.button("⏹️ Interview abbrechen", key=f"cancel_{job.id}"):
+                job.cancel()
+        elif job_is_polling:
+            # Polling beenden und Downloads anzeigen
+            st.rerun()
         
-        md_content = f"""# Synthetische Interview Ergebnisse
+        if snapshot["status"] == JOB_DONE:
+            store_interview_results(job.id, snapshot["results"])
+    
+    job_is_polling = not job.is_finished()
+    
+    if hasattr(st, "fragment"):
+        run_every = get_job_poll_interval() if job_is_polling else None
+        st.fragment(job_view, run_every=run_every)()
+    else:
+        job_view()
+        if job_is_polling:
+            time.sleep(get_job_poll_interval())
+            st.rerun()
 
-**Zeitstempel:** {timestamp}
 
-## Teilnehmer
+def store_interview_results(job_id: str, results: Dict):
+    """Speichert die Ergebnisse eines fertigen Jobs einmalig für die Downloads"""
+    if st.session_state.get('interview_results_job') != job_id:
+        st.session_state['interview_results'] = results
+        st.session_state['interview_results_hash'] = get_results_hash(results)
+        st.session_state['interview_results_job'] = job_id
 
-"""
-        
-        # Safe agent processing
-        agents = results.get("agents", [])
-        if agents:
-            for agent in agents:
-                try:
-                    name = agent.get('name', 'Unbekannt')
-                    age = agent.get('age', 'Unbekannt')
-                    characteristics = agent.get('characteristics', 'Keine Angaben')
-                    md_content += f"- **{name}** ({age} Jahre): {characteristics}\n"
-                except Exception as e:
-                    md_content += f"- **Fehler beim Laden der Agent-Info**: {str(e)}\n"
-        else:
-            md_content += "- Keine Agenten-Informationen verfügbar\n"
-        
-        md_content += "\n## Interview Fragen & Antworten\n\n"
-        
-        # Safe Q&A processing
-        qa_list = results.get("questions_and_answers", [])
-        if qa_list:
-            for i, qa in enumerate(qa_list, 1):
-                try:
-                    question = qa.get('question', 'Frage nicht verfügbar')
-                    md_content += f"### Frage {i}: {question}\n\n"
-                    
-                    responses = qa.get("responses", [])
-                    if responses:
-                        for response in responses:
-                            try:
-                                agent_id = response.get('agent_id', 'Unbekannter Agent')
-                                answer = response.get('response', 'Antwort nicht verfügbar')
-                                status = response.get('status', 'unknown')
-                                
-                                if status == 'error':
-                                    md_content += f"**{agent_id}:** ❌ {answer}\n\n"
-                                else:
-                                    md_content += f"**{agent_id}:** {answer}\n\n"
-                            except Exception as e:
-                                md_content += f"**Fehler beim Verarbeiten der Antwort:** {str(e)}\n\n"
-                    else:
-                        md_content += "*Keine Antworten für diese Frage*\n\n"
-                    
-                    md_content += "---\n\n"
-                except Exception as e:
-                    md_content += f"### Frage {i}: Fehler beim Verarbeiten ({str(e)})\n\n---\n\n"
-        else:
-            md_content += "*Keine Fragen und Antworten verfügbar*\n\n"
-        
-        return md_content
-        
+
+def get_results_hash(results: Dict) -> str:
+    """Inhalts-Hash der Ergebnisse - Schlüssel für die zwischengespeicherten Downloads"""
+    content = json.dumps(results, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+@st.cache_data(max_entries=16)
+def get_download_payloads(results_hash: str, _results: Dict):
+    """
+    Erstellt die Download-Dateien einmal pro Ergebnis-Inhalt
+    
+    Streamlit ignoriert Parameter mit Unterstrich beim Hashen - der Cache-Schlüssel
+    ist nur results_hash, die (evtl. großen) Ergebnisse werden nicht bei jedem
+    Rerun erneut gehasht oder serialisiert.
+    """
+    return create_download_files(_results)
+
+
+def create_download_files(results: Dict):
+    """
+    Erstellt Download-Dateien für die Ergebnisse
+    
+    Gleiche Formate wie die CLI (siehe results_model.py): JSON, Markdown und
+    das spaltenorientierte NumPy-Archiv für Auswertungen.
+    """
+    if not results:
+        return None, None, None
+    
+    try:
+        result = InterviewResult.from_dict(results)
+    except Exception as e:
+        st.error(f"❌ Ergebnisse können nicht gelesen werden: {str(e)}")
+        return None, None, None
+    
+    payloads = []
+    for output_format, label in (("json", "JSON"), ("md", "Markdown")):
+        try:
+            payloads.append(result.to_report(output_format).encode('utf-8'))
+        except Exception as e:
+            st.error(f"❌ Fehler beim Erstellen der {label}-Datei: {str(e)}")
+            payloads.append(None)
+    
+    try:
+        npz_buffer = io.BytesIO()
+        result.save_npz(npz_buffer)
+        payloads.append(npz_buffer.getvalue())
     except Exception as e:
-        error_report = f"""# Interview Ergebnisse - Fehler beim Generieren
+        st.error(f"❌ Fehler beim Erstellen der NPZ-Datei: {str(e)}")
+        payloads.append(None)
+    
+    return tuple(payloads)
 
-**Fehler:** {str(e)}
-**Zeitstempel:** {datetime.datetime.now().isoformat()}
 
-Es trat ein Fehler beim Generieren des Berichts auf. Die Rohdaten könnten trotzdem verfügbar sein.
-"""
-        return error_report
+def show_download_section(results: Dict, results_hash: str):
+    """Zeigt die Download-Buttons für die zuletzt erstellten Ergebnisse"""
+    st.markdown("### 📥 Ergebnisse herunterladen")
+    
+    json_bytes, md_bytes, npz_bytes = get_download_payloads(results_hash, results)
+    file_timestamp = results.get("timestamp", "")[:19].replace("-", "").replace(":", "").replace("T", "_")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if json_bytes:
+            st.download_button(
+                label="📄 JSON herunterladen",
+                data=json_bytes,
+                file_name=f"interview_results_{file_timestamp}.json",
+                mime="application/json"
+            )
+        else:
+            st.error("❌ JSON-Download nicht verfügbar")
+    
+    with col2:
+        if md_bytes:
+            st.download_button(
+                label="📝 Markdown herunterladen",
+                data=md_bytes,
+                file_name=f"interview_results_{file_timestamp}.md",
+                mime="text/markdown"
+            )
+        else:
+            st.error("❌ Markdown-Download nicht verfügbar")
+    
+    with col3:
+        if npz_bytes:
+            st.download_button(
+                label="📊 NPZ herunterladen",
+                data=npz_bytes,
+                file_name=f"interview_results_{file_timestamp}.npz",
+                mime="application/octet-stream",
+                help="Spaltenorientiert (NumPy) - lädt für Auswertungen in Millisekunden"
+            )
+        else:
+            st.error("❌ NPZ-Download nicht verfügbar")
 
 
 def main():
     """Hauptfunktion der Streamlit App"""
     init_streamlit_config()
     
+    # Client-Pools verlassener Sessions freigeben
+    get_client_pool_registry().close_idle()
+    
     # Header
     st.title("🎤 AI Persona Chat Interview")
     st.markdown("**Interaktive Marktforschung mit AI-Personas im Chat-Format**")
@@ -510,11 +627,12 @@ def main():
         
         # API Key validation and status
         api_key_valid = False
-        if api_key_input:
+        if get_llm_provider() == "fake":
+            st.info("🧪 Offline-Modus (LLM_PROVIDER=fake) - kein API-Schlüssel nötig")
+            api_key_valid = True
+        elif api_key_input:
             if validate_api_key_gui(api_key_input):
                 st.success("✅ API-Schlüssel gültig")
-                # Set API key in environment for this session only
-                set_api_key_environment(api_key_input)
                 # Store in session state only for the current session, cleared on refresh
                 st.session_state.api_key = api_key_input
                 api_key_valid = True
@@ -631,59 +749,9 @@ def main():
         help="Alle Voraussetzungen müssen erfüllt sein: API-Schlüssel, Fragen und Personas"
     ):
         try:
-            # Ensure API key is set in environment before starting
-            # Use the current API key input since we don't persist it across refreshes
-            if api_key_input and api_key_valid:
-                set_api_key_environment(api_key_input)
-            elif 'api_key' in st.session_state:
-                set_api_key_environment(st.session_state.api_key)
+            # Pass this session's API key explicitly - never via os.environ
+            start_chat_interview(questions, selected_agents, api_key_input)
             
-            with st.spinner("🔄 Interview wird gestartet..."):
-                results = run_chat_interview(questions, selected_agents)
-                
-                if results:
-                    st.success("🎉 Interview erfolgreich abgeschlossen!")
-                    
-                    # Store results in session state for download
-                    st.session_state['interview_results'] = results
-                    
-                    # Download section
-                    st.markdown("### 📥 Ergebnisse herunterladen")
-                    
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        try:
-                            json_bytes, md_bytes = create_download_files(results)
-                            if json_bytes:
-                                st.download_button(
-                                    label="📄 JSON herunterladen",
-                                    data=json_bytes,
-                                    file_name=f"interview_results_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                                    mime="application/json"
-                                )
-                            else:
-                                st.error("❌ JSON-Download nicht verfügbar")
-                        except Exception as e:
-                            st.error(f"❌ Fehler beim Erstellen des JSON-Downloads: {str(e)}")
-                    
-                    with col2:
-                        try:
-                            if 'json_bytes' in locals() and 'md_bytes' in locals() and md_bytes:
-                                st.download_button(
-                                    label="📝 Markdown herunterladen",
-                                    data=md_bytes,
-                                    file_name=f"interview_results_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
-                                    mime="text/markdown"
-                                )
-                            else:
-                                st.error("❌ Markdown-Download nicht verfügbar")
-                        except Exception as e:
-                            st.error(f"❌ Fehler beim Erstellen des Markdown-Downloads: {str(e)}")
-                else:
-                    st.error("❌ Interview fehlgeschlagen oder abgebrochen")
-                    st.info("💡 Bitte überprüfen Sie Ihren API-Schlüssel und versuchen Sie es erneut.")
-                    
         except Exception as e:
             st.error(f"❌ Kritischer Fehler beim Starten des Interviews: {str(e)}")
             st.info("💡 Bitte laden Sie die Seite neu und versuchen Sie es erneut.")
@@ -691,15 +759,24 @@ def main():
             # Log error details for debugging (only shown in development)
             if st.secrets.get("DEBUG_MODE", False):
                 st.exception(e)
-                
-                with col2:
-                    if md_bytes:
-                        st.download_button(
-                            label="📝 Markdown herunterladen",
-                            data=md_bytes,
-                            file_name=f"interview_results_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
-                            mime="text/markdown"
-                        )
+    
+    # Interview jobs of this session (keep running in the background across reruns)
+    job_ids = get_session_job_ids()
+    if job_ids:
+        job_id = job_ids[-1]
+        if len(job_ids) > 1:
+            registry = get_job_registry()
+            job_id = st.selectbox(
+                "📂 Interview anzeigen",
+                list(reversed(job_ids)),
+                format_func=lambda j: f"{j} ({registry.get(j).status if registry.get(j) else 'nicht verfügbar'})"
+            )
+        show_interview_job(job_id)
+    
+    # Download section for the last finished interview of this session
+    if 'interview_results' in st.session_state:
+        show_download_section(st.session_state['interview_results'],
+                              st.session_state['interview_results_hash'])
         
     # Footer
     st.markdown("---")
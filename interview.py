@@ -8,10 +8,25 @@ Hauptfunktion: run_interview() - für sowohl CLI als auch programmatische Nutzun
 
 import argparse
 import json
+import os
 import sys
 import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import List, Dict
-from agents import create_personas, PersonaAgent, validate_api_key
+from agents import (create_personas, create_persona_from_spec, PersonaAgent, validate_api_key,
+                    get_max_concurrency, get_ai_model_name)
+from llm_clients import get_client_pool, get_llm_provider, LLM_PROVIDERS
+from response_cache import open_response_cache, CACHE_MODES
+from persona_registry import get_persona_registry, PersonaSpec
+from results_stream import (ResultsStreamWriter, get_response_status, get_stream_path,
+                            write_json_report, write_markdown_report, write_report_from_stream,
+                            ResultsStreamIndex, prepare_resume_stream, get_run_base, to_response_data)
+from results_model import InterviewResult
+from metrics import MetricsCollector, get_metrics_file, write_prometheus_textfile
+from tracing import get_trace_path, trace_span, tracing
+from profiling import print_profile_summary, profiling
 
 # Windows console encoding fix
 if sys.platform.startswith('win'):
@@ -26,14 +41,59 @@ class InterviewManager:
     Diese Klasse hält alle Personas und führt Interviews durch
     """
     
-    def __init__(self):
-        """Initialisiert den Interview Manager ohne Personas"""
+    def __init__(self, max_concurrency=None, engine="sync", stateless=False, response_cache=None,
+                 api_key=None, client_pool=None, provider=None, results_stream=None,
+                 keep_results=True, model_name=None):
+        """
+        Initialisiert den Interview Manager ohne Personas
+        
+        Args:
+            max_concurrency: Wie viele Personas gleichzeitig antworten dürfen
+                             (Standard: MAX_CONCURRENCY aus der .env, sonst 1)
+            engine: "sync" (Frage für Frage) oder "async" (eine Pipeline pro Persona)
+            stateless: True = Personas antworten ohne eigenen Verlauf,
+                       dann sind alle Fragen voneinander unabhängig
+            response_cache: Optionaler ResponseCache für alle Personas
+            api_key: OpenRouter API-Schlüssel (Standard: OPENROUTER_API_KEY)
+            client_pool: ClientPool der Personas (Standard: prozessweiter Pool)
+            provider: LLM-Anbieter "openrouter" oder "fake" (Standard: LLM_PROVIDER)
+            results_stream: Optionaler ResultsStreamWriter - jede Antwort wird sofort
+                            als JSONL-Checkpoint geschrieben (siehe results_stream.py)
+            keep_results: False = Antworten nicht zusätzlich im Speicher sammeln
+                          (nur mit results_stream sinnvoll, hält den Speicher flach)
+            model_name: Modell aller Personas (Standard: DEFAULT_MODEL)
+        """
         self.personas = []
+        self.max_concurrency = max_concurrency or get_max_concurrency()
+        self.engine = engine
+        self.stateless = stateless
+        self.response_cache = response_cache
+        self.api_key = api_key
+        self.client_pool = client_pool or get_client_pool()
+        # Gewünschte Parallelität nicht erst per AIMD erreichen (RATE_LIMIT_INITIAL_CONCURRENCY)
+        self.client_pool.rate_limiter.request_concurrency(self.max_concurrency)
+        self.provider = provider
+        self.model_name = model_name
+        self.results_stream = results_stream
+        self.keep_results = keep_results or results_stream is None
+        # Gesammelte Antworten in Spalten (siehe results_model.py)
+        self.result = None
+        # Bereits beantwortete Zellen eines fortgesetzten Laufs: {(Frage-Nr., Persona-Name): Antwort}
+        self.completed_cells = {}
+        # Tokens, Latenz, Wiederholungen und Cache-Status aller Aufrufe dieses Managers
+        self.metrics = MetricsCollector()
     
-    def setup_personas(self):
-        """Erstellt und speichert die AI-Personas für das Interview"""
+    def setup_personas(self, names=None):
+        """
+        Erstellt und speichert die AI-Personas für das Interview
+        
+        Args:
+            names: Optionale Liste von Persona-Namen (Standard: alle aus dem Katalog)
+        """
         try:
-            self.personas = create_personas()
+            self.personas = create_personas(response_cache=self.response_cache, names=names,
+                                            api_key=self.api_key, client_pool=self.client_pool,
+                                            provider=self.provider, model_name=self.model_name)
             return True
         except Exception as e:
             print(f"Fehler beim Erstellen der Personas: {e}")
@@ -60,7 +120,11 @@ class InterviewManager:
             Dictionary mit allen Antworten für diese Frage
         """
         print(f"\nFrage {question_number}: {question_text}")
-        
+        with trace_span("question", question_id=question_number):
+            return self._ask_question_to_all(question_number, question_text)
+    
+    def _ask_question_to_all(self, question_number, question_text):
+        """Fragt alle Personas (siehe ask_question_to_all)"""
         # Erstelle ein Datenpaket für diese Frage
         question_results = {
             "question_id": question_number,
@@ -68,29 +132,85 @@ class InterviewManager:
             "responses": []
         }
         
-        # Frage jede Persona einzeln - OHNE vorherige Antworten zu teilen
-        for persona in self.personas:
-            print(f"  {persona.name} antwortet...")
-            
-            # Hole die unabhängige Antwort von der Persona (keine previous_responses)
-            response = persona.respond(question_text, None)
-            
-            # Erstelle ein Datenpaket für diese Antwort
-            response_data = {
-                "agent_id": persona.name,
-                "agent_age": persona.age,
-                "response": response,
-                "timestamp": datetime.datetime.now().isoformat()
-            }
-            
-            # Speichere die Antwort
+        # Frage jede Persona - OHNE vorherige Antworten zu teilen.
+        # Die Personas sind unabhängig, daher können sie parallel antworten;
+        # executor.map liefert die Ergebnisse trotzdem in Persona-Reihenfolge
+        if self.max_concurrency > 1 and len(self.personas) > 1:
+            workers = min(self.max_concurrency, len(self.personas))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                responses = list(executor.map(self._ask_persona, self.personas,
+                                              [question_text] * len(self.personas),
+                                              [question_number] * len(self.personas)))
+        else:
+            responses = [self._ask_persona(persona, question_text, question_number)
+                         for persona in self.personas]
+        
+        for response_data in responses:
+            # Speichere die Antwort (Checkpoint sofort, im Speicher nur bei Bedarf);
+            # wiederhergestellte Antworten stehen schon im Stream
+            if (question_number, response_data['agent_id']) not in self.completed_cells:
+                self._record_response(question_number, question_text, response_data)
+            if self.keep_results:
+                self.result.add_response(question_number, question_text, response_data)
             question_results["responses"].append(response_data)
             
             # Zeige die Antwort an
-            print(f"  {persona.name}: {response}")
+            print(f"  {response_data['agent_id']}: {response_data['response']}")
         
         return question_results
     
+    def _ask_persona(self, persona, question_text, question_number=None):
+        """
+        Holt die unabhängige Antwort einer einzelnen Persona
+        
+        Args:
+            persona: Die befragte PersonaAgent-Instanz
+            question_text: Der Text der Frage
+            question_number: Nummer der Frage (für fortgesetzte Läufe)
+            
+        Returns:
+            Dictionary mit der Antwort und Metadaten
+        """
+        restored = self._restore_cell(persona, question_number, question_text)
+        if restored is not None:
+            return restored
+        
+        print(f"  {persona.name} antwortet...")
+        
+        # Hole die unabhängige Antwort von der Persona (keine previous_responses)
+        with trace_span("respond", persona=persona.name, question_id=question_number):
+            response = persona.respond(question_text, None, use_history=not self.stateless)
+        
+        return {
+            "agent_id": persona.name,
+            "agent_age": persona.age,
+            "response": response,
+            "timestamp": datetime.datetime.now().isoformat(),
+            "status": get_response_status(response)
+        }
+    
+    def _restore_cell(self, persona, question_number, question_text):
+        """
+        Übernimmt eine bereits beantwortete Zelle eines fortgesetzten Laufs
+        
+        Die gespeicherte Antwort wird in den Verlauf der Persona zurückgespielt,
+        damit spätere Fragen denselben Kontext sehen wie im ursprünglichen Lauf.
+        
+        Returns:
+            Das gespeicherte Antwort-Dictionary oder None, wenn die Zelle neu abgefragt wird
+        """
+        record = self.completed_cells.get((question_number, persona.name))
+        if record is None:
+            return None
+        persona.restore_turn(question_text, record["response"])
+        return to_response_data(record)
+    
+    def _record_response(self, question_number, question_text, response_data):
+        """Hängt eine Antwort an den Ergebnis-Stream an (falls vorhanden)"""
+        if self.results_stream is not None:
+            with trace_span("write_response", "report"):
+                self.results_stream.write_response(question_number, question_text, response_data)
+    
     def run_full_interview(self, questions_list):
         """
         Führt ein komplettes Interview mit allen Fragen durch
@@ -101,25 +221,348 @@ class InterviewManager:
         Returns:
             Dictionary mit allen Interview-Ergebnissen
         """
+        if self.engine == "async":
+            # Läuft auf der Event-Loop des Client-Pools, damit die async
+            # Keep-Alive-Verbindungen über Interviews hinweg gültig bleiben
+            return self.client_pool.run_async(self.run_full_interview_async(questions_list))
+        
         # Erstelle das Haupt-Ergebnis-Paket
-        interview_results = {
-            "timestamp": datetime.datetime.now().isoformat(),
-            "agents": [persona.get_agent_info() for persona in self.personas],
-            "interview_data": []
-        }
+        self._create_results_package(questions_list)
         
-        # Gehe durch jede Frage
-        for question_index, question_text in enumerate(questions_list):
-            question_number = question_index + 1  # Menschen zählen ab 1, nicht 0
+        # Gehe durch jede Frage - die Antworten landen in self.result
+        with trace_span("interview", engine="sync", personas=len(self.personas), questions=len(questions_list)):
+            for question_index, question_text in enumerate(questions_list):
+                question_number = question_index + 1  # Menschen zählen ab 1, nicht 0
+                
+                # Stelle die Frage an alle Personas
+                self.ask_question_to_all(question_number, question_text)
             
-            # Stelle die Frage an alle Personas
-            question_results = self.ask_question_to_all(question_number, question_text)
+            self._flush_results_stream()
+        return self.result.to_dict()
+    
+    async def run_full_interview_async(self, questions_list):
+        """
+        Führt ein komplettes Interview mit dem asyncio-Motor durch
+        
+        Innerhalb einer Persona hängt Frage N vom Verlauf bis Frage N-1 ab,
+        verschiedene Personas hängen aber nie voneinander ab. Daher läuft jede
+        Persona als eigene Pipeline, alle Pipelines laufen gleichzeitig unter
+        einem globalen Limit (max_concurrency). Im zustandslosen Modus ist jede
+        Zelle des Fragen × Personas Rasters unabhängig und läuft parallel.
+        
+        Args:
+            questions_list: Liste von Fragen als Strings
             
-            # Speichere die Ergebnisse dieser Frage
-            interview_results["interview_data"].append(question_results)
+        Returns:
+            Dictionary mit allen Interview-Ergebnissen (gleiche Struktur wie run_full_interview)
+        """
+        import asyncio
+
+        self._create_results_package(questions_list)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
         
-        return interview_results
+        async def ask_cell(question_index, persona_index):
+            persona = self.personas[persona_index]
+            question_text = questions_list[question_index]
+            restored = self._restore_cell(persona, question_index + 1, question_text)
+            if restored is not None:
+                if self.keep_results:
+                    self.result.add_response(question_index + 1, question_text, restored)
+                return
+            async with semaphore:
+                with trace_span("respond", persona=persona.name, question_id=question_index + 1):
+                    response = await persona.arespond(question_text, None,
+                                                      use_history=not self.stateless)
+            response_data = {
+                "agent_id": persona.name,
+                "agent_age": persona.age,
+                "response": response,
+                "timestamp": datetime.datetime.now().isoformat(),
+                "status": get_response_status(response)
+            }
+            self._record_response(question_index + 1, question_text, response_data)
+            if self.keep_results:
+                self.result.add_response(question_index + 1, question_text, response_data)
+            print(f"  [Frage {question_index + 1}] {persona.name}: {response}")
+        
+        async def persona_pipeline(persona_index):
+            # Fragen einer Persona nacheinander, damit der Verlauf stimmt
+            for question_index in range(len(questions_list)):
+                await ask_cell(question_index, persona_index)
+        
+        if self.stateless:
+            tasks = [ask_cell(q_idx, p_idx)
+                     for q_idx in range(len(questions_list))
+                     for p_idx in range(len(self.personas))]
+        else:
+            tasks = [persona_pipeline(p_idx) for p_idx in range(len(self.personas))]
+        
+        try:
+            with trace_span("interview", engine="async", personas=len(self.personas),
+                            questions=len(questions_list)):
+                await asyncio.gather(*tasks)
+        finally:
+            self._flush_results_stream()
+        
+        # Antworten kommen in beliebiger Reihenfolge an - InterviewResult
+        # ordnet sie pro Frage wieder in Persona-Reihenfolge
+        return self.result.to_dict()
+    
+    def _create_results_package(self, questions_list=None):
+        """
+        Erstellt das leere InterviewResult für ein Interview (self.result)
+        und schreibt den Kopf des Ergebnis-Streams
+        """
+        questions_list = list(questions_list or [])
+        for persona in self.personas:
+            persona.metrics = self.metrics
+        self.result = InterviewResult(agents=[persona.get_agent_info() for persona in self.personas],
+                                      questions=questions_list if self.keep_results else None)
+        if self.results_stream is not None:
+            self.results_stream.write_header(self.result.agents, questions_list, self.result.timestamp)
+        return self.result
+    
+    def _flush_results_stream(self):
+        """Schreibt gepufferte Antworten des Ergebnis-Streams auf die Platte"""
+        if self.results_stream is not None:
+            self.results_stream.flush()
+    
+
+class InterviewSession:
+    """
+    Wiederverwendbare Interview-Sitzung für die programmatische Nutzung
+    
+    Nimmt Fragen als Liste und Personas als Namen oder PersonaSpecs direkt
+    entgegen - ohne Fragen-Datei. Der API-Schlüssel wird einmal beim Erstellen
+    geprüft, gebaute Personas werden über mehrere Interviews hinweg wiederverwendet.
+    Gleichzeitige Interviews (z.B. aus mehreren Threads) bekommen eigene
+    Persona-Objekte, da jede Persona ihren Verlauf pro Interview führt.
+    
+    Example:
+        session = InterviewSession(personas=["anna", "tom"], provider="fake")
+        results = session.run(["Was ist dir bei Marken wichtig?"])
+    """
+    
+    def __init__(self, personas=None, api_key=None, provider=None, model_name=None,
+                 client_pool=None, response_cache=None, max_concurrency=None,
+                 engine="sync", stateless=False):
+        """
+        Erstellt eine Sitzung und prüft den API-Schlüssel
+        
+        Args:
+            personas: Namen, PersonaSpecs oder Katalog-Dictionaries (Standard: alle aus dem Katalog)
+            api_key: OpenRouter API-Schlüssel (Standard: OPENROUTER_API_KEY)
+            provider: LLM-Anbieter "openrouter" oder "fake" (Standard: LLM_PROVIDER)
+            model_name: Modell aller Personas (Standard: DEFAULT_MODEL)
+            client_pool: ClientPool der Personas (Standard: prozessweiter Pool)
+            response_cache: Optionaler ResponseCache für alle Personas
+            max_concurrency: Wie viele Personas gleichzeitig antworten dürfen
+            engine: "sync" oder "async" (siehe InterviewManager)
+            stateless: True = Personas antworten ohne eigenen Verlauf
+            
+        Raises:
+            ValueError: Bei ungültigem API-Schlüssel oder unbekannter Persona
+        """
+        self.provider = provider or get_llm_provider()
+        if not validate_api_key(api_key, self.provider):
+            raise ValueError("Ungültiger oder fehlender API-Schlüssel")
+        self.api_key = api_key
+        self.model_name = model_name or get_ai_model_name()
+        self.client_pool = client_pool or get_client_pool()
+        self.response_cache = response_cache
+        self.max_concurrency = max_concurrency
+        self.engine = engine
+        self.stateless = stateless
+        self.specs = [self._to_spec(persona) for persona in personas] if personas is not None \
+            else list(get_persona_registry())
+        
+        # Freie Persona-Sätze je Auswahl: {(Persona-IDs): [[PersonaAgent, ...], ...]}
+        self._idle_personas = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _to_spec(persona):
+        """Wandelt einen Namen oder ein Katalog-Dictionary in eine PersonaSpec um"""
+        if isinstance(persona, PersonaSpec):
+            return persona
+        if isinstance(persona, dict):
+            return PersonaSpec.from_dict(persona)
+        spec = get_persona_registry().get(persona)
+        if spec is None:
+            raise ValueError(f"Unbekannte Persona: {persona}")
+        return spec
+    
+    def select_specs(self, personas=None):
+        """
+        Wählt Personas dieser Sitzung aus
+        
+        Args:
+            personas: Namen oder IDs (Standard: alle Personas der Sitzung);
+                      PersonaSpecs werden direkt übernommen (z.B. aus population.py)
+            
+        Returns:
+            Liste von PersonaSpecs in der angegebenen Reihenfolge
+        """
+        if personas is None:
+            return list(self.specs)
+        index = {}
+        for spec in self.specs:
+            index.setdefault(spec.id, spec)
+            index.setdefault(spec.name.lower(), spec)
+        selected = []
+        for name in personas:
+            if isinstance(name, PersonaSpec):
+                selected.append(name)
+                continue
+            spec = index.get(name.lower())
+            if spec is None:
+                raise ValueError(f"Persona '{name}' gehört nicht zu dieser Sitzung")
+            selected.append(spec)
+        return selected
+    
+    @contextmanager
+    def checkout(self, personas=None):
+        """
+        Leiht einen Persona-Satz für genau ein Interview aus
+        
+        Nach dem Interview wird der Verlauf zurückgesetzt und der Satz für das
+        nächste Interview mit derselben Auswahl aufbewahrt. Direkt übergebene
+        PersonaSpecs (z.B. Teil-Panels einer Population) werden nicht aufbewahrt,
+        damit große Panels nie komplett als PersonaAgents im Speicher liegen.
+        
+        Args:
+            personas: Optionale Auswahl von Namen oder PersonaSpecs (Standard: alle Personas der Sitzung)
+            
+        Yields:
+            Liste von PersonaAgent-Objekten
+        """
+        specs = self.select_specs(personas)
+        reusable = personas is None or not any(isinstance(persona, PersonaSpec) for persona in personas)
+        key = tuple(spec.id for spec in specs)
+        with self._lock:
+            idle = self._idle_personas.get(key) if reusable else None
+            agents = idle.pop() if idle else None
+        if agents is None:
+            with trace_span("create_personas", count=len(specs)):
+                agents = [create_persona_from_spec(spec, self.response_cache, self.api_key, self.client_pool,
+                                                   self.provider, self.model_name)
+                          for spec in specs]
+        try:
+            yield agents
+        finally:
+            if reusable:
+                for agent in agents:
+                    agent.reset_memory()
+                with self._lock:
+                    self._idle_personas.setdefault(key, []).append(agents)
+    
+    def create_manager(self, results_stream=None, keep_results=True):
+        """
+        Erstellt einen InterviewManager mit den Einstellungen dieser Sitzung
+        (Personas werden per checkout() zugewiesen)
+        
+        Args:
+            results_stream: Optionaler ResultsStreamWriter für alle Antworten
+            keep_results: False = Antworten nur in den Stream schreiben
+            
+        Returns:
+            InterviewManager ohne Personas
+        """
+        return InterviewManager(max_concurrency=self.max_concurrency, engine=self.engine,
+                                stateless=self.stateless, response_cache=self.response_cache,
+                                api_key=self.api_key, client_pool=self.client_pool,
+                                provider=self.provider, model_name=self.model_name,
+                                results_stream=results_stream, keep_results=keep_results)
     
+    def run(self, questions, personas=None, output_file=None, output_format="json",
+            keep_results=True, resume=None, as_result=False):
+        """
+        Führt ein Interview durch
+        
+        Args:
+            questions: Liste von Fragen als Strings
+            personas: Optionale Auswahl von Namen oder PersonaSpecs (Standard: alle Personas der Sitzung)
+            output_file: Dateiname ohne Endung - dann wird jede Antwort sofort in
+                         <output_file>.jsonl geschrieben und am Ende der Bericht gebaut
+                         (Standard: nichts schreiben, Ergebnis nur im Speicher)
+            output_format: Format des Berichts, "json", "md" oder "npz" (Spalten, siehe results_model.py)
+            keep_results: False = nur eine Zusammenfassung zurückgeben
+                          (nur mit output_file, hält den Speicher flach)
+            resume: Früherer Lauf, der fortgesetzt wird (Standard-Ausgabe: derselbe Lauf)
+            as_result: True = das kompakte InterviewResult statt eines Dictionaries
+                       zurückgeben (siehe results_model.py, nur mit keep_results)
+            
+        Returns:
+            Dictionary mit den Interview-Ergebnissen (timestamp, agents, interview_data,
+            error_count und ggf. results_stream) bzw. der Zusammenfassung -
+            oder das InterviewResult (as_result=True)
+        """
+        questions_list = list(questions)
+        if not questions_list:
+            raise ValueError("Keine Fragen angegeben")
+        if output_file is None and resume:
+            output_file = get_run_base(resume)
+        # Ohne Ausgabedatei gibt es keinen Stream - dann bleibt alles im Speicher
+        keep_results = keep_results or output_file is None
+        
+        stream_path = None
+        with self.checkout(personas) as agents:
+            results_stream = None
+            completed_cells = {}
+            if resume:
+                stream_path = prepare_resume_stream(resume, output_file)
+                completed_cells = get_resumable_cells(stream_path, questions_list, agents)
+                total_cells = len(questions_list) * len(agents)
+                print(f"\n🔁 Fortsetzen von {stream_path}: {len(completed_cells)} von "
+                      f"{total_cells} Antworten übernommen, "
+                      f"{total_cells - len(completed_cells)} werden neu abgefragt")
+                results_stream = ResultsStreamWriter(stream_path, append=True)
+            elif output_file is not None:
+                stream_path = get_stream_path(output_file)
+                results_stream = ResultsStreamWriter(stream_path)
+            
+            manager = self.create_manager(results_stream, keep_results)
+            manager.personas = agents
+            manager.completed_cells = completed_cells
+            try:
+                manager.run_full_interview(questions_list)
+            finally:
+                if results_stream is not None:
+                    results_stream.close()
+        
+        # Bericht aus dem Ergebnis-Stream bauen (JSON/Markdown Frage für Frage)
+        metrics = manager.metrics.get_summary()
+        stream_source = None
+        if stream_path is not None:
+            output_format = output_format.lower()
+            report_file = f"{output_file}.{output_format}"
+            with trace_span("write_report", "report", format=output_format):
+                if output_format == "npz":
+                    stream_source = InterviewResult.from_stream(stream_path)
+                    stream_source.save_npz(report_file)
+                else:
+                    stream_source = write_report_from_stream(stream_path, report_file, output_format, metrics)
+        if as_result and keep_results:
+            return manager.result
+        if stream_source is None:
+            interview_results = manager.result.to_dict()
+            interview_results["error_count"] = manager.result.get_summary()["error_count"]
+            interview_results["metrics"] = metrics
+            return interview_results
+        if not keep_results:
+            return {
+                "timestamp": stream_source.timestamp,
+                "agents": stream_source.agents,
+                **stream_source.get_summary(),
+                "results_stream": stream_path,
+                "metrics": metrics
+            }
+        interview_results = manager.result.to_dict()
+        interview_results["results_stream"] = stream_path
+        interview_results["error_count"] = stream_source.get_summary()["error_count"]
+        interview_results["metrics"] = metrics
+        return interview_results
+
 
 def save_interview_results(interview_results, output_format="json", filename=None):
     """
@@ -127,7 +570,7 @@ def save_interview_results(interview_results, output_format="json", filename=Non
     
     Args:
         interview_results: Das Dictionary mit allen Interview-Daten
-        output_format: "json" oder "md" (Markdown)
+        output_format: "json", "md" (Markdown) oder "npz" (NumPy-Spalten)
         filename: Name der Ausgabedatei (ohne Endung)
     """
     # Wenn kein Dateiname angegeben, erstelle einen mit Zeitstempel
@@ -142,6 +585,10 @@ def save_interview_results(interview_results, output_format="json", filename=Non
     # Speichere als Markdown-Datei
     elif output_format.lower() == "md":
         save_as_markdown_file(interview_results, filename)
+        
+    # Speichere als spaltenorientiertes NumPy-Archiv
+    elif output_format.lower() == "npz":
+        save_as_npz_file(interview_results, filename)
 
 
 def save_as_json_file(interview_results, filename):
@@ -149,9 +596,14 @@ def save_as_json_file(interview_results, filename):
     Speichert die Ergebnisse als JSON-Datei
     JSON ist ein Standard-Format für Daten
     """
+    from analytics import build_report_analysis
+    
     full_filename = f"{filename}.json"
     with open(full_filename, "w", encoding="utf-8") as file:
-        json.dump(interview_results, file, indent=2, ensure_ascii=False)
+        write_json_report(file, interview_results['timestamp'], interview_results['agents'],
+                          interview_results['interview_data'],
+                          build_report_analysis(interview_results['interview_data']),
+                          interview_results.get('metrics'))
     print(f"Ergebnisse gespeichert in {full_filename}")
 
 
@@ -160,31 +612,28 @@ def save_as_markdown_file(interview_results, filename):
     Speichert die Ergebnisse als Markdown-Datei (.md)
     Markdown ist ein Format für schön formatierte Texte
     """
+    from analytics import build_report_analysis
+    
     full_filename = f"{filename}.md"
     
     with open(full_filename, "w", encoding="utf-8") as file:
-        # Schreibe den Titel
-        file.write("# Synthetische Interview Ergebnisse\n\n")
-        file.write(f"**Zeitstempel:** {interview_results['timestamp']}\n\n")
-        
-        # Schreibe die Teilnehmer-Informationen
-        file.write("## Teilnehmer\n\n")
-        for agent in interview_results['agents']:
-            file.write(f"- **{agent['name']}** ({agent['age']} Jahre): {agent['characteristics']}\n")
-        
-        # Schreibe alle Fragen und Antworten
-        file.write("\n## Interview Fragen & Antworten\n\n")
-        for question_data in interview_results['interview_data']:
-            file.write(f"### Frage {question_data['question_id']}: {question_data['question']}\n\n")
-            
-            for response in question_data['responses']:
-                file.write(f"**{response['agent_id']}:** {response['response']}\n\n")
-            
-            file.write("---\n\n")  # Trennlinie zwischen Fragen
+        write_markdown_report(file, interview_results['timestamp'], interview_results['agents'],
+                              interview_results['interview_data'],
+                              build_report_analysis(interview_results['interview_data']))
     
     print(f"Ergebnisse gespeichert in {full_filename}")
 
 
+def save_as_npz_file(interview_results, filename):
+    """
+    Speichert die Ergebnisse spaltenorientiert als NumPy-Archiv (.npz)
+    Lädt für Auswertungen viel schneller als JSON (siehe results_model.py)
+    """
+    full_filename = f"{filename}.npz"
+    InterviewResult.from_dict(interview_results).save_npz(full_filename)
+    print(f"Ergebnisse gespeichert in {full_filename}")
+
+
 def load_questions_from_file(filepath):
     """
     Lädt Fragen aus einer JSON-Datei
@@ -219,7 +668,30 @@ def load_questions_from_file(filepath):
         sys.exit(1)
 
 
-def print_interview_summary(interview_results, output_format, output_filename):
+def get_resumable_cells(stream_path, questions_list, personas):
+    """
+    Ermittelt die Zellen eines früheren Laufs, die nicht neu abgefragt werden müssen
+    
+    Args:
+        stream_path: Ergebnis-Stream des früheren Laufs
+        questions_list: Fragen des fortgesetzten Laufs
+        personas: Befragte Personas
+        
+    Returns:
+        Dictionary {(Frage-Nr., Persona-Name): gespeicherte Antwort} - nur erfolgreiche
+        Antworten, deren Frage an derselben Stelle unverändert ist
+    """
+    persona_names = {persona.name for persona in personas}
+    return {
+        (question_id, agent_id): record
+        for (question_id, agent_id), record in ResultsStreamIndex(stream_path).get_completed_cells().items()
+        if agent_id in persona_names
+        and question_id <= len(questions_list)
+        and record["question"] == questions_list[question_id - 1]
+    }
+
+
+def print_interview_summary(interview_results, output_format, output_filename, response_cache=None):
     """
     Zeigt eine schöne Zusammenfassung des Interviews an
     
@@ -227,18 +699,78 @@ def print_interview_summary(interview_results, output_format, output_filename):
         interview_results: Die Interview-Ergebnisse
         output_format: Das verwendete Ausgabeformat
         output_filename: Der Name der Ausgabedatei
+        response_cache: Optionaler ResponseCache, dessen Treffer angezeigt werden
     """
-    # Berechne Statistiken
+    # Berechne Statistiken (ohne interview_data stehen die Zahlen direkt im Ergebnis)
     persona_count = len(interview_results.get('agents', []))
-    question_count = len(interview_results.get('interview_data', []))
-    total_responses = sum(len(q['responses']) for q in interview_results['interview_data'])
+    question_count = interview_results.get('question_count', len(interview_results.get('interview_data', [])))
+    total_responses = interview_results.get(
+        'response_count', sum(len(q['responses']) for q in interview_results.get('interview_data', [])))
     
     print(f"\n📊 Interview Zusammenfassung:")
     print(f"  - {persona_count} Teilnehmer")
     print(f"  - {question_count} Fragen")
     print(f"  - {total_responses} Gesamtantworten")
+    if interview_results.get('error_count'):
+        print(f"  - {interview_results['error_count']} Antworten mit Fehler")
     print(f"  - Zeitstempel: {interview_results['timestamp']}")
+    if response_cache is not None:
+        stats = response_cache.get_stats()
+        print(f"  - Cache ({stats['mode']}): {stats['hits']} Treffer, {stats['misses']} Fehlschläge, "
+              f"{stats['writes']} gespeichert, {stats['evictions']} verdrängt")
+        if 'semantic_hits' in stats:
+            print(f"  - Ähnliche Fragen (ab {stats['semantic_threshold']}): {stats['semantic_hits']} Treffer, "
+                  f"Trefferquote {stats['semantic_hit_rate']:.0%}")
+            for match in stats['semantic_matches']:
+                print(f"    „{match['question']}“ ≈ „{match['matched_question']}“ "
+                      f"({match['similarity']:.2f}, {match['hits']}×)")
+    metrics = interview_results.get('metrics')
+    if metrics:
+        run = metrics['run']
+        estimated = " (teils geschätzt)" if run['estimated_usage_calls'] else ""
+        print(f"  - Tokens: {run['prompt_tokens']} Prompt + {run['completion_tokens']} Antwort{estimated}, "
+              f"Kosten ${run['cost_usd']:.4f}")
+        latency, ttft = run['latency_seconds'], run['ttft_seconds']
+        if latency['count']:
+            ttft_text = f", erstes Token p50 {ttft['p50']:.2f}s" if ttft['count'] else ""
+            print(f"  - Latenz p50 {latency['p50']:.2f}s / p95 {latency['p95']:.2f}s{ttft_text}, "
+                  f"{run['retries']} Wiederholungen")
     print(f"\n💾 Ausgabe gespeichert als {output_format.upper()}-Format in {output_filename}.{output_format}")
+    if interview_results.get('results_stream'):
+        print(f"🧾 Checkpoint (JSONL): {interview_results['results_stream']}")
+
+
+def print_dry_run_plan(session, specs, questions_list, output_file, output_format):
+    """
+    Zeigt, was ein Lauf tun würde (--dry-run) - ohne Personas zu bauen
+
+    Returns:
+        Dictionary mit dem Plan (dry_run, personas, questions, calls, Ausgabedateien)
+    """
+    plan = {
+        "dry_run": True,
+        "provider": session.provider,
+        "model": session.model_name,
+        "personas": [spec.name for spec in specs],
+        "question_count": len(questions_list),
+        "calls": len(specs) * len(questions_list),
+        "outputs": [get_stream_path(output_file), f"{output_file}.{output_format.lower()}"]
+    }
+    print(f"\n🧪 Testlauf (--dry-run): {plan['calls']} Modell-Aufrufe "
+          f"({len(specs)} Personas × {len(questions_list)} Fragen) mit {plan['model']} ({plan['provider']})")
+    print(f"  - Motor: {session.engine}, gleichzeitig: {session.max_concurrency or get_max_concurrency()}"
+          f"{', zustandslos' if session.stateless else ''}")
+    if session.response_cache is not None:
+        print(f"  - Antwort-Cache: {session.response_cache.get_stats()['mode']}")
+    print(f"  - Ausgabe: {', '.join(plan['outputs'])}")
+    print("✅ Prüfung erfolgreich - keine Modell-Aufrufe durchgeführt")
+    return plan
+
+
+def get_default_output_file():
+    """Standard-Ausgabename ohne Endung: interview_results_<Zeitstempel>"""
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"interview_results_{timestamp}"
 
 
 def setup_command_line_arguments():
@@ -256,21 +788,148 @@ def setup_command_line_arguments():
   python interview.py --questions questions.json
   python interview.py --questions questions.json --format json
   python interview.py --questions questions.json --output meine_befragung
+  python interview.py --questions questions.json --provider fake
+  python interview.py --questions questions.json --resume meine_befragung
+  python interview.py --questions questions.json --trace
+  python interview.py --questions questions.json --dry-run
+  python interview.py --questions questions.json --provider fake --profile --profile-memory
         """
     )
     
     # Alle verfügbaren Optionen
     parser.add_argument("--questions", required=True, 
                        help="Pfad zur JSON-Datei mit Fragen")
-    parser.add_argument("--output", default="results", 
-                       help="Ausgabedateiname (ohne Erweiterung)")
-    parser.add_argument("--format", choices=["json", "md"], default="md", 
-                       help="Ausgabeformat (Standard: md)")
+    parser.add_argument("--output", default=None, 
+                       help="Ausgabedateiname (ohne Erweiterung, Standard: interview_results_<Zeitstempel> "
+                            "bzw. der fortgesetzte Lauf)")
+    parser.add_argument("--format", choices=["json", "md", "npz"], default="md", 
+                       help="Ausgabeformat (Standard: md; npz = spaltenorientiert für Auswertungen)")
+    parser.add_argument("--max-concurrency", type=int, default=None,
+                       help="Anzahl gleichzeitig befragter Personas (Standard: MAX_CONCURRENCY oder 1)")
+    parser.add_argument("--engine", choices=["sync", "async"], default="sync",
+                       help="Interview-Motor: sync (Frage für Frage) oder async (Pipeline pro Persona)")
+    parser.add_argument("--stateless", action="store_true",
+                       help="Personas antworten ohne eigenen Verlauf (alle Fragen parallel möglich)")
+    parser.add_argument("--dry-run", action="store_true",
+                       help="Nur prüfen (Fragen, Personas, API-Schlüssel) und den Plan zeigen - "
+                            "ohne Modell-Aufrufe und ohne LangChain zu laden")
+    add_resume_argument(parser)
+    add_provider_argument(parser)
+    add_cache_arguments(parser)
+    add_metrics_argument(parser)
+    add_trace_argument(parser)
+    add_profile_arguments(parser)
 
     
     return parser
 
 
+def get_available_agents():
+    """
+    Gibt die Namen aller verfügbaren Agenten zurück (kleingeschrieben)
+    Liest nur den Persona-Katalog - es werden keine Sprachmodelle erstellt
+    """
+    return get_persona_registry().ids()
+
+
+def add_resume_argument(parser):
+    """
+    Fügt die Option zum Fortsetzen eines früheren Laufs hinzu (auch von run_batch.py genutzt)
+    
+    Args:
+        parser: Der ArgumentParser, der erweitert wird
+    """
+    parser.add_argument("--resume", default=None, metavar="RUN",
+                       help="Früheren Lauf fortsetzen (z.B. meine_befragung oder interview_results_<Zeitstempel>.jsonl): "
+                            "nur fehlende und fehlerhafte Antworten werden neu abgefragt")
+
+
+def add_provider_argument(parser):
+    """
+    Fügt die Option für den LLM-Anbieter hinzu (auch von run_batch.py genutzt)
+    
+    Args:
+        parser: Der ArgumentParser, der erweitert wird
+    """
+    parser.add_argument("--provider", choices=LLM_PROVIDERS, default=None,
+                       help="LLM-Anbieter: openrouter oder fake (offline, ohne API-Schlüssel; "
+                            "Standard: LLM_PROVIDER)")
+
+
+def add_cache_arguments(parser):
+    """
+    Fügt die Optionen für den Antwort-Cache hinzu (auch von run_batch.py genutzt)
+    
+    Args:
+        parser: Der ArgumentParser, der erweitert wird
+    """
+    parser.add_argument("--cache", default=None,
+                       help="Pfad zur SQLite-Datei des Antwort-Caches (Standard: RESPONSE_CACHE, sonst aus)")
+    parser.add_argument("--cache-mode", choices=CACHE_MODES, default=None,
+                       help="Cache-Modus für diesen Lauf (Standard: readwrite)")
+    parser.add_argument("--cache-ttl", type=float, default=None,
+                       help="Lebensdauer eines Cache-Eintrags in Sekunden")
+    parser.add_argument("--cache-max-entries", type=int, default=None,
+                       help="Maximale Cache-Größe, älteste ungenutzte Einträge werden verdrängt")
+    parser.add_argument("--cache-semantic", type=float, default=None, metavar="SCHWELLE",
+                       help="Umformulierte Fragen ab dieser Ähnlichkeit (0-1, z.B. 0.8) aus dem Cache "
+                            "beantworten (Standard: RESPONSE_CACHE_SEMANTIC, sonst aus)")
+
+
+def add_metrics_argument(parser):
+    """
+    Fügt die Option für den Prometheus-Export der Messwerte hinzu (auch von run_batch.py genutzt)
+    
+    Args:
+        parser: Der ArgumentParser, der erweitert wird
+    """
+    parser.add_argument("--metrics-file", default=None, metavar="DATEI",
+                       help="Tokens, Kosten und Latenzen im Prometheus-Textformat schreiben "
+                            "(z.B. für den textfile-Collector des node_exporter; Standard: METRICS_FILE)")
+
+
+def add_trace_argument(parser):
+    """
+    Fügt die Option für den Chrome/Perfetto-Trace hinzu (auch von run_batch.py genutzt)
+    
+    Args:
+        parser: Der ArgumentParser, der erweitert wird
+    """
+    parser.add_argument("--trace", nargs="?", const=True, default=None, metavar="DATEI",
+                       help="Zeitstrahl des Laufs als Chrome-Trace schreiben (Standard: "
+                            "<Ausgabe>.trace.json, öffnen mit ui.perfetto.dev oder chrome://tracing)")
+
+
+def add_profile_arguments(parser):
+    """
+    Fügt die Profiling-Optionen hinzu (auch von run_batch.py genutzt)
+    
+    Args:
+        parser: Der ArgumentParser, der erweitert wird
+    """
+    parser.add_argument("--profile", nargs="?", const=True, default=None, metavar="BASIS",
+                       help="Lauf unter cProfile ausführen und <Basis>.pstats/.txt schreiben "
+                            "(Standard-Basis: <Ausgabe>.profile)")
+    parser.add_argument("--profile-memory", action="store_true",
+                       help="Mit --profile zusätzlich Allokationen per tracemalloc verfolgen (langsamer)")
+
+
+def open_cache_from_arguments(args):
+    """
+    Öffnet den Antwort-Cache anhand der Kommandozeilen-Optionen
+    
+    Returns:
+        ResponseCache oder None, wenn kein Cache konfiguriert ist
+    """
+    return open_response_cache(
+        path=args.cache,
+        mode=args.cache_mode,
+        ttl_seconds=args.cache_ttl,
+        max_entries=args.cache_max_entries,
+        semantic_threshold=args.cache_semantic
+    )
+
+
 def main():
     """
     Hauptfunktion für CLI-Nutzung - parst Argumente und ruft run_interview() auf
@@ -278,14 +937,40 @@ def main():
     # Kommandozeilen-Argumente einrichten und parsen
     parser = setup_command_line_arguments()
     args = parser.parse_args()
+    response_cache = open_cache_from_arguments(args)
+    # Ohne --output: neuer Lauf mit Zeitstempel (überschreibt nichts),
+    # beim Fortsetzen der Name des früheren Laufs
+    output_file = args.output
+    if output_file is None:
+        output_file = get_run_base(args.resume) if args.resume else get_default_output_file()
     
-    # Interview mit den geparsten Argumenten ausführen (CLI nutzt immer alle Agenten)
-    result = run_interview(
-        agent_or_questions=args.questions,
-        questions_file=None,  # CLI Modus - alle Agenten
-        format=args.format,
-        output_file=args.output
-    )
+    # Optional unter cProfile - inklusive Aufbau der Personas und Chains
+    profile_base = args.profile
+    if profile_base is True:
+        profile_base = f"{output_file}.profile"
+    with profiling(profile_base, args.profile_memory) as profiler:
+        # Interview mit den geparsten Argumenten ausführen (CLI nutzt immer alle Agenten)
+        result = run_interview(
+            agent_or_questions=args.questions,
+            questions_file=None,  # CLI Modus - alle Agenten
+            format=args.format,
+            output_file=output_file,
+            max_concurrency=args.max_concurrency,
+            engine=args.engine,
+            stateless=args.stateless,
+            response_cache=response_cache,
+            provider=args.provider,
+            keep_results=False,  # CLI braucht nur die Dateien, nicht das Dictionary
+            resume=args.resume,
+            metrics_file=args.metrics_file,
+            trace=args.trace,
+            dry_run=args.dry_run
+        )
+        if profiler is not None:
+            # Event-Loop-Thread des Client-Pools beenden, damit sein Profil mitzählt
+            get_client_pool().close()
+    if profiler is not None:
+        print_profile_summary(profiler)
     
     # Exit-Code setzen basierend auf Erfolg/Fehler
     if result is None:
@@ -298,15 +983,43 @@ def main():
 # CORE INTERVIEW FUNCTION
 # =====================================
 
-def run_interview(agent_or_questions, questions_file=None, format="md", output_file=None):
+def run_interview(agent_or_questions, questions_file=None, format="md", output_file=None,
+                  max_concurrency=None, engine="sync", stateless=False, response_cache=None,
+                  api_key=None, provider=None, keep_results=True, resume=None, model_name=None,
+                  client_pool=None, session=None, metrics_file=None, trace=None, dry_run=False):
     """
     Führt ein Interview mit AI-Personas durch
     
+    Für eingebettete Nutzung ohne Fragen-Datei siehe InterviewSession.
+    
     Args:
         agent_or_questions: Entweder Agenten-Name (str) oder Questions-Datei (str)
         questions_file: Questions-Datei (nur wenn erster Parameter ein Agent ist)
-        format: Ausgabeformat - "md" für Markdown oder "json" (Standard: "md")
+        format: Ausgabeformat - "md" für Markdown, "json" oder "npz" (Standard: "md")
         output_file: Dateiname ohne Endung (Standard: automatischer Zeitstempel)
+        max_concurrency: Anzahl gleichzeitig befragter Personas (Standard: MAX_CONCURRENCY)
+        engine: "sync" oder "async" (asyncio-Motor mit einer Pipeline pro Persona)
+        stateless: True = ohne Persona-Verlauf, alle Zellen laufen parallel
+        response_cache: Optionaler ResponseCache (siehe response_cache.py)
+        api_key: OpenRouter API-Schlüssel (Standard: OPENROUTER_API_KEY aus der .env)
+        provider: LLM-Anbieter "openrouter" oder "fake" (Standard: LLM_PROVIDER)
+        keep_results: False = Antworten nicht im Speicher sammeln; zurückgegeben wird
+                      dann nur eine Zusammenfassung (Zähler und Pfad des Ergebnis-Streams)
+        resume: Früherer Lauf (Basis-Pfad oder eine seiner Dateien) - nur fehlende
+                und fehlerhafte Zellen werden neu abgefragt, der Rest übernommen
+        model_name: Modell aller Personas (Standard: DEFAULT_MODEL aus der .env)
+        client_pool: ClientPool, z.B. mit gemeinsamem Budget mehrerer Läufe (Standard: prozessweiter Pool)
+        session: Bestehende InterviewSession - ersetzt die Verbindungs-Optionen oben
+                 und überspringt die erneute Prüfung des API-Schlüssels
+        metrics_file: Pfad für Tokens/Kosten/Latenzen im Prometheus-Textformat
+                      (Standard: METRICS_FILE aus der .env, sonst kein Export)
+        trace: Chrome/Perfetto-Trace des Laufs schreiben - True für
+               <output_file>.trace.json oder ein eigener Pfad (Standard: kein Trace)
+        dry_run: True = nur prüfen und den Plan zeigen - keine Personas bauen,
+                 keine Modell-Aufrufe, keine Dateien schreiben
+        
+    Jede Antwort wird sofort in <output_file>.jsonl geschrieben (Checkpoint);
+    die JSON-/Markdown-Datei wird am Ende aus diesem Stream gebaut.
         
     Returns:
         Dictionary mit Interview-Ergebnissen oder None bei Fehler
@@ -334,39 +1047,44 @@ def run_interview(agent_or_questions, questions_file=None, format="md", output_f
             selected_agent = agent_or_questions.lower()
             actual_questions_file = questions_file
         
-        # 1. Validierung der Umgebung
-        if not validate_api_key():
-            print("❌ Setup fehlgeschlagen: Ungültiger oder fehlender API-Schlüssel")
-            return None
-        
-        # 2. Interview Manager erstellen und Personas einrichten
-        interview_manager = InterviewManager()
+        # 1. Validierung der Umgebung (einmal pro Sitzung)
+        if session is None:
+            try:
+                session = InterviewSession(api_key=api_key, provider=provider, model_name=model_name,
+                                           client_pool=client_pool, response_cache=response_cache,
+                                           max_concurrency=max_concurrency, engine=engine,
+                                           stateless=stateless)
+            except ValueError:
+                print("❌ Setup fehlgeschlagen: Ungültiger oder fehlender API-Schlüssel")
+                return None
         
-        print("🤖 Initialisiere LangChain Personas...")
+        # Wenn kein Output-Dateiname angegeben, erstelle einen mit Zeitstempel
+        # (beim Fortsetzen wird der frühere Lauf aktualisiert)
+        if output_file is None and resume:
+            output_file = get_run_base(resume)
+        if output_file is None:
+            output_file = get_default_output_file()
         
-        if not interview_manager.setup_personas():
-            print("❌ Fehler beim Erstellen der Personas")
-            print("Stellen Sie sicher, dass Sie die erforderlichen Abhängigkeiten installiert haben:")
-            print("  pip install -r requirements.txt")
+        # 2. Bei ausgewähltem Agent prüfen ob verfügbar - nur die Specs,
+        #    noch ohne Sprachmodelle zu bauen
+        try:
+            specs = session.select_specs([selected_agent] if selected_agent else None)
+        except ValueError:
+            print(f"❌ Agent '{selected_agent}' nicht gefunden.")
+            print(f"Verfügbare Agenten: {', '.join(spec.name for spec in session.specs)}")
             return None
         
-        # 3. Bei ausgewähltem Agent prüfen ob verfügbar
+        print("🤖 Initialisiere LangChain Personas...")
+        
         if selected_agent:
-            available_agents = [p.name.lower() for p in interview_manager.personas]
-            if selected_agent not in available_agents:
-                print(f"❌ Agent '{selected_agent}' nicht gefunden.")
-                print(f"Verfügbare Agenten: {', '.join([p.name for p in interview_manager.personas])}")
-                return None
-            
             print(f"✓ Einzelner Agent ausgewählt: {selected_agent.title()}")
-            # Filtere Personas auf den gewählten Agent
-            interview_manager.personas = [p for p in interview_manager.personas if p.name.lower() == selected_agent]
         else:
-            print(f"✓ {interview_manager.get_personas_count()} Personas erstellt:")
+            print(f"✓ {len(specs)} Personas ausgewählt:")
         
-        interview_manager.print_personas_info()
+        for spec in specs:
+            print(f"  - {spec.name} ({spec.age}): {spec.characteristics}")
         
-        # 4. Fragen aus JSON-Datei laden
+        # 3. Fragen aus JSON-Datei laden
         try:
             questions_list = load_questions_from_file(actual_questions_file)
         except Exception as e:
@@ -378,34 +1096,51 @@ def run_interview(agent_or_questions, questions_file=None, format="md", output_f
         for i, question in enumerate(questions_list, 1):
             print(f"  {i}. {question}")
         
-        # 5. Das Interview durchführen
+        if dry_run:
+            return print_dry_run_plan(session, specs, questions_list, output_file, format)
+
+        # 4. Das Interview durchführen - jede Antwort landet sofort im Stream
         print("\n" + "="*60)
         print("🎤 SYNTHETISCHES INTERVIEW STARTEN")
         print("="*60)
         
+        stream_path = get_stream_path(output_file)
+        trace_file = get_trace_path(output_file) if trace is True else trace
         try:
-            interview_results = interview_manager.run_full_interview(questions_list)
+            with tracing(trace_file):
+                interview_results = session.run(questions_list,
+                                                personas=[selected_agent] if selected_agent else None,
+                                                output_file=output_file, output_format=format,
+                                                keep_results=keep_results, resume=resume)
         except KeyboardInterrupt:
             print("\n\n⚠️  Interview vom Benutzer unterbrochen")
+            print(f"🧾 Bisherige Antworten gespeichert in {stream_path}")
             return None
         except Exception as error:
+            if not os.path.exists(stream_path):
+                print(f"❌ Lauf '{resume}' kann nicht fortgesetzt werden: {error}" if resume
+                      else f"❌ Fehler beim Interview: {error}")
+                return None
             print(f"\n\n❌ Fehler während des Interviews: {error}")
+            print(f"🧾 Bisherige Antworten gespeichert in {stream_path}")
             return None
         
-        # 6. Ergebnisse speichern
+        # 5. Ergebnisse gespeichert
         print("\n" + "="*60)
         print("✅ INTERVIEW ABGESCHLOSSEN")
         print("="*60)
+        print(f"Ergebnisse gespeichert in {output_file}.{format.lower()}")
         
-        # Wenn kein Output-Dateiname angegeben, erstelle einen mit Zeitstempel
-        if output_file is None:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"interview_results_{timestamp}"
-        
-        save_interview_results(interview_results, format, output_file)
-        
-        print_interview_summary(interview_results, format, output_file)
-        print(f"🎯 Verwendete Hauptklasse: InterviewManager")
+        print_interview_summary(interview_results, format, output_file, session.response_cache)
+        metrics_file = metrics_file or get_metrics_file()
+        if metrics_file:
+            write_prometheus_textfile(metrics_file, [({"run": os.path.basename(output_file),
+                                                       "model": session.model_name},
+                                                      interview_results["metrics"])])
+            print(f"📈 Messwerte (Prometheus) gespeichert in {metrics_file}")
+        if trace_file:
+            print(f"🔍 Trace gespeichert in {trace_file} (öffnen mit https://ui.perfetto.dev)")
+        print(f"🎯 Verwendete Hauptklasse: InterviewSession")
         
         return interview_results
         
@@ -413,6 +1148,5 @@ def run_interview(agent_or_questions, questions_file=None, format="md", output_f
         print(f"❌ Fehler beim Interview: {error}")
         return None
 
-
 if __name__ == "__main__":
     main()
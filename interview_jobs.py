@@ -0,0 +1,241 @@
+"""
+Hintergrund-Jobs für GUI-Interviews
+
+Ein Interview läuft nicht mehr im Streamlit-Script-Thread, sondern als Job in
+einem prozessweiten Worker-Pool. Die Seite fragt den Job-Zustand regelmäßig ab
+und zeigt die bisherigen Antworten (inklusive der gerade gestreamten) an.
+So überleben lange Interviews Reruns und Browser-Refreshes, mehrere Jobs können
+gleichzeitig laufen und die Oberfläche bleibt bedienbar.
+"""
+
+import datetime
+import hmac
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from results_model import InterviewResult
+from results_stream import get_response_status
+from tracing import trace_span
+
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+FINISHED_STATES = (JOB_DONE, JOB_FAILED, JOB_CANCELLED)
+
+
+def get_job_workers():
+    """Anzahl gleichzeitig laufender Interview-Jobs pro Server-Prozess"""
+    return int(os.getenv('GUI_JOB_WORKERS', 4))
+
+
+def get_max_finished_jobs():
+    """Wie viele abgeschlossene Jobs im Speicher gehalten werden"""
+    return int(os.getenv('GUI_MAX_FINISHED_JOBS', 50))
+
+
+class InterviewJob:
+    """
+    Zustand eines Interview-Jobs
+
+    Der Worker-Thread schreibt, die GUI liest über snapshot() - beides unter einem Lock.
+    """
+
+    def __init__(self, questions: List[str], agent_names: List[str], session, owner: Optional[str] = None):
+        self.id = uuid.uuid4().hex[:12]
+        self.questions = list(questions)
+        self.agent_names = list(agent_names)
+        # InterviewSession der startenden Browser-Session - Zugangsdaten,
+        # Client-Pool und wiederverwendbare Personas (nie im Snapshot)
+        self.session = session
+        # Geheimes Token der startenden Browser-Session - die Job-ID allein
+        # reicht nicht, um ein fremdes Interview anzuzeigen
+        self.owner = owner
+
+        self.status = JOB_QUEUED
+        self.error = None
+        self.created_at = datetime.datetime.now().isoformat()
+        self.finished_at = None
+
+        # Gleiches Ergebnis-Modell wie die CLI (siehe results_model.py)
+        self.result = InterviewResult(self.created_at)
+        self.completed_steps = 0
+        self.total_steps = len(self.questions) * len(self.agent_names)
+
+        # Antwort, die gerade gestreamt wird
+        self.current_question_index = None
+        self.current_agent = None
+        self.partial_response = ""
+
+        self._lock = threading.Lock()
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """Bittet den Job, nach der aktuellen Antwort abzubrechen"""
+        self._cancel_event.set()
+
+    def is_cancelled(self):
+        """True wenn ein Abbruch angefordert wurde"""
+        return self._cancel_event.is_set()
+
+    def is_owned_by(self, owner: Optional[str]) -> bool:
+        """True wenn das Token zur startenden Browser-Session gehört"""
+        if not self.owner or not owner:
+            return False
+        return hmac.compare_digest(self.owner, owner)
+
+    def is_finished(self):
+        """True wenn der Job beendet ist (erfolgreich, fehlgeschlagen oder abgebrochen)"""
+        return self.status in FINISHED_STATES
+
+    def snapshot(self) -> Dict:
+        """
+        Gibt eine konsistente Kopie des aktuellen Job-Zustands zurück
+
+        Returns:
+            Dictionary mit Status, Fortschritt, bisherigen Ergebnissen und Teilantwort
+        """
+        with self._lock:
+            return {
+                "id": self.id,
+                "status": self.status,
+                "error": self.error,
+                "created_at": self.created_at,
+                "finished_at": self.finished_at,
+                "questions": list(self.questions),
+                "completed_steps": self.completed_steps,
+                "total_steps": self.total_steps,
+                "current_question_index": self.current_question_index,
+                "current_agent": self.current_agent,
+                "partial_response": self.partial_response,
+                "results": self.result.to_dict()
+            }
+
+    def _update(self, **fields):
+        """Setzt Felder unter dem Lock (nur vom Worker verwendet)"""
+        with self._lock:
+            for name, value in fields.items():
+                setattr(self, name, value)
+
+
+def run_interview_job(job: InterviewJob):
+    """
+    Führt ein Interview-Job im Worker-Thread aus
+
+    Jede Persona antwortet unabhängig; Antworten werden gestreamt und laufend
+    in den Job geschrieben, damit die GUI sie schon während des Interviews zeigt.
+    """
+    job._update(status=JOB_RUNNING)
+
+    try:
+        with job.session.checkout(job.agent_names) as personas:
+            with job._lock:
+                for persona in personas:
+                    job.result.add_agent(persona.get_agent_info())
+
+            for q_idx, question in enumerate(job.questions):
+                with job._lock:
+                    job.result.set_question(q_idx + 1, question)
+
+                for persona in personas:
+                    if job.is_cancelled():
+                        job._update(status=JOB_CANCELLED, finished_at=datetime.datetime.now().isoformat(),
+                                    current_agent=None, partial_response="")
+                        return
+
+                    job._update(current_question_index=q_idx, current_agent=persona.name, partial_response="")
+
+                    try:
+                        response = ""
+                        with trace_span("respond", "gui", persona=persona.name, question_id=q_idx + 1):
+                            for chunk in persona.stream_respond(question):
+                                response += chunk
+                                job._update(partial_response=response)
+
+                        if not response or response.strip() == "":
+                            response = f"[{persona.name} konnte nicht antworten]"
+                    except Exception as e:
+                        response = f"[Fehler bei {persona.name}: {str(e)}]"
+
+                    response_data = {
+                        "agent_id": persona.name,
+                        "agent_age": persona.age,
+                        "response": response,
+                        "timestamp": datetime.datetime.now().isoformat(),
+                        "status": get_response_status(response)
+                    }
+                    with job._lock:
+                        job.result.add_response(q_idx + 1, question, response_data)
+                        job.completed_steps += 1
+                        job.partial_response = ""
+
+        job._update(status=JOB_DONE, current_agent=None, current_question_index=None,
+                    finished_at=datetime.datetime.now().isoformat())
+
+    except Exception as e:
+        job._update(status=JOB_FAILED, error=str(e), current_agent=None,
+                    finished_at=datetime.datetime.now().isoformat())
+
+
+class JobRegistry:
+    """
+    Prozessweite Job-Verwaltung mit begrenztem Worker-Pool
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Args:
+            max_workers: Anzahl gleichzeitig laufender Jobs (Standard: GUI_JOB_WORKERS)
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or get_job_workers(),
+                                            thread_name_prefix="interview-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, questions: List[str], agent_names: List[str], session,
+               owner: Optional[str] = None) -> InterviewJob:
+        """
+        Reiht ein neues Interview als Hintergrund-Job ein
+
+        Args:
+            questions: Liste der Fragen
+            agent_names: Namen der teilnehmenden Personas
+            session: InterviewSession der startenden Browser-Session
+            owner: Geheimes Token der startenden Browser-Session (siehe get_owned)
+
+        Returns:
+            Der neue InterviewJob (Status "queued")
+        """
+        job = InterviewJob(questions, agent_names, session, owner)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune_finished_jobs()
+        self._executor.submit(run_interview_job, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[InterviewJob]:
+        """Gibt den Job mit der ID zurück (oder None)"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def get_owned(self, job_id: str, owner: Optional[str]) -> Optional[InterviewJob]:
+        """Gibt den Job nur zurück, wenn er der Browser-Session mit diesem Token gehört"""
+        job = self.get(job_id)
+        return job if job is not None and job.is_owned_by(owner) else None
+
+    def list_jobs(self) -> List[InterviewJob]:
+        """Alle bekannten Jobs, älteste zuerst"""
+        with self._lock:
+            return list(self._jobs.values())
+
+    def _prune_finished_jobs(self):
+        """Vergisst die ältesten abgeschlossenen Jobs (Aufrufer hält den Lock)"""
+        finished = [job_id for job_id, job in self._jobs.items() if job.is_finished()]
+        for job_id in finished[:max(0, len(finished) - get_max_finished_jobs())]:
+            del self._jobs[job_id]
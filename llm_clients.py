@@ -0,0 +1,337 @@
+"""
+Gemeinsamer LLM-Client-Pool für alle Personas
+
+Statt für jede Persona einen eigenen Chat-Client (mit eigener HTTP-Verbindung,
+eigenem Connection-Pool und eigenem TLS-Handshake zu openrouter.ai) zu bauen,
+verteilt ein ClientPool einen einzigen Keep-Alive-Connection-Pool an alle Personas.
+Chat-Modelle werden nach (Modell, Temperatur, max_tokens, base_url, API-Schlüssel)
+zwischengespeichert - Personas mit gleicher Konfiguration teilen sich ein Modell.
+
+Anbieter (LLM_PROVIDER):
+    openrouter  Echte Modelle über die OpenRouter-API (Standard)
+    fake        Offline-Modell aus fake_llm.py - ohne Netzwerk und API-Schlüssel,
+                mit simulierter Latenz und Fehlern für Tests und Lasttests
+"""
+
+import os
+import threading
+import time
+
+from rate_limiter import AdaptiveRateLimiter
+
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
+LLM_PROVIDERS = ("openrouter", "fake")
+
+
+def get_llm_provider():
+    """Welcher Anbieter die Chat-Modelle liefert (Standard: openrouter)"""
+    provider = os.getenv('LLM_PROVIDER', 'openrouter').lower()
+    if provider not in LLM_PROVIDERS:
+        raise ValueError(f"Unbekannter LLM_PROVIDER: {provider} (erlaubt: {', '.join(LLM_PROVIDERS)})")
+    return provider
+
+
+def get_http_max_connections():
+    """Maximale Anzahl gleichzeitiger HTTP-Verbindungen pro Pool"""
+    return int(os.getenv('HTTP_MAX_CONNECTIONS', 20))
+
+
+def get_http_max_keepalive():
+    """Maximale Anzahl offen gehaltener Keep-Alive-Verbindungen pro Pool"""
+    return int(os.getenv('HTTP_MAX_KEEPALIVE', 10))
+
+
+def get_client_pool_idle_seconds():
+    """Sekunden ohne Nutzung, nach denen ein Pool aus einer ClientPoolRegistry geschlossen wird"""
+    return float(os.getenv('CLIENT_POOL_IDLE_SECONDS', 1800))
+
+
+def get_http_keepalive_expiry():
+    """Sekunden, die eine ungenutzte Keep-Alive-Verbindung offen bleibt"""
+    return float(os.getenv('HTTP_KEEPALIVE_EXPIRY', 30))
+
+
+class ClientPool:
+    """
+    Verwaltet gemeinsam genutzte HTTP-Clients und Chat-Modelle
+
+    Alle Personas, die denselben Pool verwenden, teilen sich die
+    Verbindungen zu OpenRouter. Der Pool ist thread-sicher.
+    """
+
+    def __init__(self, max_connections=None, max_keepalive_connections=None, keepalive_expiry=None,
+                 rate_limiter=None):
+        """
+        Erstellt einen neuen (noch leeren) Client-Pool
+
+        Args:
+            max_connections: Obergrenze gleichzeitiger Verbindungen (Standard: HTTP_MAX_CONNECTIONS)
+            max_keepalive_connections: Obergrenze offener Keep-Alive-Verbindungen (Standard: HTTP_MAX_KEEPALIVE)
+            keepalive_expiry: Leerlaufzeit in Sekunden bis eine Verbindung geschlossen wird
+            rate_limiter: Eigener AdaptiveRateLimiter, z.B. mit festem Gesamtbudget (Standard: aus der .env)
+        """
+        self.max_connections = max_connections or get_http_max_connections()
+        self.max_keepalive_connections = max_keepalive_connections or get_http_max_keepalive()
+        self.keepalive_expiry = keepalive_expiry or get_http_keepalive_expiry()
+
+        self._lock = threading.Lock()
+        self._models = {}
+        self._http_client = None
+        self._http_async_client = None
+
+        # Gemeinsame Drosselung aller Aufrufe dieses Pools (429-Backoff, AIMD)
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
+
+        # Eigene Event-Loop für async Aufrufe: ein httpx.AsyncClient ist an die
+        # Loop gebunden, in der seine Verbindungen entstanden sind
+        self._loop = None
+        self._loop_thread = None
+
+    def get_chat_model(self, model, temperature, max_tokens, api_key, base_url=OPENROUTER_BASE_URL,
+                       provider="openrouter"):
+        """
+        Gibt ein (geteiltes) Chat-Modell für die angegebene Konfiguration zurück
+
+        Args:
+            model: Modellname (z.B. "mistralai/mistral-small-24b-instruct-2501:free")
+            temperature: Kreativitätslevel
+            max_tokens: Maximale Antwortlänge in Tokens
+            api_key: OpenRouter API-Schlüssel
+            base_url: API-Endpunkt
+            provider: "openrouter" oder "fake" (Offline-Modell, siehe fake_llm.py)
+
+        Returns:
+            LangChain Chat-Modell, das die Verbindungen dieses Pools nutzt
+        """
+        key = (provider, model, temperature, max_tokens, base_url, api_key)
+        with self._lock:
+            chat_model = self._models.get(key)
+            if chat_model is None:
+                if provider == "fake":
+                    from fake_llm import create_fake_chat_model
+                    chat_model = create_fake_chat_model()
+                else:
+                    chat_model = self._build_chat_model(model, temperature, max_tokens, api_key, base_url)
+                self._models[key] = chat_model
+            return chat_model
+
+    def _build_chat_model(self, model, temperature, max_tokens, api_key, base_url):
+        """Baut ein neues Chat-Modell mit den geteilten HTTP-Clients"""
+        http_client, http_async_client = self._get_http_clients()
+        default_headers = {
+            "HTTP-Referer": os.getenv('YOUR_SITE_URL', 'https://localhost:3000'),
+            "X-Title": os.getenv('YOUR_SITE_NAME', 'Synthetic Interview PoC'),
+        }
+
+        # Verwende moderne LangChain init_chat_model Funktion
+        try:
+            from langchain.chat_models import init_chat_model
+
+            return init_chat_model(
+                model=model,
+                model_provider="openai",
+                api_key=api_key,
+                base_url=base_url,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                default_headers=default_headers,
+                http_client=http_client,
+                http_async_client=http_async_client,
+                # Token-Zählung auch beim Streamen (letztes Stück enthält usage_metadata)
+                stream_usage=True,
+                # Wiederholungen übernimmt rate_limiter.call_with_retry, damit
+                # jeder 429 auch beim gemeinsamen Limiter ankommt
+                max_retries=0
+            )
+        except ImportError:
+            # Fallback für ältere LangChain Versionen
+            from langchain_openai import ChatOpenAI
+            return ChatOpenAI(
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                openai_api_key=api_key,
+                openai_api_base=base_url,
+                default_headers=default_headers,
+                http_client=http_client,
+                http_async_client=http_async_client,
+                stream_usage=True,
+                max_retries=0
+            )
+
+    def _get_http_clients(self):
+        """Erstellt die geteilten HTTP-Clients beim ersten Bedarf (Aufrufer hält den Lock)"""
+        if self._http_client is None:
+            import httpx
+            from openai import DefaultHttpxClient, DefaultAsyncHttpxClient
+
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry
+            )
+            self._http_client = DefaultHttpxClient(limits=limits)
+            self._http_async_client = DefaultAsyncHttpxClient(limits=limits)
+        return self._http_client, self._http_async_client
+
+    def run_async(self, coroutine):
+        """
+        Führt eine Coroutine auf der Event-Loop dieses Pools aus und wartet auf das Ergebnis
+
+        Alle async LLM-Aufrufe eines Pools laufen so auf derselben Loop und
+        können die Keep-Alive-Verbindungen des AsyncClients wiederverwenden,
+        auch über mehrere Interviews hinweg.
+
+        Args:
+            coroutine: Die auszuführende Coroutine
+
+        Returns:
+            Das Ergebnis der Coroutine
+        """
+        import asyncio
+
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._get_loop())
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def _get_loop(self):
+        """Startet die Hintergrund-Event-Loop des Pools beim ersten Bedarf"""
+        import asyncio
+
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="llm-client-pool-loop",
+                    daemon=True
+                )
+                self._loop_thread.start()
+            return self._loop
+
+    def close(self):
+        """Schließt alle Verbindungen und vergisst die zwischengespeicherten Modelle"""
+        with self._lock:
+            http_client, http_async_client = self._http_client, self._http_async_client
+            loop, loop_thread = self._loop, self._loop_thread
+            self._models.clear()
+            self._http_client = None
+            self._http_async_client = None
+            self._loop = None
+            self._loop_thread = None
+
+        if http_client is not None:
+            http_client.close()
+        if loop is not None:
+            if http_async_client is not None:
+                import asyncio
+                asyncio.run_coroutine_threadsafe(http_async_client.aclose(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            # Thread und Selector der Loop freigeben, nicht nur anhalten
+            if loop_thread is not None and loop_thread is not threading.current_thread():
+                loop_thread.join(timeout=5)
+            if not loop.is_running():
+                loop.close()
+
+
+class ClientPoolRegistry:
+    """
+    Eigene Client-Pools pro Schlüssel (z.B. Browser-Session) mit Leerlauf-Ablauf
+
+    Jeder Pool hält HTTP-Verbindungen und evtl. einen Event-Loop-Thread. Pools,
+    die länger als idle_seconds nicht abgefragt wurden, werden geschlossen -
+    aber nie, solange is_busy(pool) sie noch als benutzt meldet (laufender Job).
+    """
+
+    def __init__(self, idle_seconds=None, is_busy=None):
+        """
+        Args:
+            idle_seconds: Leerlaufzeit bis ein Pool geschlossen wird (Standard: CLIENT_POOL_IDLE_SECONDS)
+            is_busy: Optionale Funktion is_busy(pool) -> True, solange der Pool noch gebraucht wird
+        """
+        self.idle_seconds = idle_seconds if idle_seconds is not None else get_client_pool_idle_seconds()
+        self.is_busy = is_busy or (lambda pool: False)
+        self._pools = {}
+        self._retired = []
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Gibt den Pool zum Schlüssel zurück (legt ihn bei Bedarf an) und räumt abgelaufene Pools auf
+
+        Returns:
+            ClientPool-Instanz
+        """
+        with self._lock:
+            entry = self._pools.get(key)
+            if entry is None:
+                entry = self._pools[key] = [ClientPool(), 0.0]
+            entry[1] = time.monotonic()
+            pool = entry[0]
+        self.close_idle()
+        return pool
+
+    def discard(self, key):
+        """Gibt den Pool zum Schlüssel ab - er wird geschlossen, sobald er nicht mehr benutzt wird"""
+        with self._lock:
+            entry = self._pools.pop(key, None)
+            if entry is not None:
+                self._retired.append(entry[0])
+        self.close_idle()
+
+    def close_idle(self):
+        """
+        Schließt abgegebene und zu lange unbenutzte Pools, die is_busy nicht mehr meldet
+
+        Returns:
+            Anzahl geschlossener Pools
+        """
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, (_, last_used) in self._pools.items()
+                       if now - last_used > self.idle_seconds]
+            for key in expired:
+                self._retired.append(self._pools.pop(key)[0])
+            candidates, self._retired = self._retired, []
+
+        busy = [pool for pool in candidates if self.is_busy(pool)]
+        with self._lock:
+            self._retired.extend(busy)
+        for pool in candidates:
+            if pool not in busy:
+                pool.close()
+        return len(candidates) - len(busy)
+
+    def close_all(self):
+        """Schließt alle Pools (z.B. beim Beenden des Servers)"""
+        with self._lock:
+            pools = [entry[0] for entry in self._pools.values()] + self._retired
+            self._pools, self._retired = {}, []
+        for pool in pools:
+            pool.close()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._pools)
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_client_pool():
+    """
+    Gibt den prozessweiten Standard-Client-Pool zurück
+
+    Returns:
+        ClientPool-Instanz, die von allen Personas ohne eigenen Pool geteilt wird
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = ClientPool()
+        return _default_pool
@@ -0,0 +1,217 @@
+"""
+Gesprächsgedächtnis der Personas - begrenzt nach Turns und Tokens
+
+Ein PersonaAgent merkte sich bisher jeden Turn in einer Liste, obwohl nur
+die letzten beiden in den Kontext kamen. ConversationMemory hält stattdessen:
+
+- einen Ringpuffer der letzten erfolgreichen Turns (MEMORY_WINDOW)
+- ein Token-Budget für den Verlauf im Kontext (MEMORY_TOKEN_BUDGET),
+  gemessen mit einer pro Turn einmal berechneten Token-Schätzung
+  (Fragen wiederholen sich über Personas hinweg und werden zwischengespeichert)
+- optional eine fortlaufende Kurzfassung älterer Turns (MEMORY_SUMMARY_TOKENS),
+  die selbst ein festes Budget hat
+
+Kontextgröße - und damit Prompt-Tokens und Latenz - bleiben so gleich groß,
+egal wie lange ein Interview oder eine GUI-Sitzung läuft.
+"""
+
+import os
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional
+
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+_TURN_MARKUP_TOKENS = 6  # "F: ", "A: " und Zeilenumbrüche
+
+
+def get_memory_window():
+    """Wie viele erfolgreiche Turns eine Persona höchstens behält (Standard: 2)"""
+    return max(1, int(os.getenv('MEMORY_WINDOW', 2)))
+
+
+def get_memory_token_budget():
+    """Maximale Tokens für den Verlauf im Kontext (Standard: 1000)"""
+    return max(1, int(os.getenv('MEMORY_TOKEN_BUDGET', 1000)))
+
+
+def get_memory_summary_tokens():
+    """Token-Budget der Kurzfassung älterer Turns (Standard: 0 = keine Kurzfassung)"""
+    return max(0, int(os.getenv('MEMORY_SUMMARY_TOKENS', 0)))
+
+
+def count_tokens(text: str) -> int:
+    """
+    Schätzt die Token-Anzahl eines Textes (ohne Tokenizer-Abhängigkeit)
+
+    Wörter zählen wegen Zerlegung in Wortstücke etwas mehr als einen Token,
+    Satzzeichen je einen.
+
+    Args:
+        text: Beliebiger Text
+
+    Returns:
+        Geschätzte Anzahl Tokens
+    """
+    tokens = 0
+    for match in _TOKEN_PATTERN.finditer(text):
+        piece = match.group()
+        tokens += 1 + len(piece) // 8 if piece[0].isalnum() else 1
+    return tokens
+
+
+@lru_cache(maxsize=1024)
+def estimate_tokens(text: str) -> int:
+    """Wie count_tokens, zwischengespeichert - für Texte, die sich wiederholen (Fragen)"""
+    return count_tokens(text)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Kürzt einen Text auf höchstens max_tokens (an Wortgrenzen, "…" zählt mit)"""
+    if count_tokens(text) <= max_tokens:
+        return text
+    words = text.split()
+    kept = []
+    used = 0
+    for word in words:
+        used += count_tokens(word)
+        if used > max_tokens - 1:
+            break
+        kept.append(word)
+    return " ".join(kept) + " …"
+
+
+class Turn(NamedTuple):
+    """Ein gespeicherter Gesprächs-Turn"""
+    question: str
+    response: str
+    error: bool
+    tokens: int
+
+
+class ConversationMemory:
+    """
+    Begrenztes Gedächtnis einer Persona
+
+    Fehlgeschlagene Turns ("[Fehler: ...]") werden gezählt, kommen aber weder
+    in den Ringpuffer noch in den Kontext.
+    """
+
+    def __init__(self, window: Optional[int] = None, token_budget: Optional[int] = None,
+                 summary_tokens: Optional[int] = None):
+        """
+        Args:
+            window: Anzahl behaltener Turns (Standard: MEMORY_WINDOW)
+            token_budget: Tokens für den Verlauf im Kontext (Standard: MEMORY_TOKEN_BUDGET)
+            summary_tokens: Tokens der Kurzfassung, 0 = aus (Standard: MEMORY_SUMMARY_TOKENS)
+        """
+        self.window = window or get_memory_window()
+        self.token_budget = token_budget or get_memory_token_budget()
+        self.summary_tokens = get_memory_summary_tokens() if summary_tokens is None else summary_tokens
+        self._turns = deque(maxlen=self.window)
+        self._summary = deque()
+        self._summary_token_count = 0
+        self.turn_count = 0
+        self.error_count = 0
+        self.last_error = None
+
+    def __len__(self) -> int:
+        return len(self._turns)
+
+    def add_turn(self, question: str, response: str, error: bool = False):
+        """
+        Speichert einen Turn; der älteste fällt bei vollem Puffer heraus
+
+        Args:
+            question: Die gestellte Frage
+            response: Die Antwort der Persona
+            error: True für Fehlermeldungen statt Antworten
+        """
+        self.turn_count += 1
+        if error:
+            self.error_count += 1
+            self.last_error = Turn(question, response, True, 0)
+            return
+        if len(self._turns) == self.window:
+            self._summarize(self._turns[0])
+        # Jede Frage geht an alle Personas - ihre Schätzung kommt aus dem Cache
+        tokens = estimate_tokens(question) + count_tokens(response) + _TURN_MARKUP_TOKENS
+        self._turns.append(Turn(question, response, False, tokens))
+
+    def _summarize(self, turn: Turn):
+        """Nimmt einen herausfallenden Turn als Stichpunkt in die Kurzfassung auf"""
+        if not self.summary_tokens:
+            return
+        first_sentence = _SENTENCE_END.split(turn.response.strip(), maxsplit=1)[0]
+        line = truncate_to_tokens(f"{turn.question} → {first_sentence}", max(8, self.summary_tokens // 3))
+        line_tokens = count_tokens(line) + 1
+        self._summary.append((line, line_tokens))
+        self._summary_token_count += line_tokens
+        # Älteste Stichpunkte fallen heraus, sobald das Budget überschritten ist
+        while self._summary_token_count > self.summary_tokens and len(self._summary) > 1:
+            _, dropped_tokens = self._summary.popleft()
+            self._summary_token_count -= dropped_tokens
+
+    def get_summary(self) -> str:
+        """Kurzfassung der aus dem Puffer gefallenen Turns (leer, wenn aus)"""
+        return "\n".join(f"- {line}" for line, _ in self._summary)
+
+    def build_history(self) -> str:
+        """
+        Baut den Verlauf für den Kontext - neueste Turns zuerst ins Budget
+
+        Returns:
+            Verlauf ("F: ...\\nA: ...\\n" je Turn, älteste zuerst) oder ""
+        """
+        selected = []
+        remaining = self.token_budget
+        for turn in reversed(self._turns):
+            if turn.tokens > remaining:
+                available = remaining - _TURN_MARKUP_TOKENS
+                if not selected and available > 0:
+                    # Der neueste Turn kommt mit, notfalls gekürzt - Frage und
+                    # "F:/A:"-Rahmen zählen mit, gekürzt wird zuerst die Antwort
+                    question = truncate_to_tokens(turn.question, available)
+                    response_budget = available - estimate_tokens(question)
+                    response = truncate_to_tokens(turn.response, response_budget) if response_budget > 0 else ""
+                    selected.append(Turn(question, response, False, remaining))
+                break
+            selected.append(turn)
+            remaining -= turn.tokens
+        return "".join(f"F: {turn.question}\nA: {turn.response}\n" for turn in reversed(selected))
+
+    def build_context(self, question: str, use_history: bool = True) -> str:
+        """
+        Erstellt den Kontext einer Frage - nur aus dem eigenen Gedächtnis
+
+        Args:
+            question: Die aktuelle Frage
+            use_history: False für zustandslose Antworten
+
+        Returns:
+            Kontext-Text für das Modell
+        """
+        parts = [f"Interview-Frage: {question}"]
+        if use_history:
+            summary = self.get_summary()
+            if summary:
+                parts.append(f"\n\nFrüher im Interview:\n{summary}")
+            history = self.build_history()
+            if history:
+                parts.append(f"\n\nDein bisheriger Verlauf:\n{history}")
+        return "".join(parts)
+
+    def clear(self):
+        """Vergisst alle Turns, die Kurzfassung und die Zähler"""
+        self._turns.clear()
+        self._summary.clear()
+        self._summary_token_count = 0
+        self.turn_count = 0
+        self.error_count = 0
+        self.last_error = None
+
+    def to_list(self) -> List[Dict]:
+        """Behaltene Turns als Liste von Dictionaries (question, response, error)"""
+        return [{"question": turn.question, "response": turn.response, "error": turn.error}
+                for turn in self._turns]
@@ -0,0 +1,323 @@
+"""
+Token-, Kosten- und Latenz-Messung pro Aufruf, Persona, Frage und Lauf
+
+Jeder Aufruf von PersonaAgent.respond/arespond/stream_respond wird als
+CallRecord festgehalten: Prompt- und Antwort-Tokens (usage_metadata des
+Modells, sonst geschätzt), Zeit bis zum ersten Token, Gesamtlatenz,
+Wiederholungen (429/5xx) und Cache-Status. Ein MetricsCollector sammelt die
+Aufrufe eines Laufs und fasst sie pro Persona, pro Frage und für den ganzen
+Lauf zusammen - für den JSON-Bericht ("metrics") und als Prometheus-Textdatei
+für den Textfile-Collector des node_exporter (--metrics-file).
+
+Kosten (USD) werden aus LLM_PRICE_PROMPT und LLM_PRICE_COMPLETION berechnet,
+jeweils pro 1 Million Tokens (Standard 0 - die Standard-Modelle sind kostenlos).
+"""
+
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Cache-Status eines Aufrufs
+CACHE_OFF = "off"        # kein Cache konfiguriert
+CACHE_MISS = "miss"      # Modell wurde gefragt
+CACHE_HIT = "hit"        # exakter Treffer
+CACHE_SEMANTIC = "semantic"  # Antwort auf eine ähnliche frühere Frage
+CACHE_STATUSES = (CACHE_OFF, CACHE_MISS, CACHE_HIT, CACHE_SEMANTIC)
+
+PROMETHEUS_PREFIX = "synthetic_interview"
+
+_LABEL_ESCAPES = str.maketrans({"\\": "\\\\", "\"": "\\\"", "\n": "\\n"})
+_INVALID_LABEL_NAME = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def get_llm_prices():
+    """Preise in USD pro 1 Million Prompt- bzw. Antwort-Tokens (Standard: 0)"""
+    return (float(os.getenv('LLM_PRICE_PROMPT', 0) or 0),
+            float(os.getenv('LLM_PRICE_COMPLETION', 0) or 0))
+
+
+def get_metrics_file():
+    """Standard-Pfad des Prometheus-Exports (METRICS_FILE, leer = kein Export)"""
+    return os.getenv("METRICS_FILE") or None
+
+
+def get_metrics_max_persona_series():
+    """Höchstens so viele Personas bekommen eigene Prometheus-Reihen (Standard: 50)"""
+    return int(os.getenv('METRICS_MAX_PERSONA_SERIES', 50))
+
+
+class CallRecord(NamedTuple):
+    """Ein gemessener Aufruf einer Persona"""
+    persona: str
+    question: str
+    prompt_tokens: int
+    completion_tokens: int
+    usage_estimated: bool
+    ttft_seconds: Optional[float]
+    latency_seconds: float
+    retries: int
+    cache: str
+    error: bool
+
+
+class CallTimer:
+    """
+    Misst einen Aufruf von der Anfrage bis zur vollständigen Antwort
+
+    Die Zeit bis zum ersten Token zählt ab Beginn des Aufrufs (inklusive
+    Warten auf den Rate-Limiter und fehlgeschlagener Versuche).
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.first_token = None
+        self.retries = 0
+        self.prompt_tokens = None
+        self.completion_tokens = None
+
+    def mark_first_token(self):
+        """Merkt sich den Zeitpunkt des ersten Tokens (nur beim ersten Aufruf)"""
+        if self.first_token is None:
+            self.first_token = time.perf_counter()
+
+    def count_retry(self, *_):
+        """Zählt eine Wiederholung - ein abgebrochener Versuch zählt nicht als erstes Token"""
+        self.retries += 1
+        self.first_token = None
+
+    def add_usage(self, usage_metadata: Optional[Dict]):
+        """Übernimmt usage_metadata einer Antwort oder eines Stream-Stücks"""
+        if not usage_metadata:
+            return
+        self.prompt_tokens = (self.prompt_tokens or 0) + usage_metadata.get('input_tokens', 0)
+        self.completion_tokens = (self.completion_tokens or 0) + usage_metadata.get('output_tokens', 0)
+
+    def finish(self, persona: str, question: str, cache: str, error: bool = False,
+               prompt_text: str = "", response: str = "") -> CallRecord:
+        """
+        Schließt die Messung ab
+
+        Args:
+            persona: Name der Persona
+            question: Die Frage
+            cache: Cache-Status (CACHE_STATUSES)
+            error: True, wenn der Aufruf mit einer Fehlermeldung endete
+            prompt_text: System-Prompt und Kontext - für die Schätzung, falls das Modell keine Tokens meldet
+            response: Die Antwort - ebenfalls für die Schätzung
+
+        Returns:
+            CallRecord
+        """
+        latency = time.perf_counter() - self.started
+        called_model = cache == CACHE_MISS or cache == CACHE_OFF
+        estimated = called_model and not error and self.prompt_tokens is None
+        if estimated:
+            from memory import count_tokens
+            self.prompt_tokens = count_tokens(prompt_text)
+            self.completion_tokens = count_tokens(response)
+        return CallRecord(
+            persona=persona,
+            question=question,
+            prompt_tokens=self.prompt_tokens or 0,
+            completion_tokens=self.completion_tokens or 0,
+            usage_estimated=estimated,
+            ttft_seconds=self.first_token - self.started if self.first_token is not None and called_model else None,
+            latency_seconds=latency,
+            retries=self.retries,
+            cache=cache,
+            error=error
+        )
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    """Perzentil (nearest rank) einer sortierten Liste, None wenn leer"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def summarize_durations(values: Iterable[float]) -> Dict:
+    """Fasst Zeiten (Sekunden) zu Anzahl, Summe, Mittelwert, p50/p95/p99 und Maximum zusammen"""
+    values = sorted(values)
+    total = sum(values)
+    return {
+        "count": len(values),
+        "sum": round(total, 6),
+        "mean": round(total / len(values), 6) if values else None,
+        "p50": _round(_percentile(values, 0.50)),
+        "p95": _round(_percentile(values, 0.95)),
+        "p99": _round(_percentile(values, 0.99)),
+        "max": _round(values[-1] if values else None)
+    }
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 6) if value is not None else None
+
+
+class MetricsCollector:
+    """Sammelt die CallRecords eines Laufs (thread-sicher)"""
+
+    def __init__(self, prices: Optional[Tuple[float, float]] = None):
+        """
+        Args:
+            prices: (Prompt, Antwort) in USD pro 1 Million Tokens (Standard: LLM_PRICE_PROMPT/COMPLETION)
+        """
+        self.prices = prices or get_llm_prices()
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._records = []
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def record(self, call: CallRecord):
+        """Hängt einen gemessenen Aufruf an"""
+        with self._lock:
+            self._records.append(call)
+
+    def get_records(self) -> List[CallRecord]:
+        """Alle bisher gemessenen Aufrufe"""
+        with self._lock:
+            return list(self._records)
+
+    def _summarize(self, records: List[CallRecord]) -> Dict:
+        """Kennzahlen einer Gruppe von Aufrufen"""
+        prompt_tokens = sum(record.prompt_tokens for record in records)
+        completion_tokens = sum(record.completion_tokens for record in records)
+        cache = dict.fromkeys(CACHE_STATUSES, 0)
+        for record in records:
+            cache[record.cache] += 1
+        return {
+            "calls": len(records),
+            "errors": sum(record.error for record in records),
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "estimated_usage_calls": sum(record.usage_estimated for record in records),
+            "cost_usd": round((prompt_tokens * self.prices[0] + completion_tokens * self.prices[1]) / 1e6, 6),
+            "retries": sum(record.retries for record in records),
+            "cache": cache,
+            "latency_seconds": summarize_durations(record.latency_seconds for record in records),
+            "ttft_seconds": summarize_durations(record.ttft_seconds for record in records
+                                                if record.ttft_seconds is not None)
+        }
+
+    def get_summary(self, include_groups: bool = True) -> Dict:
+        """
+        Fasst den Lauf zusammen
+
+        Args:
+            include_groups: False = nur Gesamtwerte (ohne pro Persona/Frage)
+
+        Returns:
+            {"run": {...}, "personas": {Name: {...}}, "questions": [{"question", ...}]}
+        """
+        records = self.get_records()
+        summary = {"run": dict(self._summarize(records), wall_seconds=round(time.time() - self.started_at, 3))}
+        if include_groups:
+            by_persona = {}
+            by_question = {}
+            for record in records:
+                by_persona.setdefault(record.persona, []).append(record)
+                by_question.setdefault(record.question, []).append(record)
+            summary["personas"] = {persona: self._summarize(group) for persona, group in by_persona.items()}
+            summary["questions"] = [dict(question=question, **self._summarize(group))
+                                    for question, group in by_question.items()]
+        return summary
+
+
+# =====================================
+# PROMETHEUS-TEXTFORMAT
+# =====================================
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    parts = [f'{_INVALID_LABEL_NAME.sub("_", name)}="{str(value).translate(_LABEL_ESCAPES)}"'
+             for name, value in labels.items()]
+    return "{" + ",".join(parts) + "}"
+
+
+def _format_value(value) -> str:
+    return "NaN" if value is None else repr(float(value))
+
+
+def format_prometheus(runs: List[Tuple[Dict[str, str], Dict]], max_persona_series: Optional[int] = None) -> str:
+    """
+    Wandelt Lauf-Zusammenfassungen in das Prometheus-Textformat um
+
+    Args:
+        runs: Liste von (Labels, get_summary()) - z.B. ein Eintrag pro Batch-Job
+        max_persona_series: Personas mit eigenen Reihen je Lauf (Standard: METRICS_MAX_PERSONA_SERIES)
+
+    Returns:
+        Inhalt der .prom-Datei
+    """
+    max_persona_series = get_metrics_max_persona_series() if max_persona_series is None else max_persona_series
+    samples = {}
+
+    def add(name, help_text, labels, value, metric_type="gauge", suffix=""):
+        samples.setdefault(name, (help_text, metric_type, []))[2].append((suffix, labels, value))
+
+    for labels, summary in runs:
+        run = summary["run"]
+        add("calls", "Aufrufe im letzten Lauf", labels, run["calls"])
+        add("errors", "Aufrufe mit Fehlermeldung im letzten Lauf", labels, run["errors"])
+        add("retries", "Wiederholte Versuche (429/5xx) im letzten Lauf", labels, run["retries"])
+        for kind in ("prompt", "completion"):
+            add("tokens", "Tokens im letzten Lauf", dict(labels, kind=kind), run[f"{kind}_tokens"])
+        add("cost_usd", "Geschätzte Kosten des letzten Laufs in USD", labels, run["cost_usd"])
+        for status, count in run["cache"].items():
+            add("cache_lookups", "Aufrufe nach Cache-Status im letzten Lauf", dict(labels, status=status), count)
+        for metric, help_text in (("latency_seconds", "Latenz pro Aufruf im letzten Lauf"),
+                                  ("ttft_seconds", "Zeit bis zum ersten Token im letzten Lauf")):
+            # Eine Summary-Familie: Quantile plus _sum und _count
+            durations = run[metric]
+            for key, quantile in (("p50", "0.5"), ("p95", "0.95"), ("p99", "0.99")):
+                add(metric, help_text, dict(labels, quantile=quantile), durations[key], "summary")
+            add(metric, help_text, labels, durations["sum"], "summary", "_sum")
+            add(metric, help_text, labels, durations["count"], "summary", "_count")
+        add("wall_seconds", "Dauer des letzten Laufs", labels, run["wall_seconds"])
+        personas = summary.get("personas", {})
+        for persona in list(personas)[:max_persona_series]:
+            persona_labels = dict(labels, persona=persona)
+            add("persona_tokens", "Tokens pro Persona im letzten Lauf", persona_labels,
+                personas[persona]["total_tokens"])
+            add("persona_latency_seconds_p95", "p95-Latenz pro Persona im letzten Lauf", persona_labels,
+                personas[persona]["latency_seconds"]["p95"])
+        add("last_run_timestamp_seconds", "Ende des letzten Laufs (Unix-Zeit)", labels, time.time())
+
+    lines = []
+    for name, (help_text, metric_type, values) in samples.items():
+        metric = f"{PROMETHEUS_PREFIX}_{name}"
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {metric_type}")
+        lines.extend(f"{metric}{suffix}{_format_labels(labels)} {_format_value(value)}"
+                     for suffix, labels, value in values)
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus_textfile(path: str, runs: List[Tuple[Dict[str, str], Dict]]):
+    """
+    Schreibt die Kennzahlen atomar als .prom-Datei (erst temporär, dann umbenannt),
+    damit der Textfile-Collector nie eine halbe Datei liest
+
+    Args:
+        path: Zieldatei, z.B. /var/lib/node_exporter/textfile/interviews.prom
+        runs: Liste von (Labels, get_summary())
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=".metrics_", suffix=".prom.tmp")
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            file.write(format_prometheus(runs))
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
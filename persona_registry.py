@@ -0,0 +1,161 @@
+"""
+Persona-Registry - leichte Persona-Definitionen aus einer Katalog-Datei
+
+Die Registry kennt nur die Beschreibungen der Personas (PersonaSpec), nicht die
+fertigen PersonaAgent-Objekte. Ein Agent mit Sprachmodell und Prompt-Vorlage wird
+erst gebaut, wenn eine Persona tatsächlich befragt wird (agents.create_persona_from_spec).
+Namen auflisten oder eine Persona nachschlagen kostet damit fast nichts, auch
+bei Katalogen mit tausenden Personas.
+
+Katalog-Format (JSON oder YAML):
+    {"personas": [{"id": "anna", "name": "Anna", "age": 20, "characteristics": "...",
+                   "background": "...", "detailed_personality": "..."}]}
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+DEFAULT_CATALOG = Path(__file__).resolve().parent / "personas.json"
+
+
+def get_persona_catalog_path():
+    """Pfad zur Persona-Katalog-Datei (Standard: personas.json neben diesem Modul)"""
+    return os.getenv('PERSONA_CATALOG', str(DEFAULT_CATALOG))
+
+
+@dataclass(frozen=True)
+class PersonaSpec:
+    """Beschreibung einer Persona - ohne Sprachmodell, daher billig zu erzeugen"""
+    id: str
+    name: str
+    age: int
+    characteristics: str
+    background: str
+    detailed_personality: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PersonaSpec":
+        """Erstellt eine PersonaSpec aus einem Katalog-Eintrag"""
+        return cls(
+            id=str(data.get('id') or data['name']).lower(),
+            name=data['name'],
+            age=data['age'],
+            characteristics=data.get('characteristics', ''),
+            background=data.get('background', ''),
+            detailed_personality=data.get('detailed_personality', '')
+        )
+
+    def to_dict(self) -> Dict:
+        """Gibt die Persona als Dictionary zurück"""
+        return asdict(self)
+
+
+class PersonaRegistry:
+    """
+    Katalog aller verfügbaren Personas mit indexierter Suche nach Namen
+
+    Die Katalog-Datei wird erst beim ersten Zugriff gelesen.
+    """
+
+    def __init__(self, catalog_path: Optional[str] = None, specs: Optional[List[PersonaSpec]] = None):
+        """
+        Erstellt eine Registry
+
+        Args:
+            catalog_path: Pfad zur JSON/YAML-Katalog-Datei (Standard: PERSONA_CATALOG)
+            specs: Alternativ direkt eine Liste von PersonaSpecs (ohne Datei)
+        """
+        self.catalog_path = catalog_path or get_persona_catalog_path()
+        self._specs = None
+        self._index = None
+        self._lock = threading.Lock()
+        if specs is not None:
+            self._set_specs(specs)
+
+    def names(self) -> List[str]:
+        """Gibt die Anzeige-Namen aller Personas in Katalog-Reihenfolge zurück"""
+        return [spec.name for spec in self._get_specs()]
+
+    def ids(self) -> List[str]:
+        """Gibt die IDs (kleingeschriebene Namen) aller Personas zurück"""
+        return [spec.id for spec in self._get_specs()]
+
+    def get(self, name: str) -> Optional[PersonaSpec]:
+        """
+        Sucht eine Persona nach ID oder Namen (Groß-/Kleinschreibung egal)
+
+        Returns:
+            PersonaSpec oder None, wenn die Persona nicht existiert
+        """
+        self._get_specs()
+        return self._index.get(name.lower())
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+
+    def __iter__(self) -> Iterator[PersonaSpec]:
+        return iter(self._get_specs())
+
+    def __len__(self) -> int:
+        return len(self._get_specs())
+
+    def _get_specs(self) -> List[PersonaSpec]:
+        """Lädt den Katalog beim ersten Zugriff"""
+        if self._specs is None:
+            with self._lock:
+                if self._specs is None:
+                    self._set_specs(load_persona_catalog(self.catalog_path))
+        return self._specs
+
+    def _set_specs(self, specs: List[PersonaSpec]):
+        """Setzt die Personas und baut den Namens-Index auf"""
+        index = {}
+        for spec in specs:
+            index[spec.id] = spec
+            index.setdefault(spec.name.lower(), spec)
+        self._index = index
+        self._specs = list(specs)
+
+
+def load_persona_catalog(catalog_path: str) -> List[PersonaSpec]:
+    """
+    Liest eine Persona-Katalog-Datei (JSON, oder YAML wenn PyYAML installiert ist)
+
+    Args:
+        catalog_path: Pfad zur Katalog-Datei
+
+    Returns:
+        Liste von PersonaSpec-Objekten
+    """
+    with open(catalog_path, 'r', encoding='utf-8') as file:
+        if str(catalog_path).endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("YAML-Kataloge benötigen PyYAML: pip install pyyaml")
+            data = yaml.safe_load(file)
+        else:
+            data = json.load(file)
+
+    # Format 1: {"personas": [...]}, Format 2: [...]
+    entries = data.get('personas', []) if isinstance(data, dict) else data
+    return [PersonaSpec.from_dict(entry) for entry in entries]
+
+
+_default_registry = None
+_default_registry_lock = threading.Lock()
+
+
+def get_persona_registry() -> PersonaRegistry:
+    """
+    Gibt die prozessweite Standard-Registry zurück (Katalog aus PERSONA_CATALOG)
+    """
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = PersonaRegistry()
+        return _default_registry
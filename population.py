@@ -0,0 +1,582 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Synthetische Population - große Persona-Panels aus deklarativen Verteilungen
+
+Statt weniger handgeschriebener Personas beschreibt ein Populations-Modell
+(JSON, Standard: population.json) Merkmale wie Alter, Einkommen, Werte oder
+Mediennutzung als Verteilungen. Daraus werden tausende Personas gezogen:
+
+- Ziehen vektorisiert mit NumPy, eine Spalte pro Merkmal
+- Stichprobenverfahren: zufällig, geschichtet (proportionale Aufteilung)
+  oder nach Quoten
+- PersonaSpecs und Prompts (create_personality_prompt) entstehen erst beim
+  Zugriff; interviewt wird in Teil-Panels, so dass nie das ganze Panel als
+  PersonaAgents im Speicher liegt
+
+Verteilungen im Modell:
+    categorical  {"values": {"Label": Gewicht, ...}}, optional "given": Merkmal
+                 mit je einer Gewichtstabelle pro Ausprägung des Merkmals
+    normal       {"mean", "std"} - optional "min", "max", "integer"
+    lognormal    {"median", "sigma"} - optional "min", "max", "integer"
+    uniform      {"min", "max"} - optional "integer"
+    multi        {"values": {...}, "count": k} - k verschiedene Ausprägungen
+    bins         {"source": Merkmal, "edges": [...], "labels": [...]} - Klassen
+                 eines Zahlen-Merkmals (z.B. Altersgruppen)
+
+Usage:
+    python population.py --size 1000 --describe
+    python population.py --size 10000 --method stratified --by income --questions questions.json
+    python population.py --size 500 --method quota --quota gender=weiblich:0.5,männlich:0.5 --questions questions.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from agents import create_personality_prompt
+from persona_registry import PersonaSpec
+
+DEFAULT_POPULATION_MODEL = Path(__file__).resolve().parent / "population.json"
+
+SAMPLING_METHODS = ("random", "stratified", "quota")
+DISTRIBUTIONS = ("categorical", "normal", "lognormal", "uniform", "multi", "bins")
+CATEGORICAL_DISTRIBUTIONS = ("categorical", "bins")
+
+
+def get_population_model_path():
+    """Pfad zum Populations-Modell (Standard: population.json neben diesem Modul)"""
+    return os.getenv('POPULATION_MODEL', str(DEFAULT_POPULATION_MODEL))
+
+
+def get_population_chunk_size():
+    """Wie viele Personas eines Panels gleichzeitig als PersonaAgents existieren"""
+    return max(1, int(os.getenv('POPULATION_CHUNK_SIZE', 100)))
+
+
+def _normalize(weights) -> np.ndarray:
+    """Gewichte -> Wahrscheinlichkeiten"""
+    weights = np.asarray(weights, dtype=float)
+    if weights.ndim != 1 or len(weights) == 0 or (weights < 0).any() or weights.sum() <= 0:
+        raise ValueError(f"Ungültige Gewichte: {weights.tolist()}")
+    return weights / weights.sum()
+
+
+def allocate_counts(total: int, shares) -> np.ndarray:
+    """
+    Teilt `total` proportional auf (Verfahren der größten Reste)
+
+    Args:
+        total: Gesamtzahl
+        shares: Anteile oder Gewichte
+
+    Returns:
+        Ganzzahlige Anzahlen, deren Summe genau `total` ist
+    """
+    exact = _normalize(shares) * total
+    counts = np.floor(exact).astype(np.int64)
+    remainder = total - counts.sum()
+    if remainder:
+        counts[np.argsort(counts - exact, kind='stable')[:remainder]] += 1
+    return counts
+
+
+class AttributeModel:
+    """Verteilung eines Merkmals - zieht eine ganze Spalte auf einmal"""
+
+    def __init__(self, name: str, config: Dict):
+        """
+        Args:
+            name: Name des Merkmals (z.B. "age")
+            config: Eintrag aus dem Populations-Modell
+        """
+        self.name = name
+        self.distribution = config.get('distribution', 'categorical')
+        if self.distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Merkmal '{name}': unbekannte Verteilung {self.distribution} "
+                             f"(erlaubt: {', '.join(DISTRIBUTIONS)})")
+        self.config = config
+        self.given = config.get('given')
+        self.source = config.get('source')
+        self.integer = bool(config.get('integer', False))
+        self.labels = []
+        self.probabilities = None
+        self.conditional = None
+
+        if self.distribution in ("categorical", "multi"):
+            values = config['values']
+            if self.given and self.distribution == "multi":
+                raise ValueError(f"Merkmal '{name}': 'given' ist nur bei categorical erlaubt")
+            if self.given:
+                # {"Ausprägung des Eltern-Merkmals": {"Label": Gewicht}}
+                self.labels = list(dict.fromkeys(label for table in values.values() for label in table))
+                self.conditional = {
+                    parent_label: _normalize([table.get(label, 0) for label in self.labels])
+                    for parent_label, table in values.items()
+                }
+            else:
+                self.labels = list(values)
+                self.probabilities = _normalize(list(values.values()))
+        elif self.distribution == "bins":
+            self.edges = np.asarray(config['edges'], dtype=float)
+            self.labels = list(config.get('labels') or [
+                f"{int(low)}-{int(high) - 1}" for low, high in zip(self.edges, self.edges[1:])])
+            if len(self.labels) != len(self.edges) - 1:
+                raise ValueError(f"Merkmal '{name}': {len(self.edges) - 1} Klassen, aber "
+                                 f"{len(self.labels)} Labels")
+
+        self.count = int(config.get('count', 1))
+        if self.distribution == "multi" and not 1 <= self.count <= len(self.labels):
+            raise ValueError(f"Merkmal '{name}': count muss zwischen 1 und {len(self.labels)} liegen")
+
+    @property
+    def is_categorical(self) -> bool:
+        """True für Merkmale mit festen Ausprägungen (Codes + Labels)"""
+        return self.distribution in CATEGORICAL_DISTRIBUTIONS
+
+    def sample(self, rng: np.random.Generator, size: int, columns: Dict[str, np.ndarray],
+               attributes: Dict[str, "AttributeModel"]) -> np.ndarray:
+        """
+        Zieht `size` Werte
+
+        Args:
+            rng: NumPy-Zufallsgenerator
+            size: Anzahl der Werte
+            columns: Bereits gezogene Spalten (für "given" und "source")
+            attributes: Alle Merkmale des Modells
+
+        Returns:
+            Codes (kategorial), Zahlen oder eine (size, count)-Matrix von Codes (multi)
+        """
+        if self.distribution == "categorical":
+            if not self.given:
+                return rng.choice(len(self.labels), size=size, p=self.probabilities).astype(np.int32)
+            parent = attributes[self.given]
+            parent_codes = columns[self.given]
+            codes = np.empty(size, dtype=np.int32)
+            for parent_code, parent_label in enumerate(parent.labels):
+                mask = parent_codes == parent_code
+                probabilities = self.conditional.get(parent_label)
+                if probabilities is None:
+                    raise ValueError(f"Merkmal '{self.name}': keine Gewichte für {self.given}={parent_label}")
+                codes[mask] = rng.choice(len(self.labels), size=int(mask.sum()), p=probabilities)
+            return codes
+
+        if self.distribution == "bins":
+            values = columns[self.source]
+            codes = np.digitize(values, self.edges[1:-1])
+            return codes.astype(np.int32)
+
+        if self.distribution == "multi":
+            # Gumbel-Top-k: k verschiedene Ausprägungen, gewichtet, ohne Zurücklegen
+            keys = np.log(self.probabilities) + rng.gumbel(size=(size, len(self.labels)))
+            return np.argsort(-keys, axis=1)[:, :self.count].astype(np.int32)
+
+        if self.distribution == "normal":
+            values = rng.normal(self.config['mean'], self.config['std'], size)
+        elif self.distribution == "lognormal":
+            values = rng.lognormal(np.log(self.config['median']), self.config['sigma'], size)
+        else:
+            values = rng.uniform(self.config['min'], self.config['max'], size)
+        values = np.clip(values, self.config.get('min', -np.inf), self.config.get('max', np.inf))
+        return np.rint(values).astype(np.int64) if self.integer else values
+
+    def format_value(self, value) -> str:
+        """Macht einen gezogenen Wert für die Persona-Beschreibung lesbar"""
+        if self.distribution == "multi":
+            return ", ".join(self.labels[code] for code in value)
+        if self.is_categorical:
+            return self.labels[value]
+        if self.integer:
+            return str(int(value))
+        return f"{value:.2f}"
+
+
+class PopulationModel:
+    """
+    Deklaratives Populations-Modell: Merkmale, Vorlagen und Stichproben-Einstellungen
+    """
+
+    def __init__(self, config: Dict):
+        """
+        Args:
+            config: Inhalt einer Populations-Datei (siehe population.json)
+        """
+        self.config = config
+        self.name_prefix = config.get('name_prefix', 'Person')
+        self.age_attribute = config.get('age_attribute', 'age')
+        self.templates = config.get('templates', {})
+        self.attributes = {}
+        for name, attribute_config in config['attributes'].items():
+            attribute = AttributeModel(name, attribute_config)
+            for dependency in (attribute.given, attribute.source):
+                if dependency and dependency not in self.attributes:
+                    raise ValueError(f"Merkmal '{name}' hängt von '{dependency}' ab, "
+                                     f"das vorher definiert sein muss")
+            self.attributes[name] = attribute
+
+    def _get_categorical(self, name: str) -> AttributeModel:
+        attribute = self.attributes.get(name)
+        if attribute is None or not attribute.is_categorical:
+            raise ValueError(f"'{name}' ist kein kategoriales Merkmal des Modells")
+        return attribute
+
+    def _sample_columns(self, rng: np.random.Generator, size: int,
+                        fixed: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, np.ndarray]:
+        """Zieht alle Merkmale in Modell-Reihenfolge; `fixed` gibt Spalten vor"""
+        columns = dict(fixed or {})
+        for name, attribute in self.attributes.items():
+            if name not in columns:
+                columns[name] = attribute.sample(rng, size, columns, self.attributes)
+        return columns
+
+    def sample(self, size: int, seed: Optional[int] = None, method: str = "random",
+               by: Optional[List[str]] = None, quotas: Optional[Dict[str, Dict[str, float]]] = None) -> "Population":
+        """
+        Zieht eine Population
+
+        Args:
+            size: Anzahl der Personas
+            seed: Seed für reproduzierbare Panels
+            method: "random", "stratified" oder "quota"
+            by: Schichtungs-Merkmale für "stratified" (kategorial, ohne "given")
+            quotas: {Merkmal: {Label: Anteil oder Anzahl}} für "quota"
+
+        Returns:
+            Population mit einer Spalte pro Merkmal
+        """
+        if method not in SAMPLING_METHODS:
+            raise ValueError(f"Unbekanntes Stichprobenverfahren: {method} (erlaubt: {', '.join(SAMPLING_METHODS)})")
+        rng = np.random.default_rng(seed)
+        if method == "stratified":
+            columns = self._sample_stratified(rng, size, by or self.config.get('strata', []))
+        elif method == "quota":
+            columns = self._sample_quota(rng, size, quotas or self.config.get('quotas', {}))
+        else:
+            columns = self._sample_columns(rng, size)
+        return Population(self, columns, size)
+
+    def _sample_stratified(self, rng: np.random.Generator, size: int, by: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Geschichtete Stichprobe: die Schichten (Kombinationen der `by`-Merkmale)
+        bekommen exakt ihren erwarteten Anteil, der Rest wird innerhalb gezogen
+        """
+        if not by:
+            raise ValueError("Geschichtete Stichprobe braucht mindestens ein Merkmal (by)")
+        strata = []
+        for name in by:
+            attribute = self._get_categorical(name)
+            if attribute.probabilities is None:
+                raise ValueError(f"Schichtung nach '{name}' nicht möglich: Anteile hängen von "
+                                 f"anderen Merkmalen ab")
+            strata.append(attribute)
+
+        # Gemeinsame Anteile der Schicht-Kombinationen (Merkmale unabhängig)
+        joint = strata[0].probabilities
+        for attribute in strata[1:]:
+            joint = np.outer(joint, attribute.probabilities).ravel()
+        cell_codes = np.repeat(np.arange(len(joint)), allocate_counts(size, joint))
+        rng.shuffle(cell_codes)
+
+        fixed = {attribute.name: codes.astype(np.int32) for attribute, codes in
+                 zip(strata, np.unravel_index(cell_codes, [len(attribute.labels) for attribute in strata]))}
+        return self._sample_columns(rng, size, fixed)
+
+    def _sample_quota(self, rng: np.random.Generator, size: int,
+                      quotas: Dict[str, Dict[str, float]], max_rounds: int = 100) -> Dict[str, np.ndarray]:
+        """
+        Quoten-Stichprobe: Kandidaten werden gezogen und angenommen, solange
+        für jedes Quoten-Merkmal in ihrer Ausprägung noch Plätze frei sind
+        """
+        if not quotas:
+            raise ValueError("Quoten-Stichprobe braucht mindestens eine Quote")
+        targets = {}
+        for name, table in quotas.items():
+            attribute = self._get_categorical(name)
+            unknown = set(table) - set(attribute.labels)
+            if unknown:
+                raise ValueError(f"Quote für '{name}': unbekannte Ausprägungen {', '.join(sorted(unknown))}")
+            shares = [table.get(label, 0) for label in attribute.labels]
+            # Feste Anzahlen nur, wenn alle Werte ganzzahlig sind und genau aufgehen -
+            # sonst Anteile (0.5/0.5 bei size=1 ist kein "0 und 0")
+            is_counts = all(float(share).is_integer() for share in shares) and sum(shares) == size
+            targets[name] = (np.asarray(shares, dtype=np.int64) if is_counts
+                             else allocate_counts(size, shares))
+
+        accepted_batches = []
+        accepted = 0
+        for _ in range(max_rounds):
+            if accepted == size:
+                break
+            batch_size = max(64, 2 * (size - accepted))
+            batch = self._sample_columns(rng, batch_size)
+            candidate_codes = np.stack([batch[name] for name in targets], axis=1)
+            remaining = [targets[name] for name in targets]
+            keep = []
+            for index, codes in enumerate(candidate_codes):
+                if all(remaining_counts[code] > 0 for remaining_counts, code in zip(remaining, codes)):
+                    for remaining_counts, code in zip(remaining, codes):
+                        remaining_counts[code] -= 1
+                    keep.append(index)
+                    accepted += 1
+                    if accepted == size:
+                        break
+            if keep:
+                accepted_batches.append({name: column[keep] for name, column in batch.items()})
+        if accepted < size:
+            raise ValueError(f"Quoten nicht erfüllbar: nur {accepted} von {size} Personas gefunden")
+        return {name: np.concatenate([batch[name] for batch in accepted_batches])
+                for name in self.attributes}
+
+
+class Population:
+    """
+    Gezogene Population in Spalten - PersonaSpecs entstehen erst beim Zugriff
+    """
+
+    def __init__(self, model: PopulationModel, columns: Dict[str, np.ndarray], size: int):
+        self.model = model
+        self.columns = columns
+        self.size = size
+
+    def __len__(self) -> int:
+        return self.size
+
+    def get_values(self, index: int) -> Dict[str, str]:
+        """Lesbare Merkmale der Persona `index` (für die Vorlagen)"""
+        values = {name: attribute.format_value(self.columns[name][index])
+                  for name, attribute in self.model.attributes.items()}
+        values["name"] = self.get_name(index)
+        return values
+
+    def get_name(self, index: int) -> str:
+        """Eindeutiger Name der Persona `index` (z.B. "Person 00042")"""
+        return f"{self.model.name_prefix} {index + 1:0{len(str(self.size))}d}"
+
+    def get_spec(self, index: int) -> PersonaSpec:
+        """
+        Baut die PersonaSpec der Persona `index` aus den Vorlagen des Modells
+
+        Returns:
+            PersonaSpec (ohne Sprachmodell)
+        """
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+        values = self.get_values(index)
+        age_column = self.columns.get(self.model.age_attribute)
+        return PersonaSpec(
+            id=values["name"].lower(),
+            name=values["name"],
+            age=int(age_column[index]) if age_column is not None else 0,
+            characteristics=self.model.templates.get('characteristics', '').format(**values),
+            background=self.model.templates.get('background', '').format(**values),
+            detailed_personality=self.model.templates.get('detailed_personality', '').format(**values)
+        )
+
+    def get_prompt(self, index: int) -> str:
+        """Persönlichkeits-Prompt der Persona `index` (wie ihn ein PersonaAgent verwendet)"""
+        spec = self.get_spec(index)
+        return create_personality_prompt(spec.name, spec.age, spec.characteristics, spec.background,
+                                         spec.detailed_personality)
+
+    def iter_specs(self, start: int = 0, stop: Optional[int] = None) -> Iterator[PersonaSpec]:
+        """PersonaSpecs der Personas start..stop, eine nach der anderen"""
+        for index in range(start, min(self.size, stop if stop is not None else self.size)):
+            yield self.get_spec(index)
+
+    def iter_chunks(self, chunk_size: Optional[int] = None) -> Iterator[List[PersonaSpec]]:
+        """Teil-Panels von je chunk_size PersonaSpecs (Standard: POPULATION_CHUNK_SIZE)"""
+        chunk_size = chunk_size or get_population_chunk_size()
+        for start in range(0, self.size, chunk_size):
+            yield list(self.iter_specs(start, start + chunk_size))
+
+    def describe(self) -> Dict[str, Dict]:
+        """
+        Verteilung jedes Merkmals in der gezogenen Population
+
+        Returns:
+            {Merkmal: {Label: Anteil}} für kategoriale Merkmale,
+            {Merkmal: {mean, std, min, max}} für Zahlen
+        """
+        summary = {}
+        for name, attribute in self.model.attributes.items():
+            column = self.columns[name]
+            if attribute.distribution == "multi" or attribute.is_categorical:
+                counts = np.bincount(column.ravel(), minlength=len(attribute.labels))
+                summary[name] = {label: round(float(count) / self.size, 4)
+                                 for label, count in zip(attribute.labels, counts)}
+            else:
+                summary[name] = {"mean": round(float(column.mean()), 2), "std": round(float(column.std()), 2),
+                                 "min": float(column.min()), "max": float(column.max())}
+        return summary
+
+
+def load_population_model(model_path: Optional[str] = None) -> PopulationModel:
+    """
+    Liest ein Populations-Modell aus einer JSON-Datei
+
+    Args:
+        model_path: Pfad zur Datei (Standard: POPULATION_MODEL bzw. population.json)
+
+    Returns:
+        PopulationModel
+    """
+    with open(model_path or get_population_model_path(), 'r', encoding='utf-8') as file:
+        return PopulationModel(json.load(file))
+
+
+def interview_population(population: Population, questions_list: List[str], session=None,
+                         output_file: Optional[str] = None, output_format: str = "json",
+                         chunk_size: Optional[int] = None) -> Dict:
+    """
+    Interviewt ein ganzes Panel in Teil-Panels
+
+    Pro Teil-Panel werden die PersonaAgents gebaut, befragt und wieder
+    freigegeben; alle Antworten landen sofort im gemeinsamen Ergebnis-Stream
+    (<output_file>.jsonl), der Bericht wird am Ende daraus gebaut.
+
+    Args:
+        population: Gezogene Population
+        questions_list: Liste von Fragen
+        session: InterviewSession für Modell, Client-Pool und Cache (Standard: neue Sitzung)
+        output_file: Dateiname ohne Endung (Standard: population_results_<Zeitstempel>)
+        output_format: "json", "md" oder "npz"
+        chunk_size: Personas pro Teil-Panel (Standard: POPULATION_CHUNK_SIZE)
+
+    Returns:
+        Zusammenfassung mit timestamp, agents, Zählern, metrics und results_stream
+    """
+    from interview import InterviewSession
+    from results_model import InterviewResult
+    from results_stream import ResultsStreamWriter, get_stream_path, write_report_from_stream
+
+    session = session or InterviewSession(personas=[])
+    if output_file is None:
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = f"population_results_{timestamp}"
+
+    stream_path = get_stream_path(output_file)
+    interviewed = 0
+    with ResultsStreamWriter(stream_path) as results_stream:
+        manager = session.create_manager(results_stream=results_stream, keep_results=False)
+        for specs in population.iter_chunks(chunk_size):
+            with session.checkout(specs) as agents:
+                manager.personas = agents
+                manager.run_full_interview(questions_list)
+            interviewed += len(specs)
+            print(f"👥 {interviewed} von {len(population)} Personas befragt")
+
+    metrics = manager.metrics.get_summary()
+    report_file = f"{output_file}.{output_format}"
+    if output_format == "npz":
+        stream_source = InterviewResult.from_stream(stream_path)
+        stream_source.save_npz(report_file)
+    else:
+        stream_source = write_report_from_stream(stream_path, report_file, output_format, metrics)
+    return {
+        "timestamp": stream_source.timestamp,
+        "agents": stream_source.agents,
+        **stream_source.get_summary(),
+        "results_stream": stream_path,
+        "metrics": metrics
+    }
+
+
+def parse_quota_arguments(quota_arguments: Optional[List[str]]) -> Dict[str, Dict[str, float]]:
+    """
+    Wandelt --quota gender=weiblich:0.5,männlich:0.5 in {"gender": {"weiblich": 0.5, ...}} um
+    """
+    quotas = {}
+    for quota in quota_arguments or []:
+        name, _, table = quota.partition("=")
+        quotas[name] = {label: float(share) for label, _, share in
+                        (entry.partition(":") for entry in table.split(",") if entry)}
+    return quotas
+
+
+def main():
+    """Kommandozeile: Population ziehen, beschreiben und optional interviewen"""
+    from interview import (InterviewSession, add_cache_arguments, add_metrics_argument, add_provider_argument,
+                           load_questions_from_file, open_cache_from_arguments, print_interview_summary)
+    from metrics import get_metrics_file, write_prometheus_textfile
+
+    parser = argparse.ArgumentParser(
+        description="Synthetische Population ziehen und interviewen",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Beispiele:
+  python population.py --size 1000 --describe
+  python population.py --size 10000 --method stratified --by income --questions questions.json
+  python population.py --size 500 --method quota --quota gender=weiblich:0.5,männlich:0.5 --questions questions.json
+        """
+    )
+    parser.add_argument("--model", default=None, help="Populations-Modell (Standard: population.json)")
+    parser.add_argument("--size", type=int, default=100, help="Anzahl der Personas (Standard: 100)")
+    parser.add_argument("--seed", type=int, default=None, help="Seed für reproduzierbare Panels")
+    parser.add_argument("--method", choices=SAMPLING_METHODS, default="random",
+                        help="Stichprobenverfahren (Standard: random)")
+    parser.add_argument("--by", nargs="+", default=None, help="Schichtungs-Merkmale für --method stratified")
+    parser.add_argument("--quota", action="append", default=None, metavar="MERKMAL=LABEL:ANTEIL,...",
+                        help="Quote für --method quota (mehrfach möglich)")
+    parser.add_argument("--describe", action="store_true", help="Verteilung der gezogenen Merkmale anzeigen")
+    parser.add_argument("--show", type=int, default=0, metavar="N", help="Die ersten N Personas anzeigen")
+    parser.add_argument("--questions", default=None, help="Fragen-Datei - dann wird das Panel interviewt")
+    parser.add_argument("--output", default=None, help="Ausgabedatei ohne Endung")
+    parser.add_argument("--format", choices=["json", "md", "npz"], default="json",
+                        help="Ausgabeformat (Standard: json)")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="Personas pro Teil-Panel (Standard: POPULATION_CHUNK_SIZE oder 100)")
+    parser.add_argument("--max-concurrency", type=int, default=None,
+                        help="Gleichzeitig befragte Personas (Standard: MAX_CONCURRENCY oder 1)")
+    parser.add_argument("--engine", choices=["sync", "async"], default="sync",
+                        help="Interview-Motor (Standard: sync)")
+    add_provider_argument(parser)
+    add_cache_arguments(parser)
+    add_metrics_argument(parser)
+    args = parser.parse_args()
+
+    try:
+        model = load_population_model(args.model)
+        population = model.sample(args.size, seed=args.seed, method=args.method, by=args.by,
+                                  quotas=parse_quota_arguments(args.quota))
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Population konnte nicht gezogen werden: {e}")
+        sys.exit(1)
+
+    print(f"👥 {len(population)} Personas gezogen ({args.method})")
+    if args.describe:
+        print(json.dumps(population.describe(), indent=2, ensure_ascii=False))
+    for spec in population.iter_specs(0, args.show):
+        print(f"  - {spec.name} ({spec.age}): {spec.characteristics}")
+
+    if not args.questions:
+        return
+
+    response_cache = open_cache_from_arguments(args)
+    try:
+        session = InterviewSession(personas=[], provider=args.provider, response_cache=response_cache,
+                                   max_concurrency=args.max_concurrency, engine=args.engine)
+    except ValueError as e:
+        print(f"❌ Setup fehlgeschlagen: {e}")
+        sys.exit(1)
+
+    questions_list = load_questions_from_file(args.questions)
+    results = interview_population(population, questions_list, session=session, output_file=args.output,
+                                   output_format=args.format, chunk_size=args.chunk_size)
+    output_file = results["results_stream"][:-len(".jsonl")]
+    print_interview_summary(results, args.format, output_file, response_cache)
+    metrics_file = args.metrics_file or get_metrics_file()
+    if metrics_file:
+        write_prometheus_textfile(metrics_file, [({"run": os.path.basename(output_file), "model": session.model_name},
+                                                  results["metrics"])])
+        print(f"📈 Messwerte (Prometheus) gespeichert in {metrics_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""
+Profiling-Modus für interview.py und run_batch.py (--profile)
+
+Führt einen Lauf unter cProfile aus und schreibt:
+
+    <Basis>.pstats       Rohdaten, z.B. für snakeviz oder python -m pstats
+    <Basis>.txt          Zusammenfassung: kumulative Hotspots (alle Funktionen
+                         und nur Code dieses Projekts), CPU- gegen Wanduhrzeit,
+                         Speicher-Spitze und - mit --profile-memory - die
+                         größten Allokationen (tracemalloc)
+
+Mit dem Offline-Modell (--provider fake, FAKE_LLM_LATENCY_MS=0) fällt die
+Netzwerkzeit weg; übrig bleibt der CPU-Anteil: Chain-Aufbau in LangChain,
+Kontext-Bau (_build_context), Bericht-Schreiber usw.
+
+Threads, die während des Profilings starten (ThreadPoolExecutor, Batch-Jobs,
+Event-Loop des Client-Pools), bekommen je einen eigenen Profiler, den der
+Thread selbst an seinem Ende abschaltet. Zusammengeführt werden nur Profile
+beendeter Threads - Threads, die beim Stopp noch laufen, werden in der
+Zusammenfassung genannt, aber nicht mitgezählt.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def get_profile_top():
+    """Anzahl der Hotspots pro Abschnitt der Zusammenfassung (PROFILE_TOP, Standard: 30)"""
+    return int(os.getenv('PROFILE_TOP', 30))
+
+
+def get_peak_rss_mb():
+    """Speicher-Spitze dieses Prozesses in MB (None, wo resource fehlt, z.B. Windows)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux meldet KB, macOS Bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class RunProfiler:
+    """cProfile über alle Threads eines Laufs, optional mit tracemalloc"""
+
+    def __init__(self, output_base: str, trace_memory: bool = False, top: Optional[int] = None):
+        """
+        Args:
+            output_base: Pfad ohne Endung für <Basis>.pstats und <Basis>.txt
+            trace_memory: True = Allokationen mit tracemalloc verfolgen (langsamer)
+            top: Hotspots pro Abschnitt (Standard: PROFILE_TOP)
+        """
+        self.output_base = output_base
+        self.trace_memory = trace_memory
+        self.top = top or get_profile_top()
+        self.summary = None
+        self._main_profile = cProfile.Profile()
+        # [Profil, Thread-Name, beendet] pro Thread, der während der Messung startete
+        self._thread_profiles = []
+        self._lock = threading.Lock()
+        self._started = None
+        self._original_run = None
+
+    def _wrap_thread_run(self):
+        """
+        Ersetzt Thread.run, damit jeder neue Thread seinen Profiler selbst
+        ein- und am Ende wieder ausschaltet (cProfile misst nur im eigenen Thread)
+        """
+        profiler = self
+        original_run = self._original_run = threading.Thread.run
+
+        def profiled_run(thread):
+            record = [cProfile.Profile(), thread.name, False]
+            with profiler._lock:
+                profiler._thread_profiles.append(record)
+            record[0].enable()
+            try:
+                original_run(thread)
+            finally:
+                record[0].disable()
+                with profiler._lock:
+                    record[2] = True
+
+        threading.Thread.run = profiled_run
+
+    def start(self):
+        """Startet die Messung im aufrufenden Thread und in allen neuen Threads"""
+        if self.trace_memory:
+            tracemalloc.start()
+        self._started = (time.perf_counter(), time.process_time())
+        self._wrap_thread_run()
+        self._main_profile.enable()
+
+    def stop(self) -> Dict:
+        """
+        Beendet die Messung und schreibt .pstats und .txt
+
+        Returns:
+            Zusammenfassung (wall_seconds, cpu_seconds, peak_memory_mb, Dateien)
+        """
+        self._main_profile.disable()
+        threading.Thread.run = self._original_run
+        wall_seconds = time.perf_counter() - self._started[0]
+        cpu_seconds = time.process_time() - self._started[1]
+
+        memory = None
+        if self.trace_memory:
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            memory = (peak, snapshot)
+
+        stats = pstats.Stats(self._main_profile)
+        with self._lock:
+            finished = [profile for profile, _, done in self._thread_profiles if done]
+            unfinished = [name for _, name, done in self._thread_profiles if not done]
+        for profile in finished:
+            try:
+                stats.add(profile)
+            except TypeError:
+                # Thread hat nach dem Start nie Python-Code ausgeführt - keine Daten
+                continue
+
+        pstats_file = f"{self.output_base}.pstats"
+        text_file = f"{self.output_base}.txt"
+        stats.dump_stats(pstats_file)
+
+        self.summary = {
+            "wall_seconds": round(wall_seconds, 3),
+            "cpu_seconds": round(cpu_seconds, 3),
+            "threads": 1 + len(finished),
+            "unfinished_threads": unfinished,
+            "peak_rss_mb": get_peak_rss_mb(),
+            "peak_traced_mb": round(memory[0] / (1024 * 1024), 2) if memory else None,
+            "pstats_file": pstats_file,
+            "text_file": text_file
+        }
+        with open(text_file, "w", encoding="utf-8") as file:
+            file.write(self._format_report(stats, memory))
+        return self.summary
+
+    def _format_report(self, stats: pstats.Stats, memory) -> str:
+        """Text-Zusammenfassung: Zeiten, Speicher, Hotspots"""
+        summary = self.summary
+        lines = [
+            "Profil eines Interview-Laufs",
+            f"Wanduhrzeit: {summary['wall_seconds']:.3f} s, CPU-Zeit (Prozess): {summary['cpu_seconds']:.3f} s "
+            f"- der Rest ist Warten (Netzwerk, Rate-Limiter, Sleeps)",
+            f"Profilierte Threads: {summary['threads']}",
+        ]
+        if summary["unfinished_threads"]:
+            lines.append(f"Beim Stopp noch laufend (nicht enthalten): {', '.join(summary['unfinished_threads'])}")
+        if summary["peak_rss_mb"] is not None:
+            lines.append(f"Speicher-Spitze (RSS): {summary['peak_rss_mb']:.1f} MB")
+        if summary["peak_traced_mb"] is not None:
+            lines.append(f"Speicher-Spitze (tracemalloc, Python-Objekte): {summary['peak_traced_mb']:.2f} MB")
+
+        project_filter = re.escape(PROJECT_DIR + os.sep)
+        sections = [
+            ("Kumulative Hotspots - alle Funktionen", "cumulative", ()),
+            ("Kumulative Hotspots - Code dieses Projekts", "cumulative", (project_filter,)),
+            ("Eigene Zeit (ohne Unteraufrufe) - alle Funktionen", "tottime", ()),
+        ]
+        for title, sort_key, filters in sections:
+            buffer = io.StringIO()
+            stats.stream = buffer
+            stats.sort_stats(sort_key).print_stats(*filters, self.top)
+            lines += ["", "=" * 78, title, "=" * 78, _strip_stats_header(buffer.getvalue())]
+
+        if memory:
+            _, snapshot = memory
+            lines += ["", "=" * 78, "Größte noch belegte Allokationen am Ende (tracemalloc)", "=" * 78]
+            for statistic in snapshot.statistics("lineno")[:self.top]:
+                lines.append(f"{statistic.size / 1024:10.1f} KiB  {statistic.count:8d}x  {statistic.traceback}")
+        return "\n".join(lines) + "\n"
+
+    def get_top_project_functions(self, count: int = 10):
+        """Die teuersten Funktionen dieses Projekts (kumulativ) aus der .pstats-Datei"""
+        stats = pstats.Stats(self.summary["pstats_file"])
+        rows = []
+        for (filename, line, function), (_, calls, _, cumulative, _) in stats.stats.items():
+            if filename.startswith(PROJECT_DIR + os.sep):
+                rows.append((cumulative, calls, f"{os.path.basename(filename)}:{line}({function})"))
+        return sorted(rows, reverse=True)[:count]
+
+
+def _strip_stats_header(text: str) -> str:
+    """Entfernt die Kopfzeilen von print_stats (Dateiname, Aufrufzahl) - stehen schon oben"""
+    lines = text.strip("\n").splitlines()
+    for index, line in enumerate(lines):
+        if line.lstrip().startswith("ncalls"):
+            return "\n".join(lines[index:])
+    return "\n".join(lines)
+
+
+@contextmanager
+def profiling(output_base: Optional[str], trace_memory: bool = False):
+    """
+    Profiliert den eingeschlossenen Block - ohne Basis-Pfad passiert nichts
+
+    Yields:
+        Den RunProfiler (summary ist nach dem Block gesetzt) oder None
+    """
+    if not output_base:
+        yield None
+        return
+    profiler = RunProfiler(output_base, trace_memory)
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+
+
+def print_profile_summary(profiler: RunProfiler, count: int = 10):
+    """Zeigt Zeiten, Speicher-Spitze und die teuersten eigenen Funktionen an"""
+    summary = profiler.summary
+    print(f"\n⏱️  Profil: {summary['wall_seconds']:.2f}s Wanduhrzeit, {summary['cpu_seconds']:.2f}s CPU "
+          f"({summary['threads']} Threads)")
+    if summary["unfinished_threads"]:
+        print(f"  - Beim Stopp noch laufend (nicht enthalten): {', '.join(summary['unfinished_threads'])}")
+    if summary["peak_traced_mb"] is not None:
+        print(f"  - Speicher-Spitze (tracemalloc): {summary['peak_traced_mb']:.2f} MB")
+    if summary["peak_rss_mb"] is not None:
+        print(f"  - Speicher-Spitze (RSS): {summary['peak_rss_mb']:.1f} MB")
+    print(f"  - Teuerste Funktionen dieses Projekts (kumulativ):")
+    for cumulative, calls, function in profiler.get_top_project_functions(count):
+        print(f"    {cumulative:8.3f}s  {calls:7d}x  {function}")
+    print(f"📄 Profil gespeichert in {summary['text_file']} und {summary['pstats_file']}")
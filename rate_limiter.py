@@ -0,0 +1,387 @@
+"""
+Rate-Limiter mit adaptiver Parallelität und Retry/Backoff für LLM-Aufrufe
+
+Kostenlose OpenRouter-Modelle antworten schnell mit 429, sobald mehrere Anfragen
+parallel laufen. Statt den Fehler als Antwort zu speichern, drosselt der
+AdaptiveRateLimiter alle Aufrufe eines Client-Pools gemeinsam:
+
+- Token-Bucket: höchstens N Anfragen pro Sekunde (mit Burst)
+- AIMD-Parallelität: bei Erfolg langsam mehr gleichzeitige Anfragen erlauben
+  (additive increase), bei 429 sofort halbieren (multiplicative decrease)
+- Retry-After des Anbieters wird für alle Aufrufe des Pools respektiert
+- Wiederholungen mit exponentiellem Backoff und Jitter
+"""
+
+import email.utils
+import os
+import random
+import threading
+import time
+
+from tracing import trace_span
+
+RETRYABLE_STATUS_CODES = (408, 409, 429, 500, 502, 503, 504)
+
+
+def get_rate_limit_rps():
+    """Maximale Anfragen pro Sekunde (None = unbegrenzt)"""
+    rps = os.getenv('RATE_LIMIT_RPS')
+    return float(rps) if rps else None
+
+
+def get_rate_limit_burst():
+    """Wie viele Anfragen kurzfristig über der Rate liegen dürfen"""
+    return int(os.getenv('RATE_LIMIT_BURST', 5))
+
+
+def get_rate_limit_initial_concurrency():
+    """Gleichzeitige Anfragen zu Beginn, bevor AIMD nachregelt"""
+    return int(os.getenv('RATE_LIMIT_INITIAL_CONCURRENCY', 4))
+
+
+def get_rate_limit_max_concurrency():
+    """Obergrenze gleichzeitiger Anfragen, auf die AIMD hochregeln darf"""
+    return int(os.getenv('RATE_LIMIT_MAX_CONCURRENCY', 32))
+
+
+def get_max_retries():
+    """Wie oft ein fehlgeschlagener LLM-Aufruf wiederholt wird"""
+    return int(os.getenv('LLM_MAX_RETRIES', 4))
+
+
+def get_retry_base_delay():
+    """Basis-Wartezeit in Sekunden für den exponentiellen Backoff"""
+    return float(os.getenv('LLM_RETRY_BASE_DELAY', 1.0))
+
+
+def get_retry_max_delay():
+    """Maximale Wartezeit in Sekunden zwischen zwei Versuchen"""
+    return float(os.getenv('LLM_RETRY_MAX_DELAY', 30.0))
+
+
+def get_status_code(error):
+    """Liest den HTTP-Statuscode aus einer Exception (openai/httpx), falls vorhanden"""
+    status_code = getattr(error, 'status_code', None)
+    if status_code is None:
+        response = getattr(error, 'response', None)
+        status_code = getattr(response, 'status_code', None)
+    return status_code
+
+
+def is_rate_limit_error(error):
+    """True wenn der Fehler ein 429 / Rate-Limit ist"""
+    if get_status_code(error) == 429:
+        return True
+    error_str = str(error)
+    return "429" in error_str or "rate limit" in error_str.lower()
+
+
+def is_retryable_error(error):
+    """True für Fehler, bei denen sich ein neuer Versuch lohnt (429, 5xx, Timeouts, Verbindungsfehler)"""
+    if is_rate_limit_error(error):
+        return True
+    if get_status_code(error) in RETRYABLE_STATUS_CODES:
+        return True
+    error_name = type(error).__name__
+    return "Timeout" in error_name or "Connection" in error_name
+
+
+def get_retry_after(error):
+    """
+    Liest den Retry-After-Header aus einer Fehler-Antwort
+
+    Returns:
+        Wartezeit in Sekunden oder None
+    """
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None) or getattr(error, 'headers', None)
+    if not headers:
+        return None
+
+    value = headers.get('retry-after')
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveRateLimiter:
+    """
+    Gemeinsamer Token-Bucket mit AIMD-gesteuerter Parallelität
+
+    Thread-sicher; acquire()/release() für synchrone, acquire_async() für
+    asyncio-Aufrufer. Jeder erfolgreiche acquire muss mit release() beendet werden.
+    """
+
+    def __init__(self, requests_per_second=None, burst=None, initial_concurrency=None,
+                 max_concurrency=None, min_concurrency=1):
+        """
+        Args:
+            requests_per_second: Maximale Rate (None = unbegrenzt, Standard: RATE_LIMIT_RPS)
+            burst: Größe des Token-Buckets (Standard: RATE_LIMIT_BURST)
+            initial_concurrency: Start-Parallelität (Standard: RATE_LIMIT_INITIAL_CONCURRENCY)
+            max_concurrency: Obergrenze der Parallelität (Standard: RATE_LIMIT_MAX_CONCURRENCY)
+            min_concurrency: Untergrenze der Parallelität
+        """
+        self.requests_per_second = requests_per_second if requests_per_second is not None else get_rate_limit_rps()
+        self.burst = burst or get_rate_limit_burst()
+        self.max_concurrency = max_concurrency or get_rate_limit_max_concurrency()
+        self.min_concurrency = min_concurrency
+        self.concurrency_limit = float(min(initial_concurrency or get_rate_limit_initial_concurrency(),
+                                           self.max_concurrency))
+
+        self.in_flight = 0
+        self.rate_limited_count = 0
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._condition = threading.Condition()
+        # Wartende async Aufrufer: (Loop, Future) - release() weckt sie statt Polling
+        self._async_waiters = []
+
+    def acquire(self):
+        """Wartet (blockierend) bis eine Anfrage gestartet werden darf"""
+        with self._condition:
+            while True:
+                wait = self._try_acquire()
+                if wait == 0:
+                    return
+                self._condition.wait(timeout=wait)
+
+    async def acquire_async(self):
+        """
+        Wartet (ohne die Event-Loop zu blockieren) bis eine Anfrage gestartet werden darf
+
+        Ist die Parallelität ausgeschöpft, schläft die Task, bis release() sie
+        weckt; bei Token-Bucket oder Retry-After höchstens bis zum Ablauf der Wartezeit.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                wait = self._try_acquire()
+                if wait == 0:
+                    return
+                waiter = (loop, loop.create_future())
+                self._async_waiters.append(waiter)
+            try:
+                await asyncio.wait([waiter[1]], timeout=wait)
+            except BaseException:
+                # Abgebrochen: schon geweckt (nicht mehr in der Liste), aber keinen
+                # Platz genommen - dann den Weckruf an den nächsten Wartenden weitergeben
+                with self._condition:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+                    else:
+                        self._wake_waiters()
+                raise
+            with self._condition:
+                if waiter in self._async_waiters:
+                    self._async_waiters.remove(waiter)
+
+    def request_concurrency(self, concurrency):
+        """
+        Hebt die Start-Parallelität auf die gewünschte an (höchstens max_concurrency)
+
+        Ohne das würde RATE_LIMIT_INITIAL_CONCURRENCY z.B. --max-concurrency 32
+        deckeln, bis AIMD hochgeregelt hat. Nach einem 429 bleibt die gedrosselte
+        Grenze bestehen.
+
+        Args:
+            concurrency: Gewünschte Anzahl gleichzeitiger Anfragen
+        """
+        with self._condition:
+            if self.rate_limited_count:
+                return
+            target = float(min(concurrency, self.max_concurrency))
+            if target > self.concurrency_limit:
+                self.concurrency_limit = target
+                self._wake_waiters()
+
+    def release(self, success=True, rate_limited=False, retry_after=None):
+        """
+        Meldet das Ende einer Anfrage und passt die Parallelität an (AIMD)
+
+        Args:
+            success: True wenn die Anfrage erfolgreich war
+            rate_limited: True wenn der Anbieter mit 429 geantwortet hat
+            retry_after: Wartezeit aus dem Retry-After-Header (Sekunden)
+        """
+        with self._condition:
+            self.in_flight -= 1
+            if rate_limited:
+                self.rate_limited_count += 1
+                self.concurrency_limit = max(self.min_concurrency, self.concurrency_limit / 2)
+                if retry_after:
+                    self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+            elif success:
+                # Etwa +1 Parallelität pro "Fenster" erfolgreicher Anfragen
+                self.concurrency_limit = min(self.max_concurrency,
+                                             self.concurrency_limit + 1.0 / self.concurrency_limit)
+            self._wake_waiters()
+
+    def _wake_waiters(self):
+        """Weckt so viele Wartende, wie gerade Plätze frei sind (Aufrufer hält den Lock)"""
+        self._condition.notify_all()
+        free = max(1, int(self.concurrency_limit) - self.in_flight)
+        woken, self._async_waiters = self._async_waiters[:free], self._async_waiters[free:]
+        for loop, future in woken:
+            try:
+                loop.call_soon_threadsafe(_resolve_future, future)
+            except RuntimeError:
+                # Loop bereits geschlossen - die Task wartet nicht mehr
+                pass
+
+    def _try_acquire(self):
+        """
+        Versucht eine Anfrage zu starten (Aufrufer hält den Lock)
+
+        Returns:
+            0 bei Erfolg, sonst Wartezeit in Sekunden (None = warten bis eine Anfrage endet)
+        """
+        now = time.monotonic()
+        if now < self._blocked_until:
+            return self._blocked_until - now
+
+        if self.in_flight >= int(self.concurrency_limit):
+            return None
+
+        if self.requests_per_second:
+            elapsed = now - self._last_refill
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.requests_per_second)
+            self._last_refill = now
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.requests_per_second
+            self._tokens -= 1
+
+        self.in_flight += 1
+        return 0
+
+
+def _resolve_future(future):
+    """Weckt einen Wartenden in seiner eigenen Event-Loop"""
+    if not future.done():
+        future.set_result(None)
+
+
+class RetryPolicy:
+    """Exponentieller Backoff mit "Full Jitter" und Respekt vor Retry-After"""
+
+    def __init__(self, max_retries=None, base_delay=None, max_delay=None):
+        """
+        Args:
+            max_retries: Anzahl Wiederholungen (Standard: LLM_MAX_RETRIES)
+            base_delay: Basis-Wartezeit in Sekunden (Standard: LLM_RETRY_BASE_DELAY)
+            max_delay: Maximale Wartezeit in Sekunden (Standard: LLM_RETRY_MAX_DELAY)
+        """
+        self.max_retries = max_retries if max_retries is not None else get_max_retries()
+        self.base_delay = base_delay if base_delay is not None else get_retry_base_delay()
+        self.max_delay = max_delay if max_delay is not None else get_retry_max_delay()
+
+    def should_retry(self, error, attempt):
+        """True wenn nach dem fehlgeschlagenen Versuch `attempt` (ab 0) erneut versucht wird"""
+        return attempt < self.max_retries and is_retryable_error(error)
+
+    def get_delay(self, error, attempt):
+        """Wartezeit vor dem nächsten Versuch"""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        retry_after = get_retry_after(error)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+def call_with_retry(func, rate_limiter=None, retry_policy=None, on_retry=None):
+    """
+    Ruft func() gedrosselt auf und wiederholt vorübergehende Fehler
+
+    Args:
+        func: Funktion ohne Argumente (z.B. lambda: chain.invoke(...))
+        rate_limiter: Optionaler AdaptiveRateLimiter
+        retry_policy: Optionale RetryPolicy (Standard: Werte aus der .env)
+        on_retry: Optionaler Callback on_retry(error, attempt) vor jeder Wiederholung
+
+    Returns:
+        Das Ergebnis von func()
+    """
+    retry_policy = retry_policy or RetryPolicy()
+    attempt = 0
+    while True:
+        if rate_limiter is not None:
+            with trace_span("rate_limit_wait", "ratelimit"):
+                rate_limiter.acquire()
+        try:
+            result = func()
+        except Exception as error:
+            if rate_limiter is not None:
+                rate_limiter.release(success=False, rate_limited=is_rate_limit_error(error),
+                                     retry_after=get_retry_after(error))
+            if not retry_policy.should_retry(error, attempt):
+                raise
+            if on_retry is not None:
+                on_retry(error, attempt)
+            with trace_span("retry_backoff", "ratelimit", attempt=attempt + 1, error=type(error).__name__):
+                time.sleep(retry_policy.get_delay(error, attempt))
+            attempt += 1
+            continue
+        except BaseException:
+            # KeyboardInterrupt o.ä. - Platz im Limiter trotzdem freigeben
+            if rate_limiter is not None:
+                rate_limiter.release(success=False)
+            raise
+        if rate_limiter is not None:
+            rate_limiter.release(success=True)
+        return result
+
+
+async def acall_with_retry(coroutine_func, rate_limiter=None, retry_policy=None, on_retry=None):
+    """
+    Async-Variante von call_with_retry
+
+    Args:
+        coroutine_func: Funktion ohne Argumente, die eine Coroutine liefert
+        rate_limiter: Optionaler AdaptiveRateLimiter
+        retry_policy: Optionale RetryPolicy
+        on_retry: Optionaler Callback on_retry(error, attempt) vor jeder Wiederholung
+
+    Returns:
+        Das Ergebnis der Coroutine
+    """
+    import asyncio
+
+    retry_policy = retry_policy or RetryPolicy()
+    attempt = 0
+    while True:
+        if rate_limiter is not None:
+            with trace_span("rate_limit_wait", "ratelimit"):
+                await rate_limiter.acquire_async()
+        try:
+            result = await coroutine_func()
+        except Exception as error:
+            if rate_limiter is not None:
+                rate_limiter.release(success=False, rate_limited=is_rate_limit_error(error),
+                                     retry_after=get_retry_after(error))
+            if not retry_policy.should_retry(error, attempt):
+                raise
+            if on_retry is not None:
+                on_retry(error, attempt)
+            with trace_span("retry_backoff", "ratelimit", attempt=attempt + 1, error=type(error).__name__):
+                await asyncio.sleep(retry_policy.get_delay(error, attempt))
+            attempt += 1
+            continue
+        except BaseException:
+            # Abgebrochene Task - Platz im Limiter trotzdem freigeben
+            if rate_limiter is not None:
+                rate_limiter.release(success=False)
+            raise
+        if rate_limiter is not None:
+            rate_limiter.release(success=True)
+        return result
@@ -0,0 +1,520 @@
+"""
+Persistenter Antwort-Cache für PersonaAgent.respond
+
+Gleiche Fragebögen laufen immer wieder (wöchentlicher Cron-Lauf, GUI-Demos,
+Wiederholungen nach einem Fehler). Der Cache speichert Antworten in einer
+SQLite-Datei, geschlüsselt nach einem Hash aus Modell, Temperatur, max_tokens,
+System-Prompt und Kontext - nur wirklich identische Anfragen werden wiederverwendet.
+
+Modi pro Lauf:
+- "readwrite": Treffer verwenden, neue Antworten speichern (Standard)
+- "readonly":  Treffer verwenden, nichts speichern
+- "refresh":   Cache ignorieren, aber neue Antworten speichern (überschreiben)
+- "bypass":    Cache komplett umgehen
+
+Optional (semantic_threshold bzw. RESPONSE_CACHE_SEMANTIC) merkt sich der Cache
+zusätzlich jede gestellte Frage pro Persona und Modell-Konfiguration als
+Zeichen-n-Gramm-Vektor. Findet der exakte Schlüssel nichts, wird die ähnlichste
+frühere Frage dieser Persona gesucht (Kosinus, NumPy) und ihre Antwort
+wiederverwendet, wenn die Ähnlichkeit die Schwelle erreicht - so kosten
+umformulierte Fragen wiederkehrender Befragungswellen keinen neuen Aufruf.
+Der Verlauf der Persona spielt dabei keine Rolle, nur die Frage.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+CACHE_MODES = ("readwrite", "readonly", "refresh", "bypass")
+
+
+def get_response_cache_path():
+    """Pfad der Cache-Datei aus der Umgebung (None = Cache deaktiviert)"""
+    return os.getenv('RESPONSE_CACHE') or None
+
+
+def get_response_cache_mode():
+    """Standard-Modus des Caches"""
+    return os.getenv('RESPONSE_CACHE_MODE', 'readwrite')
+
+
+def get_response_cache_ttl():
+    """Lebensdauer eines Eintrags in Sekunden (None = unbegrenzt)"""
+    ttl = os.getenv('RESPONSE_CACHE_TTL')
+    return float(ttl) if ttl else None
+
+
+def get_response_cache_semantic_threshold():
+    """Ähnlichkeits-Schwelle für den Fragen-Index (None = aus, z.B. 0.8)"""
+    threshold = os.getenv('RESPONSE_CACHE_SEMANTIC')
+    return float(threshold) if threshold else None
+
+
+def get_response_cache_max_entries():
+    """Maximale Anzahl Einträge, danach werden die am längsten ungenutzten gelöscht"""
+    max_entries = os.getenv('RESPONSE_CACHE_MAX_ENTRIES')
+    return int(max_entries) if max_entries else None
+
+
+# Zeichen-n-Gramme der Fragen, gehasht auf eine feste Anzahl Spalten
+_QUESTION_NGRAMS = (3, 4, 5)
+_QUESTION_FEATURES = 4096
+_NON_WORD = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def vectorize_question(question):
+    """
+    Übersetzt eine Frage in einen normierten Zeichen-n-Gramm-Vektor (3- bis 5-Gramme)
+
+    Groß-/Kleinschreibung und Satzzeichen zählen nicht. Gramme werden pro Wort
+    gebildet (mit Wortanfang und -ende), so dass "wichtig" und "am wichtigsten"
+    viel gemeinsam haben, Satzbau-Gramme über Wortgrenzen aber nicht zählen.
+
+    Args:
+        question: Text der Frage
+
+    Returns:
+        float32-Vektor der Länge 4096 mit Länge 1 (Nullvektor bei leerer Frage)
+    """
+    import numpy as np
+
+    features = []
+    for word in _NON_WORD.sub(' ', question.lower()).split():
+        word = f" {word} "
+        for size in _QUESTION_NGRAMS:
+            features.extend(zlib.crc32(word[start:start + size].encode('utf-8')) % _QUESTION_FEATURES
+                            for start in range(len(word) - size + 1))
+    vector = np.zeros(_QUESTION_FEATURES, dtype=np.float32)
+    if features:
+        np.add.at(vector, features, 1.0)
+        vector /= np.linalg.norm(vector)
+    return vector
+
+
+class QuestionIndex:
+    """Frühere Fragen (mit Antwort) eines Bereichs - Persona und Modell-Konfiguration"""
+
+    def __init__(self):
+        import numpy as np
+
+        self.questions = []
+        self.responses = []
+        self._vectors = np.zeros((8, _QUESTION_FEATURES), dtype=np.float32)
+        self._created = np.zeros(8, dtype=np.float64)
+        self._positions = {}
+
+    def add(self, question, response, vector, created_at):
+        """Nimmt eine Frage auf (eine bereits bekannte Frage bekommt die neue Antwort)"""
+        import numpy as np
+
+        position = self._positions.get(question)
+        if position is not None:
+            self.responses[position] = response
+            self._created[position] = created_at
+            return
+        position = len(self.questions)
+        if position == len(self._vectors):
+            grown = np.zeros((2 * len(self._vectors), _QUESTION_FEATURES), dtype=np.float32)
+            grown[:position] = self._vectors
+            self._vectors = grown
+            created = np.zeros(2 * len(self._created), dtype=np.float64)
+            created[:position] = self._created
+            self._created = created
+        self._vectors[position] = vector
+        self._created[position] = created_at
+        self._positions[question] = position
+        self.questions.append(question)
+        self.responses.append(response)
+
+    def remove(self, question):
+        """Entfernt eine Frage (die letzte rückt auf ihren Platz)"""
+        position = self._positions.pop(question, None)
+        if position is None:
+            return
+        last = len(self.questions) - 1
+        if position != last:
+            self._vectors[position] = self._vectors[last]
+            self._created[position] = self._created[last]
+            self.questions[position] = self.questions[last]
+            self.responses[position] = self.responses[last]
+            self._positions[self.questions[position]] = position
+        self.questions.pop()
+        self.responses.pop()
+
+    def search(self, vector, created_after=None):
+        """
+        Sucht die ähnlichste frühere Frage
+
+        Args:
+            vector: Normierter Vektor der neuen Frage
+            created_after: Nur Fragen berücksichtigen, die danach gespeichert wurden (TTL)
+
+        Returns:
+            (Position, Kosinus-Ähnlichkeit) oder None bei leerem Index
+        """
+        import numpy as np
+
+        count = len(self.questions)
+        if not count:
+            return None
+        similarities = self._vectors[:count] @ vector
+        if created_after is not None:
+            similarities = np.where(self._created[:count] >= created_after, similarities, -np.inf)
+        position = int(similarities.argmax())
+        if similarities[position] == -np.inf:
+            return None
+        return position, float(similarities[position])
+
+
+class ResponseCache:
+    """
+    SQLite-basierter Antwort-Cache mit TTL und größenbegrenzter LRU-Verdrängung
+
+    Thread-sicher; mehrere Prozesse können dieselbe Datei verwenden (WAL-Modus).
+    """
+
+    def __init__(self, path, mode="readwrite", ttl_seconds=None, max_entries=None, semantic_threshold=None):
+        """
+        Öffnet (oder erstellt) einen Antwort-Cache
+
+        Args:
+            path: Pfad zur SQLite-Datei
+            mode: "readwrite", "readonly", "refresh" oder "bypass"
+            ttl_seconds: Lebensdauer eines Eintrags (None = unbegrenzt)
+            max_entries: Maximale Anzahl Einträge (None = unbegrenzt)
+            semantic_threshold: Ähnlichkeit (0-1), ab der eine umformulierte Frage die
+                Antwort einer früheren bekommt (None = nur exakte Treffer)
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unbekannter Cache-Modus: {mode} (erlaubt: {', '.join(CACHE_MODES)})")
+
+        self.path = path
+        self.mode = mode
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.semantic_threshold = semantic_threshold
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.question_evictions = 0
+        self.semantic_hits = 0
+        self.semantic_misses = 0
+        # {(neue Frage, frühere Frage): [Treffer, Ähnlichkeit]}
+        self._semantic_matches = {}
+        self._question_indexes = {}
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)"
+        )
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS questions (
+                scope TEXT NOT NULL,
+                question TEXT NOT NULL,
+                response TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (scope, question)
+            )
+        """)
+        self._connection.commit()
+
+        self._purge_expired()
+        self._entry_count = self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        self._question_count = self._connection.execute("SELECT COUNT(*) FROM questions").fetchone()[0]
+
+    @staticmethod
+    def make_key(model, temperature, max_tokens, system_prompt, context):
+        """
+        Berechnet den Cache-Schlüssel einer Anfrage
+
+        Args:
+            model: Modellname
+            temperature: Kreativitätslevel
+            max_tokens: Maximale Antwortlänge
+            system_prompt: Vollständig gerenderter System-Prompt der Persona
+            context: Kontext aus PersonaAgent._build_context
+
+        Returns:
+            SHA-256 Hex-Digest
+        """
+        payload = json.dumps([model, temperature, max_tokens, system_prompt, context], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def make_scope(model, temperature, max_tokens, system_prompt):
+        """
+        Berechnet den Bereich des Fragen-Index: Persona und Modell-Konfiguration
+
+        Returns:
+            SHA-256 Hex-Digest
+        """
+        payload = json.dumps([model, temperature, max_tokens, system_prompt], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """
+        Liest eine Antwort aus dem Cache
+
+        Args:
+            key: Cache-Schlüssel aus make_key()
+
+        Returns:
+            Die gespeicherte Antwort oder None (kein Treffer / Modus ohne Lesen)
+        """
+        if self.mode in ("bypass", "refresh"):
+            return None
+
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is not None and self._is_expired(row[1], now):
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._connection.commit()
+                self._entry_count -= 1
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._connection.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._connection.commit()
+            self.hits += 1
+            return row[0]
+
+    def set(self, key, response):
+        """
+        Speichert eine Antwort im Cache (nur in den Modi "readwrite" und "refresh")
+
+        Args:
+            key: Cache-Schlüssel aus make_key()
+            response: Die Antwort der Persona
+        """
+        if self.mode not in ("readwrite", "refresh"):
+            return
+
+        now = time.time()
+        with self._lock:
+            existed = self._connection.execute(
+                "SELECT 1 FROM responses WHERE key = ?", (key,)
+            ).fetchone() is not None
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, response, now, now)
+            )
+            if not existed:
+                self._entry_count += 1
+            self.writes += 1
+            self._evict_if_needed()
+            self._connection.commit()
+
+    def get_similar(self, scope, question):
+        """
+        Sucht die Antwort auf eine ähnliche frühere Frage (nur mit semantic_threshold)
+
+        Args:
+            scope: Bereich aus make_scope()
+            question: Die neue Frage
+
+        Returns:
+            (Antwort, frühere Frage, Ähnlichkeit) oder None
+        """
+        if self.semantic_threshold is None or self.mode in ("bypass", "refresh"):
+            return None
+
+        vector = vectorize_question(question)
+        # Abgelaufene Fragen nie liefern - der Index lebt so lange wie der Prozess
+        created_after = time.time() - self.ttl_seconds if self.ttl_seconds is not None else None
+        with self._lock:
+            match = self._get_question_index(scope).search(vector, created_after)
+            if match is None or match[1] < self.semantic_threshold:
+                self.semantic_misses += 1
+                return None
+            index = self._question_indexes[scope]
+            position, similarity = match
+            matched_question = index.questions[position]
+            self.semantic_hits += 1
+            entry = self._semantic_matches.setdefault((question, matched_question), [0, similarity])
+            entry[0] += 1
+            return index.responses[position], matched_question, similarity
+
+    def add_question(self, scope, question, response):
+        """
+        Nimmt eine beantwortete Frage in den Fragen-Index auf (nur mit semantic_threshold)
+
+        Args:
+            scope: Bereich aus make_scope()
+            question: Die gestellte Frage
+            response: Die Antwort der Persona
+        """
+        if self.semantic_threshold is None or self.mode not in ("readwrite", "refresh"):
+            return
+
+        vector = vectorize_question(question)
+        now = time.time()
+        with self._lock:
+            self._get_question_index(scope).add(question, response, vector, now)
+            existed = self._connection.execute(
+                "SELECT 1 FROM questions WHERE scope = ? AND question = ?", (scope, question)
+            ).fetchone() is not None
+            self._connection.execute(
+                "INSERT OR REPLACE INTO questions (scope, question, response, vector, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (scope, question, response, vector.tobytes(), now)
+            )
+            if not existed:
+                self._question_count += 1
+            self._evict_questions_if_needed()
+            self._connection.commit()
+
+    def _get_question_index(self, scope):
+        """Lädt den Fragen-Index eines Bereichs beim ersten Zugriff (Aufrufer hält den Lock)"""
+        import numpy as np
+
+        index = self._question_indexes.get(scope)
+        if index is None:
+            index = QuestionIndex()
+            rows = self._connection.execute(
+                "SELECT question, response, vector, created_at FROM questions WHERE scope = ? ORDER BY created_at",
+                (scope,)
+            ).fetchall()
+            for question, response, blob, created_at in rows:
+                vector = np.frombuffer(blob, dtype=np.float32)
+                if len(vector) != _QUESTION_FEATURES:
+                    vector = vectorize_question(question)
+                index.add(question, response, vector, created_at)
+            self._question_indexes[scope] = index
+        return index
+
+    def get_stats(self):
+        """
+        Gibt die Statistik dieses Laufs zurück
+
+        Returns:
+            Dictionary mit Modus, Treffern, Fehlschlägen, Schreibvorgängen und Verdrängungen,
+            mit Fragen-Index zusätzlich semantische Treffer und die zugeordneten Fragen
+        """
+        lookups = self.hits + self.misses
+        stats = {
+            "mode": self.mode,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "entries": self._entry_count
+        }
+        if self.semantic_threshold is not None:
+            semantic_lookups = self.semantic_hits + self.semantic_misses
+            stats.update({
+                "semantic_threshold": self.semantic_threshold,
+                "semantic_hits": self.semantic_hits,
+                "questions": self._question_count,
+                "question_evictions": self.question_evictions,
+                "semantic_hit_rate": round(self.semantic_hits / semantic_lookups, 3) if semantic_lookups else 0.0,
+                "semantic_matches": [
+                    {"question": question, "matched_question": matched_question,
+                     "similarity": round(similarity, 3), "hits": hits}
+                    for (question, matched_question), (hits, similarity) in self._semantic_matches.items()
+                ]
+            })
+        return stats
+
+    def close(self):
+        """Schließt die Datenbankverbindung"""
+        with self._lock:
+            self._connection.close()
+
+    def _is_expired(self, created_at, now):
+        """Prüft, ob ein Eintrag älter als die TTL ist"""
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _purge_expired(self):
+        """Löscht alle abgelaufenen Einträge"""
+        if self.ttl_seconds is None:
+            return
+        with self._lock:
+            cutoff = time.time() - self.ttl_seconds
+            self._connection.execute("DELETE FROM responses WHERE created_at < ?", (cutoff,))
+            self._connection.execute("DELETE FROM questions WHERE created_at < ?", (cutoff,))
+            self._connection.commit()
+
+    def _evict_questions_if_needed(self):
+        """
+        Begrenzt den Fragen-Index auf max_entries - die ältesten Fragen fallen
+        zuerst heraus, auch aus den geladenen Indizes (Aufrufer hält den Lock)
+        """
+        if self.max_entries is None or self._question_count <= self.max_entries:
+            return
+        overflow = self._question_count - self.max_entries
+        rows = self._connection.execute(
+            "SELECT scope, question FROM questions ORDER BY created_at ASC LIMIT ?", (overflow,)
+        ).fetchall()
+        self._connection.executemany("DELETE FROM questions WHERE scope = ? AND question = ?", rows)
+        for scope, question in rows:
+            index = self._question_indexes.get(scope)
+            if index is not None:
+                index.remove(question)
+        self._question_count -= len(rows)
+        self.question_evictions += len(rows)
+
+    def _evict_if_needed(self):
+        """Verdrängt die am längsten ungenutzten Einträge (Aufrufer hält den Lock)"""
+        if self.max_entries is None or self._entry_count <= self.max_entries:
+            return
+        overflow = self._entry_count - self.max_entries
+        self._connection.execute(
+            "DELETE FROM responses WHERE key IN "
+            "(SELECT key FROM responses ORDER BY last_access ASC LIMIT ?)",
+            (overflow,)
+        )
+        self._entry_count -= overflow
+        self.evictions += overflow
+
+
+def open_response_cache(path=None, mode=None, ttl_seconds=None, max_entries=None, semantic_threshold=None):
+    """
+    Öffnet den Antwort-Cache mit Werten aus Argumenten oder der .env
+
+    Args:
+        path: Pfad zur Cache-Datei (Standard: RESPONSE_CACHE, None = deaktiviert)
+        mode: Cache-Modus (Standard: RESPONSE_CACHE_MODE)
+        ttl_seconds: Lebensdauer in Sekunden (Standard: RESPONSE_CACHE_TTL)
+        max_entries: Maximale Einträge (Standard: RESPONSE_CACHE_MAX_ENTRIES)
+        semantic_threshold: Schwelle des Fragen-Index (Standard: RESPONSE_CACHE_SEMANTIC, sonst aus)
+
+    Returns:
+        ResponseCache oder None, wenn kein Cache konfiguriert ist
+    """
+    path = path or get_response_cache_path()
+    if not path:
+        return None
+    return ResponseCache(
+        path,
+        mode=mode or get_response_cache_mode(),
+        ttl_seconds=ttl_seconds if ttl_seconds is not None else get_response_cache_ttl(),
+        max_entries=max_entries if max_entries is not None else get_response_cache_max_entries(),
+        semantic_threshold=semantic_threshold if semantic_threshold is not None
+        else get_response_cache_semantic_threshold()
+    )
@@ -0,0 +1,382 @@
+"""
+Kompaktes, spaltenorientiertes Ergebnis-Modell für Interviews
+
+Statt verschachtelter Dictionaries pro Antwort (mit Alter und ISO-Zeitstempel
+in jeder Zeile) hält ein InterviewResult die Antworten in Spalten:
+
+- Personas und Fragen werden einmal abgelegt (interniert), jede Antwort
+  verweist nur per Index darauf
+- Frage, Persona, Status und Zeitstempel liegen in kompakten array-Spalten,
+  nur die Antworttexte selbst sind Python-Strings
+
+Das Modell versteht beide bisherigen Formen (CLI: "interview_data",
+GUI: "questions_and_answers") und exportiert nach JSON/Markdown, nach NumPy
+(.npz, ohne Pickle) und - falls pyarrow installiert ist - nach Arrow/Feather.
+"""
+
+import array
+import datetime
+import io
+import json
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+from results_stream import (STATUS_SUCCESS, STATUS_ERROR, ResultsStreamIndex, get_response_status,
+                            write_json_report, write_markdown_report)
+
+# Index in der Status-Spalte = Status-Code
+STATUS_VALUES = (STATUS_SUCCESS, STATUS_ERROR)
+
+# Zeitstempel werden als Mikrosekunden seit 1970 gespeichert; fehlende Werte als Sentinel
+_NO_TIMESTAMP = -(2 ** 63)
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+# array-Typcodes der Spalten -> NumPy-Typen
+_NUMPY_TYPES = {'I': 'uint32', 'B': 'uint8', 'q': 'int64'}
+
+
+class ResponseRow(NamedTuple):
+    """Eine Antwort als Zeile (beim Iterieren über ein InterviewResult)"""
+    question_id: int
+    question: str
+    agent_id: str
+    agent_age: Optional[int]
+    response: str
+    timestamp: Optional[str]
+    status: str
+
+
+def _to_micros(timestamp: Optional[str]) -> int:
+    """ISO-Zeitstempel (ohne Zeitzone) -> Mikrosekunden seit 1970"""
+    if not timestamp:
+        return _NO_TIMESTAMP
+    delta = datetime.datetime.fromisoformat(timestamp).replace(tzinfo=None) - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _as_numpy(column: array.array):
+    """Sicht auf eine array-Spalte als NumPy-Array (ohne Kopie)"""
+    import numpy as np
+    return np.frombuffer(column, dtype=_NUMPY_TYPES[column.typecode])
+
+
+def _from_micros(micros: int) -> Optional[str]:
+    """Mikrosekunden seit 1970 -> ISO-Zeitstempel"""
+    if micros == _NO_TIMESTAMP:
+        return None
+    return (_EPOCH + datetime.timedelta(microseconds=micros)).isoformat()
+
+
+class InterviewResult:
+    """
+    Interview-Ergebnis in Spalten - eine Zeile pro Antwort
+
+    Spalten (gleich lang, Zeile i = i-te Antwort in Einfüge-Reihenfolge):
+        question_codes: Index in `questions` (Frage-Nr. - 1)
+        agent_codes: Index in `agents`
+        status_codes: Index in STATUS_VALUES
+        timestamps: Mikrosekunden seit 1970 (lokale Zeit wie datetime.now())
+        responses: Antworttexte
+    """
+
+    __slots__ = ("timestamp", "agents", "questions", "question_codes", "agent_codes",
+                 "status_codes", "timestamps", "responses", "_agent_index")
+
+    def __init__(self, timestamp: Optional[str] = None, agents: Optional[List[Dict]] = None,
+                 questions: Optional[List[str]] = None):
+        """
+        Erstellt ein leeres Ergebnis
+
+        Args:
+            timestamp: Zeitstempel des Interviews (Standard: jetzt)
+            agents: Teilnehmer (get_agent_info der Personas)
+            questions: Fragen in Interview-Reihenfolge
+        """
+        self.timestamp = timestamp or datetime.datetime.now().isoformat()
+        self.agents = []
+        self.questions = list(questions or [])
+        self.question_codes = array.array('I')
+        self.agent_codes = array.array('I')
+        self.status_codes = array.array('B')
+        self.timestamps = array.array('q')
+        self.responses = []
+        self._agent_index = {}
+        for agent in agents or []:
+            self.add_agent(agent)
+
+    def __len__(self) -> int:
+        return len(self.responses)
+
+    def add_agent(self, agent: Dict) -> int:
+        """
+        Legt eine Persona einmal ab
+
+        Args:
+            agent: Persona-Info mit mindestens "name"
+
+        Returns:
+            Index der Persona in `agents`
+        """
+        code = self._agent_index.get(agent['name'])
+        if code is None:
+            code = len(self.agents)
+            self.agents.append(dict(agent))
+            self._agent_index[agent['name']] = code
+        return code
+
+    def set_question(self, question_id: int, question: str):
+        """Legt die Frage mit der Nummer question_id (ab 1) ab"""
+        while len(self.questions) < question_id:
+            self.questions.append("")
+        self.questions[question_id - 1] = question
+
+    def add_response(self, question_id: int, question: str, response_data: Dict):
+        """
+        Hängt eine Antwort an
+
+        Args:
+            question_id: Nummer der Frage (ab 1)
+            question: Text der Frage
+            response_data: {agent_id, agent_age, response, timestamp, status}
+        """
+        if question_id > len(self.questions) or self.questions[question_id - 1] != question:
+            self.set_question(question_id, question)
+        agent_code = self._agent_index.get(response_data['agent_id'])
+        if agent_code is None:
+            agent_code = self.add_agent({"name": response_data['agent_id'],
+                                         "age": response_data.get('agent_age')})
+        response = response_data['response']
+        status = response_data.get('status')
+        if status not in STATUS_VALUES:
+            status = get_response_status(response)
+
+        self.question_codes.append(question_id - 1)
+        self.agent_codes.append(agent_code)
+        self.status_codes.append(STATUS_VALUES.index(status))
+        self.timestamps.append(_to_micros(response_data.get('timestamp')))
+        self.responses.append(response)
+
+    def row(self, index: int) -> ResponseRow:
+        """Gibt die Antwort in Zeile `index` zurück"""
+        question_code = self.question_codes[index]
+        agent = self.agents[self.agent_codes[index]]
+        return ResponseRow(
+            question_id=question_code + 1,
+            question=self.questions[question_code],
+            agent_id=agent['name'],
+            agent_age=agent.get('age'),
+            response=self.responses[index],
+            timestamp=_from_micros(self.timestamps[index]),
+            status=STATUS_VALUES[self.status_codes[index]]
+        )
+
+    def iter_rows(self) -> Iterator[ResponseRow]:
+        """Alle Antworten in Einfüge-Reihenfolge"""
+        for index in range(len(self.responses)):
+            yield self.row(index)
+
+    def iter_questions(self) -> Iterator[Dict]:
+        """
+        Liefert die Fragen nacheinander im Format von interview_data
+        (auch Fragen ohne Antworten, z.B. während ein Interview noch läuft)
+        """
+        rows_by_question = [[] for _ in self.questions]
+        for index, question_code in enumerate(self.question_codes):
+            rows_by_question[question_code].append(index)
+        for question_code, question in enumerate(self.questions):
+            # Pro Frage in Persona-Reihenfolge, egal in welcher Reihenfolge die Antworten kamen
+            indices = sorted(rows_by_question[question_code], key=self.agent_codes.__getitem__)
+            responses = []
+            for index in indices:
+                row = self.row(index)
+                responses.append({
+                    "agent_id": row.agent_id,
+                    "agent_age": row.agent_age,
+                    "response": row.response,
+                    "timestamp": row.timestamp,
+                    "status": row.status
+                })
+            yield {"question_id": question_code + 1, "question": question, "responses": responses}
+
+    def get_summary(self) -> Dict:
+        """Zähler für die Zusammenfassung: Fragen, Antworten und Antworten mit Fehler"""
+        error_code = STATUS_VALUES.index(STATUS_ERROR)
+        return {
+            "question_count": len(self.questions),
+            "response_count": len(self.responses),
+            "error_count": self.status_codes.count(error_code)
+        }
+
+    # =====================================
+    # DICTIONARY / JSON / MARKDOWN
+    # =====================================
+
+    def to_dict(self) -> Dict:
+        """
+        Gibt das Ergebnis als Dictionary zurück (Format von run_full_interview)
+
+        Returns:
+            Dictionary mit timestamp, agents und interview_data
+        """
+        return {
+            "timestamp": self.timestamp,
+            "agents": [dict(agent) for agent in self.agents],
+            "interview_data": list(self.iter_questions())
+        }
+
+    @classmethod
+    def from_dict(cls, results: Dict) -> "InterviewResult":
+        """
+        Erstellt ein InterviewResult aus einem Ergebnis-Dictionary
+
+        Versteht das CLI-Format ("interview_data" mit question_id) und das
+        frühere GUI-Format ("questions_and_answers", Fragen in Reihenfolge).
+        """
+        result = cls(results.get('timestamp'), results.get('agents'))
+        questions = results.get('interview_data')
+        if questions is None:
+            questions = results.get('questions_and_answers', [])
+        for position, question_data in enumerate(questions, 1):
+            question_id = question_data.get('question_id', position)
+            result.set_question(question_id, question_data['question'])
+            for response_data in question_data.get('responses', []):
+                result.add_response(question_id, question_data['question'], response_data)
+        return result
+
+    @classmethod
+    def from_stream(cls, stream_path: str) -> "InterviewResult":
+        """Lädt einen Ergebnis-Stream (.jsonl) - pro Zelle zählt die letzte Antwort"""
+        index = ResultsStreamIndex(stream_path)
+        result = cls(index.timestamp, index.agents, index.questions)
+        for question_data in index.iter_questions():
+            for response_data in question_data['responses']:
+                result.add_response(question_data['question_id'], question_data['question'], response_data)
+        return result
+
+    def write_report(self, file, output_format: str = "json"):
+        """
+        Schreibt den JSON- oder Markdown-Bericht (gleiches Format wie die CLI)
+
+        Args:
+            file: Offene Text-Datei
+            output_format: "json" oder "md"
+        """
+        from analytics import build_report_analysis
+
+        writer = write_json_report if output_format == "json" else write_markdown_report
+        writer(file, self.timestamp, self.agents, self.iter_questions(),
+               build_report_analysis(self.iter_questions()))
+
+    def to_report(self, output_format: str = "json") -> str:
+        """Gibt den JSON- oder Markdown-Bericht als String zurück"""
+        buffer = io.StringIO()
+        self.write_report(buffer, output_format)
+        return buffer.getvalue()
+
+    # =====================================
+    # SPALTEN-EXPORT (NumPy / Arrow)
+    # =====================================
+
+    def _get_metadata(self) -> Dict:
+        return {"timestamp": self.timestamp, "agents": self.agents, "questions": self.questions,
+                "status_values": list(STATUS_VALUES)}
+
+    def save_npz(self, path: str):
+        """
+        Speichert das Ergebnis als NumPy-Archiv (.npz, ohne Pickle)
+
+        Die Antworttexte liegen als ein UTF-8-Block mit Zeichen-Offsets vor,
+        Personas, Fragen und Zeitstempel des Interviews als JSON-Metadaten.
+
+        Args:
+            path: Zieldatei (.npz)
+        """
+        import numpy as np
+
+        offsets = np.zeros(len(self.responses) + 1, dtype=np.int64)
+        np.cumsum([len(response) for response in self.responses], out=offsets[1:])
+        np.savez(
+            path,
+            question_codes=_as_numpy(self.question_codes),
+            agent_codes=_as_numpy(self.agent_codes),
+            status_codes=_as_numpy(self.status_codes),
+            timestamps=_as_numpy(self.timestamps),
+            response_offsets=offsets,
+            response_text=np.frombuffer("".join(self.responses).encode('utf-8'), dtype=np.uint8),
+            metadata=np.frombuffer(json.dumps(self._get_metadata(), ensure_ascii=False).encode('utf-8'),
+                                   dtype=np.uint8)
+        )
+
+    @classmethod
+    def load_npz(cls, path: str) -> "InterviewResult":
+        """
+        Lädt ein mit save_npz gespeichertes Ergebnis
+
+        Args:
+            path: Pfad der .npz-Datei
+
+        Returns:
+            InterviewResult
+        """
+        import numpy as np
+
+        with np.load(path, allow_pickle=False) as archive:
+            metadata = json.loads(archive['metadata'].tobytes().decode('utf-8'))
+            result = cls(metadata['timestamp'], metadata['agents'], metadata['questions'])
+            result.question_codes.frombytes(archive['question_codes'].astype(np.uint32).tobytes())
+            result.agent_codes.frombytes(archive['agent_codes'].astype(np.uint32).tobytes())
+            result.status_codes.frombytes(archive['status_codes'].astype(np.uint8).tobytes())
+            result.timestamps.frombytes(archive['timestamps'].astype(np.int64).tobytes())
+            text = archive['response_text'].tobytes().decode('utf-8')
+            offsets = archive['response_offsets'].tolist()
+        result.responses = [text[start:end] for start, end in zip(offsets, offsets[1:])]
+        return result
+
+    def to_arrow(self):
+        """
+        Gibt das Ergebnis als pyarrow.Table zurück (eine Zeile pro Antwort)
+
+        Fragen, Personas und Status sind Dictionary-kodiert; Teilnehmer und
+        Zeitstempel des Interviews stehen in den Schema-Metadaten.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("Arrow-Export benötigt pyarrow: pip install pyarrow")
+
+        def dictionary_column(codes, values):
+            return pa.DictionaryArray.from_arrays(pa.array(_as_numpy(codes)), pa.array(values, type=pa.string()))
+
+        table = pa.table({
+            "question_id": pa.array(_as_numpy(self.question_codes) + 1),
+            "question": dictionary_column(self.question_codes, self.questions),
+            "agent_id": dictionary_column(self.agent_codes, [agent['name'] for agent in self.agents]),
+            "response": pa.array(self.responses, type=pa.string()),
+            "timestamp": pa.array(_as_numpy(self.timestamps), type=pa.timestamp('us'),
+                                  mask=_as_numpy(self.timestamps) == _NO_TIMESTAMP),
+            "status": dictionary_column(self.status_codes, list(STATUS_VALUES)),
+        })
+        metadata = {"interview": json.dumps(self._get_metadata(), ensure_ascii=False)}
+        return table.replace_schema_metadata(metadata)
+
+    def save_arrow(self, path: str):
+        """Speichert das Ergebnis als Arrow/Feather-Datei (benötigt pyarrow)"""
+        from pyarrow import feather
+        feather.write_feather(self.to_arrow(), path)
+
+
+def load_result(path: str) -> InterviewResult:
+    """
+    Lädt ein Ergebnis aus einer JSON-, JSONL- oder NPZ-Datei
+
+    Args:
+        path: Pfad der Ergebnis-Datei (.json, .jsonl oder .npz)
+
+    Returns:
+        InterviewResult
+    """
+    if path.endswith(".npz"):
+        return InterviewResult.load_npz(path)
+    if path.endswith(".jsonl"):
+        return InterviewResult.from_stream(path)
+    with open(path, 'r', encoding='utf-8') as file:
+        return InterviewResult.from_dict(json.load(file))
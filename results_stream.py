@@ -0,0 +1,424 @@
+"""
+Ergebnis-Stream (JSONL) - Checkpoint während des Interviews
+
+Jede Antwort wird sofort als eine JSON-Zeile an eine .jsonl-Datei angehängt
+(gepuffert, alle RESULTS_FLUSH_EVERY Antworten auf die Platte geschrieben).
+Bricht ein langer Lauf ab, bleibt alles bis zum letzten Flush erhalten.
+
+Die fertigen JSON- und Markdown-Berichte werden anschließend aus dieser Datei
+gebaut, Frage für Frage über einen Offset-Index - ohne das ganze Interview im
+Speicher zu halten.
+
+Zeilen-Format:
+    {"type": "run", "timestamp": "...", "agents": [...], "questions": [...]}
+    {"type": "response", "question_id": 1, "question": "...", "agent_id": "Anna",
+     "agent_age": 20, "response": "...", "timestamp": "...", "status": "success"}
+
+Kommt eine Zelle (Frage, Persona) mehrfach vor, gilt die letzte Zeile.
+"""
+
+import json
+import os
+import shutil
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional
+
+STATUS_SUCCESS = "success"
+STATUS_ERROR = "error"
+
+# Felder, die nur im Stream stehen, nicht in den Antworten des Berichts
+_STREAM_ONLY_FIELDS = ("type", "question_id", "question")
+
+# Dateien eines Laufs: <basis>.jsonl, <basis>.json/.md/.npz, run_batch: <basis>_data.json
+_RUN_SUFFIXES = (".jsonl", "_data.json", ".json", ".md", ".npz")
+
+
+def get_results_flush_every():
+    """Nach wie vielen Antworten der Stream auf die Platte geschrieben wird"""
+    return max(1, int(os.getenv('RESULTS_FLUSH_EVERY', 25)))
+
+
+def get_response_status(response: str) -> str:
+    """Ordnet eine Persona-Antwort als "success" oder "error" ein"""
+    if not response or not response.strip() or response.startswith("[Fehler"):
+        return STATUS_ERROR
+    return STATUS_SUCCESS
+
+
+def get_stream_path(output_file: str) -> str:
+    """Pfad des Ergebnis-Streams zu einer Ausgabedatei (ohne Endung)"""
+    return f"{output_file}.jsonl"
+
+
+def to_response_data(record: Dict) -> Dict:
+    """Macht aus einer Stream-Zeile wieder ein Antwort-Dictionary (ohne Stream-Felder)"""
+    return {key: value for key, value in record.items() if key not in _STREAM_ONLY_FIELDS}
+
+
+def get_run_base(run: str) -> str:
+    """Basis-Pfad eines Laufs (ohne Endung) aus einer seiner Dateien oder dem Basis-Pfad selbst"""
+    for suffix in _RUN_SUFFIXES:
+        if run.endswith(suffix):
+            return run[:-len(suffix)]
+    return run
+
+
+class ResultsStreamWriter:
+    """
+    Hängt Interview-Antworten als JSONL an eine Datei an (thread-sicher)
+    """
+
+    def __init__(self, path: str, flush_every: Optional[int] = None, append: bool = False):
+        """
+        Öffnet den Stream
+
+        Args:
+            path: Pfad der .jsonl-Datei
+            flush_every: Antworten pro Flush (Standard: RESULTS_FLUSH_EVERY)
+            append: True = an bestehende Datei anhängen (z.B. zum Fortsetzen)
+        """
+        self.path = path
+        self.flush_every = flush_every or get_results_flush_every()
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._file = open(path, "a" if append else "w", encoding="utf-8")
+        if append and _ends_without_newline(path):
+            # Abgeschnittene letzte Zeile abschließen, sonst wäre die erste neue Zeile kaputt
+            self._file.write("\n")
+
+    def write_header(self, agents: List[Dict], questions: List[str], timestamp: str):
+        """Schreibt den Kopf eines Laufs (Teilnehmer und Fragen) und sofort auf die Platte"""
+        self._write({"type": "run", "timestamp": timestamp, "agents": agents, "questions": questions},
+                    force_flush=True)
+
+    def write_response(self, question_id: int, question: str, response_data: Dict):
+        """
+        Hängt eine Antwort an den Stream an
+
+        Args:
+            question_id: Nummer der Frage (ab 1)
+            question: Fragetext
+            response_data: Antwort-Dictionary (agent_id, agent_age, response, timestamp, status)
+        """
+        record = {"type": "response", "question_id": question_id, "question": question}
+        record.update(response_data)
+        record.setdefault("status", get_response_status(record.get("response", "")))
+        self._write(record)
+
+    def flush(self):
+        """Schreibt gepufferte Zeilen auf die Platte"""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        """Schreibt den Rest und schließt die Datei"""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._flush_locked()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write(self, record: Dict, force_flush: bool = False):
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._buffer.append(line)
+            if force_flush or len(self._buffer) >= self.flush_every:
+                self._flush_locked()
+
+    def _flush_locked(self):
+        """Flush inklusive fsync (Aufrufer hält den Lock)"""
+        if not self._buffer or self._file.closed:
+            return
+        self._file.write("".join(self._buffer))
+        self._buffer.clear()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+
+def _ends_without_newline(path: str) -> bool:
+    """True wenn die Datei nicht leer ist und nicht mit einem Zeilenumbruch endet"""
+    with open(path, "rb") as file:
+        file.seek(0, os.SEEK_END)
+        if file.tell() == 0:
+            return False
+        file.seek(-1, os.SEEK_END)
+        return file.read(1) != b"\n"
+
+
+class ResultsStreamIndex:
+    """
+    Offset-Index über einen Ergebnis-Stream
+
+    Merkt sich pro Zelle (Frage, Persona) nur die Byte-Position der letzten
+    Zeile, nicht die Antwort selbst. Antworten werden beim Schreiben des
+    Berichts Frage für Frage nachgeladen.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.timestamp = None
+        self.agents = []
+        self.questions = []
+        self.offsets = {}
+        self.errors = set()
+        self._build()
+
+    def _build(self):
+        with open(self.path, "rb") as file:
+            offset = 0
+            for line in file:
+                line_offset = offset
+                offset += len(line)
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                if record.get("type") == "run":
+                    # Erster Kopf bestimmt Zeitstempel und Reihenfolge der Personas,
+                    # spätere (Fortsetzungen) ergänzen neue Personas und Fragen -
+                    # ein geänderter Fragetext ersetzt den alten
+                    if self.timestamp is None:
+                        self.timestamp = record.get("timestamp")
+                    known_agents = {agent["name"] for agent in self.agents}
+                    self.agents.extend(agent for agent in record.get("agents", [])
+                                       if agent["name"] not in known_agents)
+                    for index, question in enumerate(record.get("questions", [])):
+                        if index < len(self.questions):
+                            self.questions[index] = question
+                        else:
+                            self.questions.append(question)
+                elif record.get("type") == "response":
+                    cell = (record["question_id"], record["agent_id"])
+                    self.offsets[cell] = line_offset
+                    if record.get("status", get_response_status(record.get("response", ""))) == STATUS_ERROR:
+                        self.errors.add(cell)
+                    else:
+                        self.errors.discard(cell)
+                    # Die neueste Zeile bestimmt den Fragetext - Überschrift passt zur Antwort
+                    while len(self.questions) < record["question_id"]:
+                        self.questions.append(None)
+                    self.questions[record["question_id"] - 1] = record["question"]
+
+    def get_summary(self) -> Dict:
+        """Zähler für die Zusammenfassung: Fragen, Antworten und Antworten mit Fehler"""
+        return {
+            "question_count": len(self.questions),
+            "response_count": len(self.offsets),
+            "error_count": len(self.errors)
+        }
+
+    def get_completed_cells(self) -> Dict:
+        """
+        Lädt alle erfolgreich beantworteten Zellen (zum Fortsetzen eines Laufs)
+
+        Returns:
+            Dictionary {(question_id, agent_id): Antwort-Zeile}
+        """
+        completed = {}
+        with open(self.path, "rb") as file:
+            for cell, offset in self.offsets.items():
+                if cell in self.errors:
+                    continue
+                file.seek(offset)
+                completed[cell] = json.loads(file.readline())
+        return completed
+
+    def iter_questions(self) -> Iterator[Dict]:
+        """
+        Liefert die Fragen in Reihenfolge, jeweils mit den Antworten in Persona-Reihenfolge
+
+        Returns:
+            Iterator über Dictionaries {question_id, question, responses}
+        """
+        agent_order = [agent["name"] for agent in self.agents]
+        with open(self.path, "rb") as file:
+            for question_index, question in enumerate(self.questions):
+                question_id = question_index + 1
+                responses = []
+                for agent_id in agent_order:
+                    offset = self.offsets.get((question_id, agent_id))
+                    if offset is None:
+                        continue
+                    file.seek(offset)
+                    responses.append(to_response_data(json.loads(file.readline())))
+                yield {"question_id": question_id, "question": question, "responses": responses}
+
+
+# =====================================
+# BERICHTE (JSON / Markdown)
+# =====================================
+
+def _dumps_nested(value, depth: int) -> str:
+    """json.dumps mit indent=2 für einen Wert auf Verschachtelungstiefe `depth`"""
+    return json.dumps(value, indent=2, ensure_ascii=False).replace("\n", "\n" + "  " * depth)
+
+
+def write_json_report(file, timestamp: str, agents: List[Dict], questions: Iterable[Dict],
+                      analysis: Optional[Dict] = None, metrics: Optional[Dict] = None):
+    """
+    Schreibt den JSON-Bericht Frage für Frage (gleiches Format wie json.dump(..., indent=2))
+
+    Args:
+        file: Offene Text-Datei
+        timestamp: Zeitstempel des Interviews
+        agents: Teilnehmer (get_agent_info der Personas)
+        questions: Iterable über {question_id, question, responses}
+        analysis: Optionale Auswertung (analytics.py), steht unter "analysis"
+        metrics: Optionale Token-/Latenz-Messung (metrics.py), steht unter "metrics"
+    """
+    file.write("{\n")
+    file.write(f'  "timestamp": {json.dumps(timestamp, ensure_ascii=False)},\n')
+    file.write(f'  "agents": {_dumps_nested(agents, 1)},\n')
+    file.write('  "interview_data": [')
+    first = True
+    for question_data in questions:
+        file.write("\n    " if first else ",\n    ")
+        file.write(_dumps_nested(question_data, 2))
+        first = False
+    file.write("]" if first else "\n  ]")
+    if analysis is not None:
+        file.write(f',\n  "analysis": {_dumps_nested(analysis, 1)}')
+    if metrics is not None:
+        file.write(f',\n  "metrics": {_dumps_nested(metrics, 1)}')
+    file.write("\n}")
+
+
+def write_markdown_report(file, timestamp: str, agents: List[Dict], questions: Iterable[Dict],
+                          analysis: Optional[Dict] = None):
+    """
+    Schreibt den Markdown-Bericht Frage für Frage
+
+    Args:
+        file: Offene Text-Datei
+        timestamp: Zeitstempel des Interviews
+        agents: Teilnehmer (get_agent_info der Personas)
+        questions: Iterable über {question_id, question, responses}
+        analysis: Optionale Auswertung (analytics.py), als Abschnitt "Auswertung" am Ende
+    """
+    # Schreibe den Titel
+    file.write("# Synthetische Interview Ergebnisse\n\n")
+    file.write(f"**Zeitstempel:** {timestamp}\n\n")
+
+    # Schreibe die Teilnehmer-Informationen
+    file.write("## Teilnehmer\n\n")
+    for agent in agents:
+        file.write(f"- **{agent['name']}** ({agent['age']} Jahre): {agent['characteristics']}\n")
+
+    # Schreibe alle Fragen und Antworten
+    file.write("\n## Interview Fragen & Antworten\n\n")
+    for question_data in questions:
+        file.write(f"### Frage {question_data['question_id']}: {question_data['question']}\n\n")
+
+        for response in question_data['responses']:
+            file.write(f"**{response['agent_id']}:** {response['response']}\n\n")
+
+        file.write("---\n\n")  # Trennlinie zwischen Fragen
+
+    if analysis is not None:
+        from analytics import write_markdown_analysis
+        write_markdown_analysis(file, analysis)
+
+
+def write_report_from_stream(stream_path: str, output_path: str, output_format: str = "json",
+                             metrics: Optional[Dict] = None):
+    """
+    Baut den JSON- oder Markdown-Bericht aus einem Ergebnis-Stream
+
+    Args:
+        stream_path: Pfad der .jsonl-Datei
+        output_path: Pfad der Ausgabedatei (mit Endung)
+        output_format: "json" oder "md"
+        metrics: Optionale Token-/Latenz-Messung des Laufs (nur im JSON-Bericht)
+
+    Returns:
+        Der ResultsStreamIndex des Streams (z.B. für get_summary)
+    """
+    from analytics import build_report_analysis
+
+    index = ResultsStreamIndex(stream_path)
+    # Erst auswerten, dann schreiben - beides Frage für Frage aus dem Stream
+    analysis = build_report_analysis(index.iter_questions())
+    with open(output_path, "w", encoding="utf-8") as file:
+        if output_format == "json":
+            write_json_report(file, index.timestamp, index.agents, index.iter_questions(), analysis, metrics)
+        else:
+            write_markdown_report(file, index.timestamp, index.agents, index.iter_questions(), analysis)
+    return index
+
+
+def load_results_from_stream(stream_path: str) -> Dict:
+    """
+    Lädt einen Ergebnis-Stream komplett als Ergebnis-Dictionary (wie run_full_interview)
+
+    Returns:
+        Dictionary mit timestamp, agents und interview_data
+    """
+    index = ResultsStreamIndex(stream_path)
+    return {
+        "timestamp": index.timestamp,
+        "agents": index.agents,
+        "interview_data": list(index.iter_questions())
+    }
+
+
+# =====================================
+# FORTSETZEN (--resume)
+# =====================================
+
+def prepare_resume_stream(run: str, output_file: Optional[str] = None) -> str:
+    """
+    Stellt den Ergebnis-Stream eines früheren Laufs zum Fortsetzen bereit
+
+    Gibt es nur die JSON-Ausgabe (ältere Läufe ohne .jsonl), wird sie in einen
+    Stream umgewandelt. Mit abweichendem output_file wird der Stream kopiert,
+    der frühere Lauf bleibt dann unverändert.
+
+    Args:
+        run: Basis-Pfad oder eine Datei des früheren Laufs
+        output_file: Ausgabedatei (ohne Endung) für den fortgesetzten Lauf
+
+    Returns:
+        Pfad des Streams, an den der fortgesetzte Lauf anhängt
+    """
+    base = get_run_base(run)
+    source = get_stream_path(base)
+    target = get_stream_path(output_file or base)
+
+    if os.path.exists(source):
+        if os.path.abspath(source) != os.path.abspath(target):
+            shutil.copyfile(source, target)
+        return target
+
+    for results_file in (f"{base}_data.json", f"{base}.json"):
+        if os.path.exists(results_file):
+            convert_results_to_stream(results_file, target)
+            return target
+
+    raise FileNotFoundError(f"Kein früherer Lauf gefunden: {source} oder {base}.json fehlt")
+
+
+def convert_results_to_stream(results_file: str, stream_path: str):
+    """
+    Wandelt eine JSON-Ergebnisdatei (run_full_interview-Format) in einen Ergebnis-Stream um
+
+    Args:
+        results_file: Pfad der JSON-Datei
+        stream_path: Pfad der zu schreibenden .jsonl-Datei
+    """
+    with open(results_file, "r", encoding="utf-8") as file:
+        results = json.load(file)
+
+    interview_data = results.get("interview_data", [])
+    with ResultsStreamWriter(stream_path) as writer:
+        writer.write_header(results.get("agents", []), [q["question"] for q in interview_data],
+                            results.get("timestamp"))
+        for question_data in interview_data:
+            for response_data in question_data["responses"]:
+                writer.write_response(question_data["question_id"], question_data["question"], response_data)
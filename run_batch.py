@@ -6,26 +6,75 @@ Batch Interview Runner - Cron-kompatibles Skript für automatisierte Interviews
 Dieses Skript führt Batch-Interviews basierend auf einer Konfigurationsdatei durch.
 Es ist für die Verwendung mit cron oder anderen Scheduling-Systemen optimiert.
 
+Mehrere Konfigurationen (Dateien, Verzeichnisse oder Glob-Muster), Agenten und
+Modelle werden als Matrix in einem einzigen Prozess parallel abgearbeitet -
+unter einem gemeinsamen Budget gleichzeitiger LLM-Aufrufe. Alle Ausgaben
+landen in einem gemeinsamen Manifest (batch_manifest_<Zeitstempel>.json).
+
 Usage:
-    python run_batch.py [config_file] [--agent AGENT_NAME] [--output-dir DIR] [--log-file LOG]
+    python run_batch.py [config_file ...] [--agent AGENT_NAME] [--output-dir DIR] [--log-file LOG]
+    python run_batch.py [config_file|dir|glob ...] [--agents A B] [--models M1 M2] [--workers N]
 
 Examples:
     python run_batch.py                                    # Verwendet interview_batch.json
     python run_batch.py custom_batch.json                  # Verwendet benutzerdefinierte Datei
     python run_batch.py --agent anna                       # Nur Agent Anna
+    python run_batch.py studies/ --agents anna tom --workers 4
 """
 
 import argparse
+import glob
+import itertools
 import json
 import logging
 import os
+import re
 import sys
+import time
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 
 # Import our interview functionality
-from interview import run_interview
+from interview import (InterviewSession, add_cache_arguments, add_metrics_argument, add_profile_arguments,
+                       add_provider_argument, add_resume_argument, add_trace_argument,
+                       open_cache_from_arguments, get_available_agents)
+from profiling import print_profile_summary, profiling
+from metrics import get_metrics_file, write_prometheus_textfile
+from tracing import trace_span, tracing
+from results_stream import write_report_from_stream, get_run_base
+from llm_clients import ClientPool, get_client_pool
+from rate_limiter import AdaptiveRateLimiter
+
+
+def get_batch_workers():
+    """Wie viele Batch-Interviews gleichzeitig laufen (Standard: 4)"""
+    return max(1, int(os.getenv('BATCH_WORKERS', 4)))
+
+
+def expand_config_paths(patterns: List[str]) -> List[str]:
+    """
+    Löst Konfigurations-Angaben zu einer Liste von Dateien auf
+    
+    Args:
+        patterns: Dateien, Verzeichnisse (alle *.json darin) oder Glob-Muster
+        
+    Returns:
+        Liste von Dateipfaden in stabiler Reihenfolge, ohne Duplikate
+    """
+    config_files = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = sorted(glob.glob(os.path.join(pattern, "*.json")))
+        elif glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern))
+        else:
+            matches = [pattern]
+        for match in matches:
+            if match not in config_files:
+                config_files.append(match)
+    return config_files
 
 
 class BatchInterviewRunner:
@@ -33,15 +82,23 @@ class BatchInterviewRunner:
     Klasse für die Durchführung von Batch-Interviews
     """
     
-    def __init__(self, output_dir: str = "batch_results", log_file: str = "batch_interview.log"):
+    def __init__(self, output_dir: str = "batch_results", log_file: str = "batch_interview.log",
+                 response_cache=None, provider: Optional[str] = None, metrics_file: Optional[str] = None):
         """
         Initialisiert den Batch Runner
         
         Args:
             output_dir: Verzeichnis für die Ergebnisse
             log_file: Name der Log-Datei (wird im output_dir gespeichert)
+            response_cache: Optionaler ResponseCache für wiederholte Fragebögen
+            provider: LLM-Anbieter "openrouter" oder "fake" (Standard: LLM_PROVIDER)
+            metrics_file: Prometheus-Textdatei, die nach jedem Lauf geschrieben wird
+                          (Standard: METRICS_FILE, sonst kein Export)
         """
         self.output_dir = Path(output_dir)
+        self.response_cache = response_cache
+        self.provider = provider
+        self.metrics_file = metrics_file or get_metrics_file()
         
         # Erstelle Output-Verzeichnis falls es nicht existiert
         self.output_dir.mkdir(exist_ok=True)
@@ -99,89 +156,154 @@ class BatchInterviewRunner:
             self.logger.error(f"Fehler beim Laden der Konfiguration: {e}")
             raise
     
-    def create_temp_questions_file(self, questions: List[str]) -> str:
+    def create_session(self, model: Optional[str] = None, client_pool=None,
+                       max_concurrency: Optional[int] = None) -> InterviewSession:
         """
-        Erstellt eine temporäre Fragen-Datei für das Interview
+        Erstellt eine InterviewSession für Batch-Läufe (API-Schlüssel wird einmal geprüft)
         
         Args:
-            questions: Liste der Fragen
+            model: Optionales Modell (Standard: DEFAULT_MODEL)
+            client_pool: ClientPool, den sich parallele Läufe teilen
+            max_concurrency: Gleichzeitig befragte Personas pro Lauf
             
         Returns:
-            Pfad zur temporären Datei
+            InterviewSession, deren Personas über mehrere Läufe wiederverwendet werden
         """
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        temp_file = self.output_dir / f"temp_questions_{timestamp}.json"
-        
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            json.dump(questions, f, indent=2, ensure_ascii=False)
-        
-        return str(temp_file)
+        return InterviewSession(provider=self.provider, model_name=model, client_pool=client_pool,
+                                response_cache=self.response_cache, max_concurrency=max_concurrency)
     
-    def run_batch_interview(self, config: Dict, agent: Optional[str] = None) -> bool:
+    def run_batch_interview(self, config: Dict, agent: Optional[str] = None,
+                            resume: Optional[str] = None) -> bool:
         """
         Führt ein Batch-Interview durch
         
         Args:
             config: Batch-Konfiguration
             agent: Optionaler spezifischer Agent (None für alle)
+            resume: Optionaler früherer Lauf, der fortgesetzt wird (Basis-Pfad oder Datei)
             
         Returns:
             True wenn erfolgreich, False bei Fehler
         """
+        return self.run_batch_job(config, agent=agent, resume=resume)["success"]
+    
+    def run_batch_job(self, config: Dict, agent: Optional[str] = None,
+                      session: Optional[InterviewSession] = None, output_file: Optional[str] = None,
+                      resume: Optional[str] = None) -> Dict:
+        """
+        Führt ein Batch-Interview durch und beschreibt das Ergebnis für das Manifest
+        
+        Die Fragen gehen direkt aus der Konfiguration an die Sitzung - ohne
+        temporäre Fragen-Datei.
+        
+        Args:
+            config: Batch-Konfiguration
+            agent: Optionaler spezifischer Agent (None für alle)
+            session: Wiederverwendete InterviewSession (Standard: neue Sitzung mit DEFAULT_MODEL)
+            output_file: Ausgabe-Basis ohne Endung (Standard: batch_<agent>_<Zeitstempel>)
+            resume: Optionaler früherer Lauf, der fortgesetzt wird (Basis-Pfad oder Datei)
+            
+        Returns:
+            Dictionary mit Erfolg, Ausgabedateien, Antwort-Zählern, Messwerten und Dauer
+        """
+        start_time = time.perf_counter()
+        job = {"agent": agent or "all", "model": session.model_name if session else None, "success": False}
         try:
-            # Erstelle temporäre Fragen-Datei
-            temp_questions_file = self.create_temp_questions_file(config['questions'])
+            if session is None:
+                session = self.create_session()
+                job["model"] = session.model_name
             
-            # Bestimme Output-Dateinamen
+            # Bestimme Output-Dateinamen (beim Fortsetzen: der frühere Lauf)
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            if agent:
-                output_base = f"batch_{agent}_{timestamp}"
-            else:
-                output_base = f"batch_all_{timestamp}"
-            
-            output_file = str(self.output_dir / output_base)
+            if resume:
+                output_file = get_run_base(resume)
+            elif output_file is None and agent:
+                output_file = str(self.output_dir / f"batch_{agent}_{timestamp}")
+            elif output_file is None:
+                output_file = str(self.output_dir / f"batch_all_{timestamp}")
             
             # Log Interview-Start
+            if resume:
+                self.logger.info(f"Setze Batch-Interview fort: {output_file}")
             if agent:
-                self.logger.info(f"Starte Batch-Interview für Agent: {agent}")
+                self.logger.info(f"Starte Batch-Interview für Agent: {agent} (Modell: {session.model_name})")
             else:
-                self.logger.info("Starte Batch-Interview für alle Agenten")
+                self.logger.info(f"Starte Batch-Interview für alle Agenten (Modell: {session.model_name})")
             
             # Führe das Interview durch
-            if agent:
-                results = run_interview(agent, temp_questions_file, format="md", output_file=output_file)
-            else:
-                results = run_interview(temp_questions_file, format="md", output_file=output_file)
-            
-            # Lösche temporäre Datei
-            os.unlink(temp_questions_file)
-            
-            if results:
-                self.logger.info(f"Batch-Interview erfolgreich abgeschlossen: {output_file}.md")
-                
-                # Speichere auch JSON-Version für weitere Verarbeitung
-                json_output = output_file + "_data.json"
-                with open(json_output, 'w', encoding='utf-8') as f:
-                    json.dump(results, f, indent=2, ensure_ascii=False)
-                
-                self.logger.info(f"Interview-Daten gespeichert: {json_output}")
-                return True
-            else:
-                self.logger.error("Interview fehlgeschlagen - keine Ergebnisse erhalten")
-                return False
-                
+            with trace_span("batch_job", "batch", agent=job["agent"], model=session.model_name,
+                            output=output_file):
+                results = session.run(config['questions'], personas=[agent] if agent else None,
+                                      output_file=output_file, output_format="md",
+                                      keep_results=False, resume=resume)
+            
+            self.logger.info(f"Batch-Interview erfolgreich abgeschlossen: {output_file}.md")
+            
+            # Speichere auch JSON-Version für weitere Verarbeitung - direkt aus
+            # dem Ergebnis-Stream, ohne die Antworten im Speicher zu halten
+            json_output = output_file + "_data.json"
+            with trace_span("write_report", "report", format="json"):
+                write_report_from_stream(results["results_stream"], json_output, "json", results["metrics"])
+            
+            self.logger.info(f"Interview-Daten gespeichert: {json_output}")
+            if results["error_count"]:
+                self.logger.warning(f"{results['error_count']} von {results['response_count']} "
+                                    f"Antworten mit Fehler")
+            run = results["metrics"]["run"]
+            self.logger.info(f"Tokens: {run['prompt_tokens']} Prompt + {run['completion_tokens']} Antwort, "
+                             f"Kosten ${run['cost_usd']:.4f}, Latenz p95 {run['latency_seconds']['p95']}s, "
+                             f"{run['retries']} Wiederholungen")
+            job.update(
+                success=True,
+                outputs={"markdown": output_file + ".md", "data": json_output,
+                         "stream": results["results_stream"]},
+                response_count=results["response_count"],
+                error_count=results["error_count"],
+                metrics=results["metrics"]
+            )
+            
         except Exception as e:
             self.logger.error(f"Fehler beim Batch-Interview: {e}")
-            return False
-    
-    def _simulate_webhook(self, config_file: str, agent: Optional[str], success: bool):
+            job["error"] = str(e)
+        
+        job["duration_seconds"] = round(time.perf_counter() - start_time, 3)
+        return job
+
+    def _log_cache_stats(self):
+        """Protokolliert Treffer des Antwort-Caches (und zugeordnete ähnliche Fragen)"""
+        stats = self.response_cache.get_stats()
+        self.logger.info(f"Antwort-Cache ({stats['mode']}): {stats['hits']} Treffer, "
+                         f"{stats['misses']} Fehlschläge, Trefferquote {stats['hit_rate']:.0%}")
+        if 'semantic_hits' in stats:
+            self.logger.info(f"Ähnliche Fragen (ab {stats['semantic_threshold']}): {stats['semantic_hits']} Treffer, "
+                             f"Trefferquote {stats['semantic_hit_rate']:.0%}")
+            for match in stats['semantic_matches']:
+                self.logger.info(f"  \"{match['question']}\" ≈ \"{match['matched_question']}\" "
+                                 f"({match['similarity']:.2f}, {match['hits']}x)")
+
+    def _write_metrics(self, jobs: List[Dict]):
+        """
+        Schreibt die Messwerte aller erfolgreichen Läufe in die Prometheus-Textdatei
+        
+        Jeder Lauf bekommt die Labels config, agent und model - so bleiben die
+        Reihen einer cron-gesteuerten Matrix über die Zeit vergleichbar.
+        """
+        runs = [({"config": Path(job["config_file"]).stem, "agent": job["agent"], "model": job["model"] or ""},
+                 job["metrics"])
+                for job in jobs if "metrics" in job]
+        write_prometheus_textfile(self.metrics_file, runs)
+        self.logger.info(f"Messwerte (Prometheus) gespeichert: {self.metrics_file}")
+
+    def _simulate_webhook(self, config_file, agent: Optional[str], success: bool,
+                          manifest_file: Optional[str] = None):
         """
         Simuliert das Versenden eines Webhooks nach dem Batch-Lauf
         
         Args:
-            config_file: Verwendete Konfigurationsdatei
+            config_file: Verwendete Konfigurationsdatei (oder Liste bei Matrix-Läufen)
             agent: Verwendeter Agent (None für alle)
             success: Erfolg des Batch-Laufs
+            manifest_file: Optionales Manifest aller Ausgaben
         """
         timestamp = datetime.datetime.now().isoformat()
         
@@ -195,6 +317,8 @@ class BatchInterviewRunner:
             "output_directory": str(self.output_dir),
             "log_file": self.log_file
         }
+        if manifest_file:
+            webhook_payload["manifest"] = manifest_file
         
         # Simuliere Webhook-Versendung durch Logging
         self.logger.info("=" * 40)
@@ -214,13 +338,14 @@ class BatchInterviewRunner:
         self.logger.info("Webhook simulation completed.")
         self.logger.info("=" * 40)
     
-    def run_batch(self, config_file: str, agent: Optional[str] = None) -> bool:
+    def run_batch(self, config_file: str, agent: Optional[str] = None, resume: Optional[str] = None) -> bool:
         """
         Führt einen kompletten Batch-Lauf durch
         
         Args:
             config_file: Pfad zur Konfigurationsdatei
             agent: Optionaler spezifischer Agent
+            resume: Optionaler früherer Lauf - nur fehlende/fehlerhafte Antworten werden neu abgefragt
             
         Returns:
             True wenn erfolgreich, False bei Fehler
@@ -235,7 +360,7 @@ class BatchInterviewRunner:
             
             # Validiere Agent falls angegeben
             if agent:
-                available_agents = ['anna', 'tom', 'julia']
+                available_agents = get_available_agents()
                 if agent.lower() not in available_agents:
                     self.logger.error(f"Unbekannter Agent: {agent}")
                     self.logger.info(f"Verfügbare Agenten: {', '.join(available_agents)}")
@@ -243,7 +368,9 @@ class BatchInterviewRunner:
                 agent = agent.lower()
             
             # Führe Interview durch
-            success = self.run_batch_interview(config, agent)
+            job = self.run_batch_job(config, agent=agent, resume=resume)
+            job["config_file"] = config_file
+            success = job["success"]
             
             # Log Ergebnis
             if success:
@@ -251,6 +378,12 @@ class BatchInterviewRunner:
             else:
                 self.logger.error("Batch-Lauf fehlgeschlagen")
             
+            if self.response_cache is not None:
+                self._log_cache_stats()
+            
+            if self.metrics_file:
+                self._write_metrics([job])
+            
             # Simuliere Webhook-Versendung
             self._simulate_webhook(config_file, agent, success)
             
@@ -260,6 +393,193 @@ class BatchInterviewRunner:
         except Exception as e:
             self.logger.error(f"Kritischer Fehler beim Batch-Lauf: {e}")
             return False
+    
+    def run_matrix(self, config_patterns: List[str], agents: Optional[List[str]] = None,
+                   models: Optional[List[str]] = None, workers: Optional[int] = None,
+                   max_concurrency: Optional[int] = None) -> bool:
+        """
+        Führt alle Kombinationen aus Konfigurationen × Agenten × Modellen parallel aus
+        
+        Alle Läufe teilen sich einen Client-Pool und damit ein gemeinsames Budget
+        gleichzeitiger LLM-Aufrufe (max_concurrency) - ohne für jeden Lauf einen
+        neuen Python-Prozess zu starten.
+        
+        Args:
+            config_patterns: Konfigurationsdateien, Verzeichnisse oder Glob-Muster
+            agents: Agenten, je einer pro Lauf ("all" oder None = alle zusammen)
+            models: Modelle, je eines pro Lauf (None = DEFAULT_MODEL)
+            workers: Gleichzeitig laufende Interviews (Standard: BATCH_WORKERS)
+            max_concurrency: Gemeinsames Budget gleichzeitiger LLM-Aufrufe
+                             (Standard: RATE_LIMIT_MAX_CONCURRENCY)
+            
+        Returns:
+            True wenn alle Läufe erfolgreich waren
+        """
+        try:
+            self.logger.info("="*60)
+            self.logger.info("Batch Interview Runner gestartet (Matrix)")
+            self.logger.info("="*60)
+            
+            config_files = expand_config_paths(config_patterns)
+            if not config_files:
+                self.logger.error(f"Keine Konfigurationsdateien gefunden: {', '.join(config_patterns)}")
+                return False
+            configs = {config_file: self.load_batch_config(config_file) for config_file in config_files}
+            
+            agent_list = self._resolve_agents(agents)
+            if agent_list is None:
+                return False
+            
+            combinations = list(itertools.product(config_files, agent_list, models or [None]))
+            workers = min(workers or get_batch_workers(), len(combinations))
+            client_pool = ClientPool(rate_limiter=AdaptiveRateLimiter(max_concurrency=max_concurrency,
+                                                                      initial_concurrency=max_concurrency))
+            budget = client_pool.rate_limiter.max_concurrency
+            self.logger.info(f"{len(combinations)} Läufe ({len(config_files)} Konfigurationen × "
+                             f"{len(agent_list)} Agenten × {len(models or [None])} Modelle), "
+                             f"{workers} parallel, Budget {budget} gleichzeitige LLM-Aufrufe")
+            
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            
+            # Eine Sitzung pro Modell - Personas werden über Konfigurationen hinweg wiederverwendet
+            sessions = {model: self.create_session(model, client_pool, budget) for model in models or [None]}
+            
+            def run_combination(combination):
+                config_file, agent, model = combination
+                output_file = self._get_matrix_output_file(config_file, agent, model, timestamp,
+                                                           len(config_files) > 1)
+                job = self.run_batch_job(configs[config_file], agent=agent, session=sessions[model],
+                                         output_file=output_file)
+                job["config_file"] = config_file
+                return job
+            
+            try:
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch-job") as executor:
+                    jobs = list(executor.map(run_combination, combinations))
+            finally:
+                client_pool.close()
+            
+            success = all(job["success"] for job in jobs)
+            manifest_file = self._write_manifest(timestamp, config_files, jobs, workers, budget)
+            
+            succeeded = sum(job["success"] for job in jobs)
+            self.logger.info(f"Matrix abgeschlossen: {succeeded} von {len(jobs)} Läufen erfolgreich")
+            self.logger.info(f"Manifest gespeichert: {manifest_file}")
+            
+            if self.response_cache is not None:
+                self._log_cache_stats()
+            
+            if self.metrics_file:
+                self._write_metrics(jobs)
+            
+            self._simulate_webhook(config_files, None, success, manifest_file)
+            
+            self.logger.info("="*60)
+            return success
+            
+        except Exception as e:
+            self.logger.error(f"Kritischer Fehler beim Batch-Lauf: {e}")
+            return False
+
+    def _resolve_agents(self, agents: Optional[List[str]]) -> Optional[List[Optional[str]]]:
+        """
+        Prüft die Agenten - "all" (oder keine Angabe) steht für einen Lauf mit allen Agenten
+
+        Returns:
+            Agenten in Kleinschreibung (None = alle) oder None bei einem unbekannten Agenten
+        """
+        available_agents = get_available_agents()
+        agent_list = []
+        for agent in agents or [None]:
+            if agent is None or agent.lower() == "all":
+                agent_list.append(None)
+            elif agent.lower() in available_agents:
+                agent_list.append(agent.lower())
+            else:
+                self.logger.error(f"Unbekannter Agent: {agent}")
+                self.logger.info(f"Verfügbare Agenten: {', '.join(available_agents)}")
+                return None
+        return agent_list
+
+    def dry_run(self, config_patterns: List[str], agents: Optional[List[str]] = None,
+                models: Optional[List[str]] = None) -> bool:
+        """
+        Prüft einen Aufruf ohne Modell-Aufrufe (--dry-run)
+
+        Konfigurationen, Agenten und API-Schlüssel werden geprüft und die
+        geplanten Läufe protokolliert - es werden keine Personas gebaut und
+        LangChain wird nicht geladen.
+
+        Returns:
+            True wenn alle Läufe so starten könnten
+        """
+        try:
+            config_files = expand_config_paths(config_patterns)
+            if not config_files:
+                self.logger.error(f"Keine Konfigurationsdateien gefunden: {', '.join(config_patterns)}")
+                return False
+            configs = {config_file: self.load_batch_config(config_file) for config_file in config_files}
+            agent_list = self._resolve_agents(agents)
+            if agent_list is None:
+                return False
+            session = self.create_session()
+
+            persona_count = len(get_available_agents())
+            total_calls = 0
+            for config_file, agent, model in itertools.product(config_files, agent_list, models or [None]):
+                calls = len(configs[config_file]['questions']) * (1 if agent else persona_count)
+                total_calls += calls
+                self.logger.info(f"Geplant: {config_file} | Agent {agent or 'all'} | "
+                                 f"Modell {model or session.model_name} | {calls} Modell-Aufrufe")
+            self.logger.info(f"Testlauf (--dry-run) erfolgreich: {total_calls} Modell-Aufrufe geplant, "
+                             f"keine durchgeführt")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Testlauf (--dry-run) fehlgeschlagen: {e}")
+            return False
+    
+    def _get_matrix_output_file(self, config_file: str, agent: Optional[str], model: Optional[str],
+                                timestamp: str, include_config: bool) -> str:
+        """Eindeutige Ausgabe-Basis eines Matrix-Laufs: batch_<agent>[_<config>][_<modell>]_<Zeitstempel>"""
+        parts = ["batch", agent or "all"]
+        if include_config:
+            parts.append(Path(config_file).stem)
+        if model:
+            parts.append(re.sub(r"[^A-Za-z0-9.-]+", "-", model).strip("-"))
+        parts.append(timestamp)
+        return str(self.output_dir / "_".join(parts))
+    
+    def get_trace_file(self) -> str:
+        """Standard-Pfad des Traces eines Aufrufs: <output_dir>/batch_trace_<Zeitstempel>.json"""
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        return str(self.output_dir / f"batch_trace_{timestamp}.json")
+    
+    def get_profile_base(self) -> str:
+        """Standard-Basis des Profils eines Aufrufs: <output_dir>/batch_profile_<Zeitstempel>"""
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        return str(self.output_dir / f"batch_profile_{timestamp}")
+    
+    def _write_manifest(self, timestamp: str, config_files: List[str], jobs: List[Dict],
+                        workers: int, budget: int) -> str:
+        """
+        Schreibt das Manifest aller Läufe einer Matrix
+        
+        Returns:
+            Pfad der Manifest-Datei
+        """
+        manifest_file = str(self.output_dir / f"batch_manifest_{timestamp}.json")
+        manifest = {
+            "timestamp": datetime.datetime.now().isoformat(),
+            "config_files": config_files,
+            "workers": workers,
+            "max_concurrency": budget,
+            "success": all(job["success"] for job in jobs),
+            "jobs": jobs
+        }
+        with open(manifest_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        return manifest_file
 
 
 def main():
@@ -273,6 +593,14 @@ Beispiele:
   python run_batch.py custom_batch.json                  # Verwendet benutzerdefinierte Datei
   python run_batch.py --agent anna                       # Nur Agent Anna
   python run_batch.py --output-dir ./results --log-file batch.log
+  python run_batch.py --provider fake                    # Offline-Testlauf ohne API-Schlüssel
+  python run_batch.py --resume batch_results/batch_all_20250121_140530   # Nur Fehlendes nachholen
+  python run_batch.py studies/ --agents anna tom julia --workers 3    # Alle Konfigurationen im Ordner
+  python run_batch.py "studies/*.json" --models mistralai/mistral-small-24b-instruct-2501:free other/model
+  python run_batch.py --metrics-file /var/lib/node_exporter/textfile/interviews.prom
+  python run_batch.py studies/ --agents anna tom --trace      # Zeitstrahl für ui.perfetto.dev
+  python run_batch.py --provider fake --profile --profile-memory   # CPU-Hotspots ohne Netzwerkzeit
+  python run_batch.py studies/ --agents anna tom --dry-run    # Nur prüfen, keine Modell-Aufrufe
 
 Für cron-Jobs (einfachste Verwendung):
   0 9 * * 1 cd /path/to/project && python run_batch.py
@@ -280,10 +608,10 @@ Für cron-Jobs (einfachste Verwendung):
     )
     
     parser.add_argument(
-        'config_file',
-        nargs='?',
-        default='interview_batch.json',
-        help='Pfad zur Batch-Konfigurationsdatei (Standard: interview_batch.json)'
+        'config_files',
+        nargs='*',
+        default=['interview_batch.json'],
+        help='Batch-Konfigurationsdateien, Verzeichnisse oder Glob-Muster (Standard: interview_batch.json)'
     )
     
     parser.add_argument(
@@ -291,6 +619,38 @@ Für cron-Jobs (einfachste Verwendung):
         help='Spezifischer Agent für das Interview (z.B. anna, tom, julia)'
     )
     
+    parser.add_argument(
+        '--agents',
+        nargs='+',
+        help='Mehrere Agenten, je ein Lauf pro Agent ("all" = alle zusammen in einem Lauf)'
+    )
+    
+    parser.add_argument(
+        '--models',
+        nargs='+',
+        help='Mehrere Modelle, je ein Lauf pro Modell (Standard: DEFAULT_MODEL)'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Gleichzeitig laufende Interviews bei mehreren Läufen (Standard: BATCH_WORKERS oder 4)'
+    )
+    
+    parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        default=None,
+        help='Gemeinsames Budget gleichzeitiger LLM-Aufrufe aller Läufe (Standard: RATE_LIMIT_MAX_CONCURRENCY)'
+    )
+    
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Nur prüfen (Konfiguration, Agenten, API-Schlüssel) und die geplanten Läufe zeigen'
+    )
+
     parser.add_argument(
         '--output-dir',
         default='batch_results',
@@ -303,16 +663,52 @@ Für cron-Jobs (einfachste Verwendung):
         help='Log-Datei Name (wird im output-dir gespeichert, Standard: batch_interview.log)'
     )
     
+    add_resume_argument(parser)
+    add_provider_argument(parser)
+    add_cache_arguments(parser)
+    add_metrics_argument(parser)
+    add_trace_argument(parser)
+    add_profile_arguments(parser)
+    
     args = parser.parse_args()
     
     # Erstelle Batch Runner
     runner = BatchInterviewRunner(
         output_dir=args.output_dir,
-        log_file=args.log_file
+        log_file=args.log_file,
+        response_cache=open_cache_from_arguments(args),
+        provider=args.provider,
+        metrics_file=args.metrics_file
     )
     
-    # Führe Batch-Lauf durch
-    success = runner.run_batch(args.config_file, args.agent)
+    # Ein einzelner Lauf wie bisher, sonst die Matrix aus Konfigurationen × Agenten × Modellen
+    agents = args.agents or ([args.agent] if args.agent else None)
+    config_files = expand_config_paths(args.config_files)
+    is_matrix = len(config_files) != 1 or (agents and len(agents) > 1) or args.models
+    
+    if args.resume and is_matrix:
+        parser.error("--resume setzt genau einen Lauf fort (eine Konfiguration, ein Agent, ohne --models)")
+    
+    if args.dry_run:
+        sys.exit(0 if runner.dry_run(args.config_files, agents, args.models) else 1)
+
+    # Ein Trace pro Aufruf - bei einer Matrix mit einer Spur pro Batch-Job-Thread
+    trace_file = runner.get_trace_file() if args.trace is True else args.trace
+    profile_base = runner.get_profile_base() if args.profile is True else args.profile
+    with profiling(profile_base, args.profile_memory) as profiler, tracing(trace_file):
+        if is_matrix:
+            success = runner.run_matrix(args.config_files, agents, args.models,
+                                        workers=args.workers, max_concurrency=args.max_concurrency)
+        else:
+            agent = agents[0] if agents and agents[0].lower() != "all" else None
+            success = runner.run_batch(config_files[0], agent, args.resume)
+        if profiler is not None:
+            # Event-Loop-Thread des Client-Pools beenden, damit sein Profil mitzählt
+            get_client_pool().close()
+    if trace_file:
+        runner.logger.info(f"Trace gespeichert: {trace_file}")
+    if profiler is not None:
+        print_profile_summary(profiler)
     
     # Exit mit entsprechendem Code für Cron-Jobs
     sys.exit(0 if success else 1)
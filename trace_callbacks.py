@@ -0,0 +1,88 @@
+"""
+LangChain-Callback für tracing.py
+
+Eigenes Modul, damit tracing.py ohne LangChain importierbar bleibt - der
+Callback wird erst gebraucht, wenn ein Tracer aktiv ist und ein Modell
+aufgerufen wird.
+"""
+
+import threading
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+
+class TraceCallbackHandler(BaseCallbackHandler):
+    """
+    LangChain-Callback: ein Span pro Chain-Schritt und Modell-Aufruf
+
+    Der Prompt-Schritt (ChatPromptTemplate) zeigt die Formatierung, der
+    Modell-Span die HTTP-Rundreise; "first_token" markiert das erste Token.
+    """
+
+    # Direkt im aufrufenden Thread/Task ausführen - sonst verschiebt LangChain
+    # synchrone Handler im async-Motor in einen Executor und verfälscht die Zeiten
+    run_inline = True
+
+    def __init__(self, tracer):
+        """
+        Args:
+            tracer: Der Tracer (tracing.Tracer), in den die Spans geschrieben werden
+        """
+        self.tracer = tracer
+        self._runs = {}
+        self._lock = threading.Lock()
+
+    def _start(self, run_id, parent_run_id, name: str, category: str, **args):
+        # Kind-Schritte laufen im async-Motor in eigenen Hilfs-Tasks - sie
+        # bleiben auf der Spur ihrer Chain, damit der Flame-Chart verschachtelt bleibt
+        with self._lock:
+            parent = self._runs.get(parent_run_id)
+            lane = parent[3] if parent is not None else None
+        if lane is None:
+            lane = self.tracer.get_lane()
+        with self._lock:
+            self._runs[run_id] = (name, category, self.tracer.now(), lane, args, [False])
+
+    def _end(self, run_id, error=None):
+        with self._lock:
+            run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+        name, category, start, lane, args, _ = run
+        if error is not None:
+            args = dict(args, error=type(error).__name__)
+        self.tracer.add_span(name, category, start, lane, args)
+
+    @staticmethod
+    def _get_name(serialized, kwargs, default):
+        return kwargs.get("name") or (serialized or {}).get("name") or default
+
+    def on_chain_start(self, serialized, inputs, *, run_id, parent_run_id=None, **kwargs):
+        self._start(run_id, parent_run_id, self._get_name(serialized, kwargs, "chain"), "langchain")
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs):
+        self._end(run_id)
+
+    def on_chain_error(self, error, *, run_id, **kwargs):
+        self._end(run_id, error)
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, parent_run_id=None, **kwargs):
+        model = (kwargs.get("metadata") or {}).get("ls_model_name")
+        self._start(run_id, parent_run_id, self._get_name(serialized, kwargs, "chat_model"), "llm", model=model)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, parent_run_id=None, **kwargs):
+        self._start(run_id, parent_run_id, self._get_name(serialized, kwargs, "llm"), "llm")
+
+    def on_llm_new_token(self, token, *, run_id, **kwargs):
+        with self._lock:
+            run = self._runs.get(run_id)
+            if run is None or run[5][0]:
+                return
+            run[5][0] = True
+        self.tracer.instant("first_token", "llm", lane=run[3])
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        self._end(run_id)
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._end(run_id, error)
@@ -0,0 +1,221 @@
+"""
+Zeitstrahl eines Laufs - verschachtelte Spans als Chrome/Perfetto-Trace
+
+Wenn ein Lauf langsam ist, zeigt der Trace, wohin die Zeit geht: Personas
+bauen, Prompt formatieren (LangChain), HTTP-Rundreise zum Modell, Antworten
+schreiben, Bericht bauen. Spans entstehen an zwei Stellen:
+
+- explizit im Code (trace_span) - InterviewManager, InterviewSession,
+  BatchInterviewRunner, GUI-Jobs
+- über einen LangChain-Callback (trace_callbacks.py) für jede Chain und
+  jeden Modell-Aufruf, inklusive Zeitpunkt des ersten Tokens
+
+Ohne aktiven Tracer ist trace_span ein leerer Kontext - es wird nichts
+gemessen. Die Datei (--trace) lässt sich in chrome://tracing oder
+https://ui.perfetto.dev als Flame-Chart öffnen; jeder Thread und jede
+asyncio-Task (eine Pipeline pro Persona) bekommt eine eigene Spur.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional
+
+_active_tracer = None
+
+
+def get_trace_max_events():
+    """Höchstzahl gespeicherter Ereignisse pro Trace (TRACE_MAX_EVENTS, Standard: 500000)"""
+    return int(os.getenv('TRACE_MAX_EVENTS', 500000))
+
+
+def get_trace_path(output_file: str) -> str:
+    """Pfad des Traces zu einer Ausgabe-Basis: <output_file>.trace.json"""
+    return f"{output_file}.trace.json"
+
+
+class Tracer:
+    """Sammelt Spans (Chrome-Trace-Ereignisse "X") eines Prozesses, thread-sicher"""
+
+    def __init__(self, max_events: Optional[int] = None):
+        """
+        Args:
+            max_events: Höchstzahl gespeicherter Ereignisse (Standard: TRACE_MAX_EVENTS);
+                        weitere werden nur gezählt
+        """
+        self.max_events = max_events or get_trace_max_events()
+        self.dropped_events = 0
+        self._events = []
+        self._lanes = {}
+        self._lock = threading.Lock()
+        self._started_ns = time.perf_counter_ns()
+        self._callback_handler = None
+
+    def now(self) -> float:
+        """Mikrosekunden seit Start des Tracers (Zeitbasis der Chrome-Traces)"""
+        return (time.perf_counter_ns() - self._started_ns) / 1000
+
+    def get_lane(self) -> int:
+        """
+        Spur (tid) des aktuellen Threads bzw. der aktuellen asyncio-Task
+
+        Tasks teilen sich einen Thread, ihre Spans überlappen sich zeitlich -
+        daher bekommt jede Task eine eigene Spur.
+        """
+        thread = threading.current_thread()
+        # Ohne geladenes asyncio kann es keine Task geben - nicht extra importieren
+        asyncio = sys.modules.get("asyncio")
+        try:
+            task = asyncio.current_task() if asyncio is not None else None
+        except RuntimeError:
+            task = None
+        key = (thread.ident, id(task) if task is not None else None)
+        with self._lock:
+            lane = self._lanes.get(key)
+            if lane is None:
+                label = thread.name if task is None else f"{thread.name} / {task.get_name()}"
+                lane = self._lanes[key] = (len(self._lanes) + 1, label)
+        return lane[0]
+
+    def add_event(self, event: Dict):
+        """Hängt ein fertiges Chrome-Trace-Ereignis an"""
+        with self._lock:
+            if len(self._events) >= self.max_events:
+                self.dropped_events += 1
+                return
+            self._events.append(event)
+
+    def add_span(self, name: str, category: str, start: float, lane: int, args: Optional[Dict] = None):
+        """Schließt einen Span ab, der bei `start` (Mikrosekunden, siehe now()) begann"""
+        event = {"name": name, "cat": category, "ph": "X", "ts": round(start, 3),
+                 "dur": round(self.now() - start, 3), "pid": os.getpid(), "tid": lane}
+        if args:
+            event["args"] = args
+        self.add_event(event)
+
+    def instant(self, name: str, category: str = "interview", lane: Optional[int] = None, **args):
+        """Markiert einen Zeitpunkt (z.B. erstes Token)"""
+        event = {"name": name, "cat": category, "ph": "i", "s": "t", "ts": round(self.now(), 3),
+                 "pid": os.getpid(), "tid": lane or self.get_lane()}
+        if args:
+            event["args"] = args
+        self.add_event(event)
+
+    @contextmanager
+    def span(self, name: str, category: str = "interview", **args):
+        """
+        Misst den eingeschlossenen Block als Span
+
+        Args:
+            name: Name im Flame-Chart (z.B. "question")
+            category: Gruppe zum Filtern (z.B. "interview", "batch", "report")
+            **args: Zusatzangaben, erscheinen beim Anklicken des Spans
+        """
+        lane = self.get_lane()
+        start = self.now()
+        try:
+            yield
+        except BaseException as error:
+            args["error"] = type(error).__name__
+            raise
+        finally:
+            self.add_span(name, category, start, lane, args)
+
+    def get_callback_handler(self):
+        """Der LangChain-Callback dieses Tracers (einer pro Tracer, LangChain wird erst hier geladen)"""
+        from trace_callbacks import TraceCallbackHandler
+
+        with self._lock:
+            if self._callback_handler is None:
+                self._callback_handler = TraceCallbackHandler(self)
+            return self._callback_handler
+
+    def get_events(self) -> List[Dict]:
+        """Alle Ereignisse plus Metadaten (Prozess- und Spurnamen)"""
+        pid = os.getpid()
+        with self._lock:
+            events = list(self._events)
+            lanes = list(self._lanes.values())
+        metadata = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "synthetic-interview"}}]
+        metadata += [{"name": "thread_name", "ph": "M", "pid": pid, "tid": lane, "args": {"name": label}}
+                     for lane, label in lanes]
+        return metadata + events
+
+    def write(self, path: str) -> int:
+        """
+        Schreibt den Trace im Chrome-Trace-Format (JSON)
+
+        Returns:
+            Anzahl der geschriebenen Ereignisse
+        """
+        events = self.get_events()
+        trace = {"traceEvents": events, "displayTimeUnit": "ms",
+                 "otherData": {"dropped_events": self.dropped_events}}
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(trace, file, ensure_ascii=False, default=str)
+        return len(events)
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Der aktive Tracer oder None"""
+    return _active_tracer
+
+
+def start_tracing(max_events: Optional[int] = None) -> Tracer:
+    """Aktiviert einen neuen Tracer für den ganzen Prozess"""
+    global _active_tracer
+    _active_tracer = Tracer(max_events)
+    return _active_tracer
+
+
+def stop_tracing() -> Optional[Tracer]:
+    """Deaktiviert den Tracer und gibt ihn zurück"""
+    global _active_tracer
+    tracer, _active_tracer = _active_tracer, None
+    return tracer
+
+
+def trace_span(name: str, category: str = "interview", **args):
+    """
+    Span im aktiven Tracer - ohne Tracer ein leerer Kontext
+
+    Examples:
+        with trace_span("question", question_id=3):
+            ...
+    """
+    tracer = _active_tracer
+    if tracer is None:
+        return nullcontext()
+    return tracer.span(name, category, **args)
+
+
+def get_trace_config() -> Optional[Dict]:
+    """RunnableConfig mit dem Trace-Callback (für chain.stream/astream) oder None"""
+    tracer = _active_tracer
+    if tracer is None:
+        return None
+    return {"callbacks": [tracer.get_callback_handler()]}
+
+
+@contextmanager
+def tracing(path: Optional[str]):
+    """
+    Zeichnet den eingeschlossenen Block auf und schreibt den Trace nach `path`
+
+    Ohne Pfad passiert nichts (für optionale --trace-Optionen).
+
+    Yields:
+        Den Tracer oder None
+    """
+    if not path:
+        yield None
+        return
+    tracer = start_tracing()
+    try:
+        yield tracer
+    finally:
+        stop_tracing()
+        tracer.write(path)